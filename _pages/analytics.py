@@ -4,119 +4,281 @@ Comprehensive analytics and operation performance metrics
 """
 
 import streamlit as st
-from streamlit_folium import st_folium
-import plotly.express as px
+import hashlib
+import streamlit.components.v1 as components
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple
 
 from modules import MapManager, Analytics
-from utils.helpers import format_time_ago
+from _pages.widgets import render_metric_grid, rerun_on_new_packets
 import config
 
 
+@dataclass(frozen=True)
+class AnalyticsBundle:
+    """Analytics results computed once and shared by every section of the page"""
+    stats: Dict[str, Any]
+    rescue_metrics: Dict[str, float]
+    efficiency: Dict[str, Any]
+    time_patterns: Dict[str, Any]
+    density: Dict[str, Any]
+    signal_analysis: Dict[str, Any]
+    priority_distribution: Dict[str, int]
+    coverage: Dict[str, float]
+    summary: Dict[str, Any]
+
+
+@st.cache_data(
+    ttl=2,
+    show_spinner=False,
+    hash_funcs={Analytics: lambda a: (id(a.data_manager), a.data_manager.version)}
+)
+def compute_analytics_bundle(
+    analytics: Analytics,
+    thresholds: Tuple[int, int, int],
+    rescue_centre: Tuple[float, float]
+) -> AnalyticsBundle:
+    """
+    Run every page-level analytics pass once
+    
+    Cached on (data manager, version, thresholds, rescue centre); the short
+    TTL keeps time-based figures such as operation duration fresh.
+    
+    Args:
+        analytics: Analytics instance bound to the session's DataManager
+        thresholds: (rssi_strong, rssi_weak, time_critical)
+        rescue_centre: (lat, lon) of the rescue station
+        
+    Returns:
+        AnalyticsBundle with all computed results
+    """
+    
+    data_manager = analytics.data_manager
+    rssi_strong, rssi_weak, time_critical = thresholds
+    centre_lat, centre_lon = rescue_centre
+    
+    # Compute each part once; the operation summary reuses them
+    stats = data_manager.get_statistics()
+    rescue_metrics = analytics.calculate_rescue_rate()
+    time_patterns = analytics.analyze_time_patterns()
+    density = analytics.analyze_geographic_density()
+    signal_analysis = analytics.analyze_signal_trends()
+    coverage = analytics.get_coverage_area(
+        rescue_centre_lat=centre_lat,
+        rescue_centre_lon=centre_lon
+    )
+    
+    summary = analytics.generate_operation_summary(
+        rssi_strong_threshold=rssi_strong,
+        rssi_weak_threshold=rssi_weak,
+        time_critical_threshold=time_critical,
+        rescue_centre_lat=centre_lat,
+        rescue_centre_lon=centre_lon,
+        basic_stats=stats,
+        rescue_metrics=rescue_metrics,
+        density=density,
+        signal_analysis=signal_analysis,
+        time_analysis=time_patterns,
+        coverage=coverage
+    )
+    
+    return AnalyticsBundle(
+        stats=stats,
+        rescue_metrics=rescue_metrics,
+        efficiency=analytics.calculate_rescue_efficiency(
+            basic_stats=stats,
+            rescue_metrics=rescue_metrics
+        ),
+        time_patterns=time_patterns,
+        density=density,
+        signal_analysis=signal_analysis,
+        priority_distribution=summary['priority_distribution'],
+        coverage=coverage,
+        summary=summary
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_map_manager() -> MapManager:
+    """Process-wide MapManager; it holds no per-session state"""
+    return MapManager()
+
+
+def victims_fingerprint(victims: Dict[int, Dict[str, Any]]) -> bytes:
+    """
+    Hash the victim fields that affect the rendered map
+    
+    Args:
+        victims: Dictionary of victim records
+        
+    Returns:
+        16-byte blake2b digest of (id, status, rssi, lat, lon, update count)
+    """
+    
+    status_codes = {status: code for code, status in enumerate(config.ALL_STATUSES)}
+    rows = np.asarray(
+        [
+            (
+                v['ID'],
+                status_codes.get(v.get('STATUS'), -1),
+                v.get('RSSI', -999),
+                v['LAT'],
+                v['LON'],
+                v.get('UPDATE_COUNT', 0)
+            )
+            for v in victims.values()
+        ],
+        dtype=np.float64
+    )
+    return hashlib.blake2b(rows.tobytes(), digest_size=16).digest()
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_overview_map_html(
+    fingerprint: bytes,
+    center: Tuple[float, float],
+    thresholds: Tuple[int, int, int],
+    minute: int,
+    _map_manager: MapManager,
+    _victims: Dict[int, Dict[str, Any]]
+):
+    """
+    Build the overview map as a standalone HTML document, cached while inputs are unchanged
+    
+    The view never reads map events back, so the page embeds this static HTML
+    instead of going through st_folium's two-way component bridge. Only the
+    hashable arguments form the cache key; ``minute`` rebuilds the map
+    periodically so "last seen" popups and time-based priority stay current.
+    
+    Args:
+        fingerprint: victims_fingerprint() of the victims
+        center: (lat, lon) of the rescue station
+        thresholds: (rssi_strong, rssi_weak, time_critical)
+        minute: Current time bucket in minutes
+        _map_manager: MapManager instance (not hashed)
+        _victims: Dictionary of victim records (not hashed)
+        
+    Returns:
+        Rendered HTML of the folium map
+    """
+    
+    rssi_strong, rssi_weak, time_critical = thresholds
+    
+    overview_map, _ = _map_manager.create_victim_map(
+        victims=_victims,
+        center=list(center),
+        show_rescued=True,
+        show_heatmap=True,
+        show_sectors=True,
+        rssi_strong_threshold=rssi_strong,
+        rssi_weak_threshold=rssi_weak,
+        time_critical_threshold=time_critical
+    )
+    
+    return overview_map.get_root().render()
+
+
 def render_analytics():
     """Render the analytics page"""
     
     # Get instances from session state
     data_manager = st.session_state.data_manager
-    map_manager = MapManager()
-    analytics = Analytics(data_manager)
+    map_manager = get_map_manager()
+    analytics = st.session_state.analytics
+    
+    # Compute shared analytics once for the whole render pass
+    bundle = compute_analytics_bundle(
+        analytics,
+        thresholds=(
+            st.session_state.rssi_strong_threshold,
+            st.session_state.rssi_weak_threshold,
+            st.session_state.time_critical_threshold
+        ),
+        rescue_centre=(
+            st.session_state.get('rescue_centre_lat', 13.022),
+            st.session_state.get('rescue_centre_lon', 77.587)
+        )
+    )
     
     # Page header
     st.title("Analytics & Progress Dashboard")
     st.markdown("Comprehensive operation insights and performance metrics")
     
     # Top-level metrics (always show)
-    render_summary_metrics(data_manager, analytics)
+    render_summary_metrics(bundle)
     
     st.divider()
     
     # Main content sections
-    render_visual_analytics(data_manager, map_manager, analytics)
+    render_visual_analytics(data_manager, map_manager, bundle)
     
     st.divider()
     
-    render_detailed_analytics(analytics)
+    render_detailed_analytics(analytics, bundle)
     
-    # Real-time update: Check if new packet received
-    if st.session_state.get('force_rerun', False):
-        st.session_state.force_rerun = False
-        st.rerun()
+    # Real-time update: packets arriving faster than RERUN_MIN_INTERVAL
+    # are coalesced into one rerun
+    rerun_on_new_packets()
 
 
-def render_summary_metrics(data_manager, analytics):
+def render_summary_metrics(bundle):
     """Render summary metrics bar"""
     
-    stats = data_manager.get_statistics()
-    rescue_metrics = analytics.calculate_rescue_rate()
-    efficiency = analytics.calculate_rescue_efficiency()
-    time_patterns = analytics.analyze_time_patterns()
-    
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric(
-            label="Total Victims",
-            value=stats['total'],
-            help="Total victims detected"
-        )
-    
-    with col2:
-        st.metric(
-            label="Stranded",
-            value=stats['stranded'],
-            delta=-stats['stranded_pct'] if stats['stranded'] > 0 else None,
-            delta_color="normal",
-            help="Victims awaiting rescue"
-        )
-    
-    with col3:
-        st.metric(
-            label="Rescued",
-            value=stats['rescued'],
-            delta=f"{stats['rescued_pct']:.0f}%",
-            delta_color="normal",
-            help="Successfully rescued"
-        )
-    
-    with col4:
-        st.metric(
-            label="Rescue Rate",
-            value=f"{rescue_metrics['rescues_per_hour']:.1f}/hr",
-            help="Victims rescued per hour"
-        )
-    
-    with col5:
-        st.metric(
-            label="Efficiency",
-            value=f"{efficiency['efficiency_percentage']:.1f}%",
-            help=f"Grade: {efficiency['grade']}"
-        )
-    
-    with col6:
-        st.metric(
-            label="Operation Time",
-            value=f"{time_patterns['operation_duration_hours']:.1f}h",
-            help="Time since first detection"
-        )
+    stats = bundle.stats
+    rescue_metrics = bundle.rescue_metrics
+    efficiency = bundle.efficiency
+    time_patterns = bundle.time_patterns
+    
+    render_metric_grid([
+        {'label': "Total Victims", 'value': stats['total'], 'help': "Total victims detected"},
+        {
+            'label': "Stranded",
+            'value': stats['stranded'],
+            'delta': -stats['stranded_pct'] if stats['stranded'] > 0 else None,
+            'help': "Victims awaiting rescue"
+        },
+        {
+            'label': "Rescued",
+            'value': stats['rescued'],
+            'delta': f"{stats['rescued_pct']:.0f}%",
+            'help': "Successfully rescued"
+        },
+        {
+            'label': "Rescue Rate",
+            'value': f"{rescue_metrics['rescues_per_hour']:.1f}/hr",
+            'help': "Victims rescued per hour"
+        },
+        {
+            'label': "Efficiency",
+            'value': f"{efficiency['efficiency_percentage']:.1f}%",
+            'help': f"Grade: {efficiency['grade']}"
+        },
+        {
+            'label': "Operation Time",
+            'value': f"{time_patterns['operation_duration_hours']:.1f}h",
+            'help': "Time since first detection"
+        }
+    ])
 
 
-def render_visual_analytics(data_manager, map_manager, analytics):
+def render_visual_analytics(data_manager, map_manager, bundle):
     """Render visual analytics section"""
     
     # Two-column layout
     map_col, charts_col = st.columns([1.5, 1])
     
     with map_col:
-        render_geographic_overview(data_manager, map_manager, analytics)
+        render_geographic_overview(data_manager, map_manager, bundle)
     
     with charts_col:
-        render_progress_charts(data_manager, analytics)
+        render_progress_charts(bundle)
 
 
-def render_geographic_overview(data_manager, map_manager, analytics):
+def render_geographic_overview(data_manager, map_manager, bundle):
     """Render geographic overview with map"""
     
     st.subheader("Geographic Distribution")
@@ -124,94 +286,118 @@ def render_geographic_overview(data_manager, map_manager, analytics):
     victims = data_manager.get_all_victims()
     
     if victims:
-        # Create comprehensive map with rescue station at center
-        overview_map = map_manager.create_victim_map(
-            victims=victims,
-            center=[
-                st.session_state.get('rescue_centre_lat', 13.022),
-                st.session_state.get('rescue_centre_lon', 77.587)
-            ],
-            show_rescued=True,
-            show_heatmap=True,
-            show_sectors=True,
-            rssi_strong_threshold=st.session_state.rssi_strong_threshold,
-            rssi_weak_threshold=st.session_state.rssi_weak_threshold,
-            time_critical_threshold=st.session_state.time_critical_threshold
+        center = (
+            st.session_state.get('rescue_centre_lat', 13.022),
+            st.session_state.get('rescue_centre_lon', 77.587)
         )
         
-        st_folium(overview_map, width=None, height=500, returned_objects=[])
-        
-        # Geographic statistics
-        density = analytics.analyze_geographic_density()
-        coverage = analytics.get_coverage_area()
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric(
-                "Sectors",
-                density['total_sectors'],
-                help="Number of geographic sectors with victims"
+        deck = None
+        if len(victims) >= config.LARGE_MAP_VICTIM_THRESHOLD:
+            # Too many markers for folium - draw them with WebGL instead
+            deck = map_manager.create_deck_map(
+                victims=victims,
+                center=list(center),
+                show_rescued=True,
+                show_heatmap=True
             )
         
-        with col2:
-            st.metric(
-                "Coverage Area",
-                f"{coverage['area_km2']:.2f} km²",
-                help="Total operational area covered"
+        if deck is not None:
+            st.pydeck_chart(deck, use_container_width=True)
+        else:
+            # Create comprehensive map with rescue station at center (cached on inputs)
+            overview_html = build_overview_map_html(
+                victims_fingerprint(victims),
+                center=center,
+                thresholds=(
+                    st.session_state.rssi_strong_threshold,
+                    st.session_state.rssi_weak_threshold,
+                    st.session_state.time_critical_threshold
+                ),
+                minute=int(time.time() // 60),
+                _map_manager=map_manager,
+                _victims=victims
             )
+            
+            components.html(overview_html, height=500, scrolling=False)
         
-        with col3:
-            st.metric(
-                "Max Density",
-                density['highest_density_count'],
-                help="Maximum victims in single sector"
-            )
+        # Geographic statistics
+        density = bundle.density
+        coverage = bundle.coverage
+        
+        render_metric_grid([
+            {
+                'label': "Sectors",
+                'value': density['total_sectors'],
+                'help': "Number of geographic sectors with victims"
+            },
+            {
+                'label': "Coverage Area",
+                'value': f"{coverage['area_km2']:.2f} km²",
+                'help': "Total operational area covered"
+            },
+            {
+                'label': "Max Density",
+                'value': density['highest_density_count'],
+                'help': "Maximum victims in single sector"
+            }
+        ])
     
     else:
         st.info("No geographic data available yet")
 
 
-def render_progress_charts(data_manager, analytics):
+def render_progress_charts(bundle):
     """Render progress and status charts"""
     
     st.subheader("Progress Analytics")
     
-    stats = data_manager.get_statistics()
+    stats = bundle.stats
     
     if stats['total'] > 0:
         # Status Distribution Pie Chart
         render_status_pie_chart(stats)
         
-        st.markdown("---")
-        
         # Signal Strength Analysis
-        render_signal_analysis(analytics)
-        
-        st.markdown("---")
+        render_signal_analysis(bundle.signal_analysis)
         
         # Priority Distribution
-        render_priority_distribution(analytics)
+        render_priority_distribution(bundle.priority_distribution)
     
     else:
         st.info("Waiting for data to generate charts...")
 
 
-def render_status_pie_chart(stats):
-    """Render status distribution pie chart"""
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_status_pie_figure(counts: Tuple[int, int, int], percentages: Tuple[float, float, float]) -> go.Figure:
+    """
+    Build the status distribution pie chart
+    
+    Args:
+        counts: (stranded, enroute, rescued)
+        percentages: Matching percentages from get_statistics()
+        
+    Returns:
+        Plotly figure
+    """
     
-    st.markdown("**Status Distribution**")
+    labels = ['Stranded', 'En-Route', 'Rescued']
+    
+    # Slice labels use the percentages get_statistics() already computed
+    text = [f"{label}<br>{pct:.1f}%" for label, pct in zip(labels, percentages)]
     
+    # ndarray trace data is sent to Plotly.js as a base64 typed array; counts are
+    # bounded by MAX_VICTIM_ID (9999) so int16 is enough
     fig = go.Figure(data=[go.Pie(
-        labels=['Stranded', 'En-Route', 'Rescued'],
-        values=[stats['stranded'], stats['enroute'], stats['rescued']],
+        labels=labels,
+        values=np.asarray(counts, dtype=np.int16),
+        text=text,
         marker=dict(colors=[
             config.STATUS_COLORS[config.STATUS_STRANDED],
             config.STATUS_COLORS[config.STATUS_EN_ROUTE],
             config.STATUS_COLORS[config.STATUS_RESCUED]
         ]),
         hole=0.4,
-        textinfo='label+percent',
+        textinfo='text',
         textfont=dict(size=12),
         hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
     )])
@@ -229,35 +415,46 @@ def render_status_pie_chart(stats):
         )
     )
     
+    return fig
+
+
+def render_status_pie_chart(stats):
+    """Render status distribution pie chart"""
+    
+    st.markdown("**Status Distribution**")
+    
+    fig = build_status_pie_figure(
+        (stats['stranded'], stats['enroute'], stats['rescued']),
+        (stats['stranded_pct'], stats['enroute_pct'], stats['rescued_pct'])
+    )
+    
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_signal_analysis(analytics):
-    """Render signal strength analysis"""
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_signal_bar_figure(counts: Tuple[int, int, int]) -> go.Figure:
+    """
+    Build the signal strength distribution bar chart
     
-    st.markdown("**Signal Strength Distribution**")
+    Args:
+        counts: (strong, medium, weak) victim counts
+        
+    Returns:
+        Plotly figure
+    """
     
-    signal_data = analytics.analyze_signal_trends()
+    counts = np.asarray(counts, dtype=np.int16)
     
-    # Bar chart
     fig = go.Figure(data=[
         go.Bar(
             x=['Strong', 'Medium', 'Weak'],
-            y=[
-                signal_data['strong_signals'],
-                signal_data['medium_signals'],
-                signal_data['weak_signals']
-            ],
+            y=counts,
             marker=dict(color=[
                 config.SIGNAL_COLORS['strong'],
                 config.SIGNAL_COLORS['medium'],
                 config.SIGNAL_COLORS['weak']
             ]),
-            text=[
-                signal_data['strong_signals'],
-                signal_data['medium_signals'],
-                signal_data['weak_signals']
-            ],
+            text=counts,
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>Count: %{y}<extra></extra>'
         )
@@ -271,149 +468,126 @@ def render_signal_analysis(analytics):
         showlegend=False
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Average RSSI
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric(
-            "Avg RSSI",
-            f"{signal_data['average_rssi']:.1f} dBm"
-        )
-    with col2:
-        st.metric(
-            "Median RSSI",
-            f"{signal_data['median_rssi']:.1f} dBm"
-        )
+    return fig
 
 
-def render_priority_distribution(analytics):
-    """Render priority distribution"""
-    
-    st.markdown("**Priority Levels**")
+def render_signal_analysis(signal_data):
+    """Render signal strength analysis"""
     
-    priority_dist = analytics.calculate_priority_distribution(
-        rssi_strong_threshold=st.session_state.rssi_strong_threshold,
-        rssi_weak_threshold=st.session_state.rssi_weak_threshold,
-        time_critical_threshold=st.session_state.time_critical_threshold
-    )
+    st.markdown("---\n\n**Signal Strength Distribution**")
     
-    col1, col2, col3 = st.columns(3)
+    fig = build_signal_bar_figure((
+        signal_data['strong_signals'],
+        signal_data['medium_signals'],
+        signal_data['weak_signals']
+    ))
     
-    with col1:
-        st.metric(
-            "High",
-            priority_dist['high'],
-            help="Requires immediate attention"
-        )
+    st.plotly_chart(fig, use_container_width=True)
     
-    with col2:
-        st.metric(
-            "Medium",
-            priority_dist['medium'],
-            help="Standard priority"
-        )
+    # Average RSSI
+    render_metric_grid([
+        {'label': "Avg RSSI", 'value': f"{signal_data['average_rssi']:.1f} dBm"},
+        {'label': "Median RSSI", 'value': f"{signal_data['median_rssi']:.1f} dBm"}
+    ])
+
+
+def render_priority_distribution(priority_dist):
+    """Render priority distribution"""
     
-    with col3:
-        st.metric(
-            "Low",
-            priority_dist['low'],
-            help="Stable condition"
-        )
+    render_metric_grid([
+        {'label': "High", 'value': priority_dist['high'], 'help': "Requires immediate attention"},
+        {'label': "Medium", 'value': priority_dist['medium'], 'help': "Standard priority"},
+        {'label': "Low", 'value': priority_dist['low'], 'help': "Stable condition"}
+    ], header="<hr><p><strong>Priority Levels</strong></p>")
 
 
-def render_detailed_analytics(analytics):
+def render_detailed_analytics(analytics, bundle):
     """Render detailed analytics sections"""
     
     st.subheader("Detailed Analytics")
     
-    # Create tabs for different analysis views
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "Rescue Performance",
-        "Sector Analysis",
-        "Critical Cases",
-        "Operation Summary"
-    ])
-    
-    with tab1:
-        render_rescue_performance(analytics)
+    # Radio instead of st.tabs: tabs execute every body on each rerun,
+    # this only renders the view that is actually shown
+    view = st.radio(
+        "Analytics view",
+        ["Rescue Performance", "Sector Analysis", "Critical Cases", "Operation Summary"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="analytics_view"
+    )
     
-    with tab2:
+    if view == "Rescue Performance":
+        render_rescue_performance(bundle)
+    elif view == "Sector Analysis":
         render_sector_analysis(analytics)
-    
-    with tab3:
+    elif view == "Critical Cases":
         render_critical_cases(analytics)
+    else:
+        render_operation_summary(bundle.summary)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_efficiency_gauge_figure(efficiency_percentage: float) -> go.Figure:
+    """
+    Build the efficiency score gauge
     
-    with tab4:
-        render_operation_summary(analytics)
+    Args:
+        efficiency_percentage: Efficiency score (0-100)
+        
+    Returns:
+        Plotly figure
+    """
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=efficiency_percentage,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Efficiency Score"},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': config.STATUS_COLORS[config.STATUS_RESCUED]},
+            'steps': [
+                {'range': [0, 40], 'color': "#ffcccc"},
+                {'range': [40, 60], 'color': "#fff4cc"},
+                {'range': [60, 80], 'color': "#ccffcc"},
+                {'range': [80, 100], 'color': "#ccffee"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    
+    fig.update_layout(height=250, margin=dict(l=10, r=10, t=50, b=10))
+    
+    return fig
 
 
-def render_rescue_performance(analytics):
+def render_rescue_performance(bundle):
     """Render rescue performance metrics"""
     
-    rescue_metrics = analytics.calculate_rescue_rate()
-    efficiency = analytics.calculate_rescue_efficiency()
+    rescue_metrics = bundle.rescue_metrics
+    efficiency = bundle.efficiency
     
     if rescue_metrics['total_rescued'] > 0:
         # Performance metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Total Rescued",
-                rescue_metrics['total_rescued']
-            )
-        
-        with col2:
-            st.metric(
-                "Avg Rescue Time",
-                f"{rescue_metrics['average_rescue_time_minutes']:.1f} min"
-            )
-        
-        with col3:
-            st.metric(
-                "Fastest Rescue",
-                f"{rescue_metrics['fastest_rescue_minutes']:.1f} min"
-            )
-        
-        with col4:
-            st.metric(
-                "Slowest Rescue",
-                f"{rescue_metrics['slowest_rescue_minutes']:.1f} min"
-            )
-        
-        st.markdown("---")
+        render_metric_grid([
+            {'label': "Total Rescued", 'value': rescue_metrics['total_rescued']},
+            {'label': "Avg Rescue Time", 'value': f"{rescue_metrics['average_rescue_time_minutes']:.1f} min"},
+            {'label': "Fastest Rescue", 'value': f"{rescue_metrics['fastest_rescue_minutes']:.1f} min"},
+            {'label': "Slowest Rescue", 'value': f"{rescue_metrics['slowest_rescue_minutes']:.1f} min"}
+        ])
         
         # Efficiency assessment
-        st.markdown("### Efficiency Assessment")
+        st.markdown("---\n\n### Efficiency Assessment")
         
         col1, col2 = st.columns([1, 2])
         
         with col1:
             # Gauge chart for efficiency
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=efficiency['efficiency_percentage'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Efficiency Score"},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': config.STATUS_COLORS[config.STATUS_RESCUED]},
-                    'steps': [
-                        {'range': [0, 40], 'color': "#ffcccc"},
-                        {'range': [40, 60], 'color': "#fff4cc"},
-                        {'range': [60, 80], 'color': "#ccffcc"},
-                        {'range': [80, 100], 'color': "#ccffee"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            
-            fig.update_layout(height=250, margin=dict(l=10, r=10, t=50, b=10))
+            fig = build_efficiency_gauge_figure(efficiency['efficiency_percentage'])
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -434,62 +608,80 @@ def render_rescue_performance(analytics):
         st.info("No rescue data available yet")
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_sector_bar_figure(sector_ids: Tuple[str, ...], stranded_counts: Tuple[int, ...]) -> go.Figure:
+    """
+    Build the top-sectors-by-stranded-count bar chart
+    
+    Args:
+        sector_ids: Sector IDs in display order
+        stranded_counts: Matching stranded counts
+        
+    Returns:
+        Plotly figure
+    """
+    
+    stranded = np.asarray(stranded_counts, dtype=np.int16)
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=np.asarray(sector_ids, dtype=object),
+            y=stranded,
+            marker=dict(
+                color=stranded,
+                colorscale='Reds',
+                showscale=False
+            ),
+            text=stranded,
+            textposition='auto',
+            hovertemplate='<b>Sector %{x}</b><br>Stranded: %{y}<extra></extra>'
+        )
+    ])
+    
+    fig.update_layout(
+        title="Top 5 Sectors by Stranded Count",
+        xaxis_title="Sector ID",
+        yaxis_title="Stranded Victims",
+        height=300,
+        margin=dict(l=10, r=10, t=40, b=10)
+    )
+    
+    return fig
+
+
 def render_sector_analysis(analytics):
     """Render sector-by-sector analysis"""
     
-    density = analytics.analyze_geographic_density()
-    recommendations = analytics.get_sector_recommendations()
+    recommendations = analytics.get_sector_recommendations_table()
     
-    if recommendations:
+    if recommendations.num_rows:
         st.markdown("### Sector Priority Recommendations")
         
-        # Create DataFrame for better visualization
-        df = pd.DataFrame(recommendations)
-        
-        # Format columns
-        df_display = df.copy()
-        df_display['rescue_percentage'] = df_display['rescue_percentage'].apply(lambda x: f"{x:.1f}%")
-        df_display['priority_score'] = df_display['priority_score'].apply(lambda x: f"{x:.2f}")
+        # Arrow-backed frame straight from the table (no block consolidation copy);
+        # numeric columns are formatted client-side by column_config
+        df = recommendations.to_pandas(split_blocks=True, types_mapper=pd.ArrowDtype)
         
         # Display table
         st.dataframe(
-            df_display,
+            df,
             use_container_width=True,
             hide_index=True,
             column_config={
                 "sector_id": st.column_config.TextColumn("Sector", width="small"),
                 "stranded_count": st.column_config.NumberColumn("Stranded", width="small"),
-                "rescue_percentage": st.column_config.TextColumn("Rescued %", width="small"),
-                "priority_score": st.column_config.TextColumn("Priority Score", width="small"),
+                "rescue_percentage": st.column_config.NumberColumn("Rescued %", width="small", format="%.1f%%"),
+                "priority_score": st.column_config.NumberColumn("Priority Score", width="small", format="%.2f"),
                 "recommendation": st.column_config.TextColumn("Recommendation", width="large")
             }
         )
         
         # Bar chart of stranded by sector
-        top_sectors = df.nlargest(5, 'stranded_count')
+        top_sectors = df.sort_values('stranded_count', ascending=False).head(5)
         
         if not top_sectors.empty:
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=top_sectors['sector_id'],
-                    y=top_sectors['stranded_count'],
-                    marker=dict(
-                        color=top_sectors['stranded_count'],
-                        colorscale='Reds',
-                        showscale=False
-                    ),
-                    text=top_sectors['stranded_count'],
-                    textposition='auto',
-                    hovertemplate='<b>Sector %{x}</b><br>Stranded: %{y}<extra></extra>'
-                )
-            ])
-            
-            fig.update_layout(
-                title="Top 5 Sectors by Stranded Count",
-                xaxis_title="Sector ID",
-                yaxis_title="Stranded Victims",
-                height=300,
-                margin=dict(l=10, r=10, t=40, b=10)
+            fig = build_sector_bar_figure(
+                tuple(top_sectors['sector_id'].tolist()),
+                tuple(top_sectors['stranded_count'].tolist())
             )
             
             st.plotly_chart(fig, use_container_width=True)
@@ -501,93 +693,63 @@ def render_sector_analysis(analytics):
 def render_critical_cases(analytics):
     """Render critical cases requiring immediate attention"""
     
-    critical_victims = analytics.identify_critical_victims()
+    # Only the ten most severe cases are shown, so only those are built and sorted
+    critical_count = analytics.count_critical_victims()
     
-    if critical_victims:
-        st.markdown(f"### Critical Cases ({len(critical_victims)})")
+    if critical_count:
+        critical_victims = analytics.identify_critical_victims(limit=10)
+        
+        st.markdown(f"### Critical Cases ({critical_count})")
         st.warning("These victims require immediate attention")
         
-        # Display critical victims
-        for idx, victim in enumerate(critical_victims[:10], 1):  # Top 10
-            with st.expander(f"#{idx} - ID: {victim['id']} | {victim['reason']}", expanded=idx <= 3):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"**Location:** {victim['lat']:.6f}, {victim['lon']:.6f}")
-                    st.markdown(f"**Signal:** {victim['rssi']} dBm")
-                
-                with col2:
-                    st.markdown(f"**Priority:** {victim['priority']}")
-                    st.markdown(f"**Last Update:** {victim['minutes_since_update']:.1f} min ago")
-                
-                st.markdown(f"**Reason for Alert:** {victim['reason']}")
+        # Display top 10 critical victims as one table
+        df = pd.DataFrame(critical_victims).convert_dtypes(dtype_backend='pyarrow')
+        df['location'] = df['lat'].map('{:.6f}'.format) + ', ' + df['lon'].map('{:.6f}'.format)
+        
+        with st.expander("Top 10 critical victims", expanded=True):
+            st.dataframe(
+                df[['id', 'reason', 'location', 'rssi', 'priority', 'minutes_since_update']],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "id": st.column_config.NumberColumn("ID", width="small", format="%d"),
+                    "reason": st.column_config.TextColumn("Reason for Alert", width="large"),
+                    "location": st.column_config.TextColumn("Location"),
+                    "rssi": st.column_config.NumberColumn("Signal", format="%d dBm"),
+                    "priority": st.column_config.TextColumn("Priority", width="small"),
+                    "minutes_since_update": st.column_config.NumberColumn("Last Update", format="%.1f min ago")
+                }
+            )
     
     else:
         st.success("No critical cases at this time")
 
 
-def render_operation_summary(analytics):
+def render_operation_summary(summary):
     """Render comprehensive operation summary"""
     
-    summary = analytics.generate_operation_summary(
-        rssi_strong_threshold=st.session_state.rssi_strong_threshold,
-        rssi_weak_threshold=st.session_state.rssi_weak_threshold,
-        time_critical_threshold=st.session_state.time_critical_threshold,
-        rescue_centre_lat=st.session_state.get('rescue_centre_lat', 13.022),
-        rescue_centre_lon=st.session_state.get('rescue_centre_lon', 77.587)
-    )
-    
-    st.markdown("### Operation Summary Report")
-    
     # Basic stats
-    st.markdown("#### Basic Statistics")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total", summary['basic_stats']['total'])
-    with col2:
-        st.metric("Stranded", summary['basic_stats']['stranded'])
-    with col3:
-        st.metric("En-Route", summary['basic_stats']['enroute'])
-    with col4:
-        st.metric("Rescued", summary['basic_stats']['rescued'])
-    
-    st.markdown("---")
+    render_metric_grid([
+        {'label': "Total", 'value': summary['basic_stats']['total']},
+        {'label': "Stranded", 'value': summary['basic_stats']['stranded']},
+        {'label': "En-Route", 'value': summary['basic_stats']['enroute']},
+        {'label': "Rescued", 'value': summary['basic_stats']['rescued']}
+    ], header="<h3>Operation Summary Report</h3><h4>Basic Statistics</h4>")
     
     # Rescue metrics
-    st.markdown("#### Rescue Performance")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Rescues/Hour",
-            f"{summary['rescue_metrics']['rescues_per_hour']:.2f}"
-        )
-    with col2:
-        st.metric(
-            "Avg Time",
-            f"{summary['rescue_metrics']['average_rescue_time_minutes']:.1f} min"
-        )
-    with col3:
-        st.metric(
-            "Fastest",
-            f"{summary['rescue_metrics']['fastest_rescue_minutes']:.1f} min"
-        )
-    
-    st.markdown("---")
+    render_metric_grid([
+        {'label': "Rescues/Hour", 'value': f"{summary['rescue_metrics']['rescues_per_hour']:.2f}"},
+        {'label': "Avg Time", 'value': f"{summary['rescue_metrics']['average_rescue_time_minutes']:.1f} min"},
+        {'label': "Fastest", 'value': f"{summary['rescue_metrics']['fastest_rescue_minutes']:.1f} min"}
+    ], header="<hr><h4>Rescue Performance</h4>")
     
     # Geographic analysis
-    st.markdown("#### Geographic Coverage")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Sectors", summary['geographic_analysis']['total_sectors'])
-    with col2:
-        st.metric("Max Density", summary['geographic_analysis']['highest_density'])
-    with col3:
-        st.metric("Coverage Distance", f"{summary['geographic_analysis']['coverage_distance_km']:.2f} km")
-    with col4:
-        st.metric("Coverage Area", f"{summary['geographic_analysis']['coverage_area_km2']:.2f} km²")
+    render_metric_grid([
+        {'label': "Sectors", 'value': summary['geographic_analysis']['total_sectors']},
+        {'label': "Max Density", 'value': summary['geographic_analysis']['highest_density']},
+        {'label': "Coverage Distance", 'value': f"{summary['geographic_analysis']['coverage_distance_km']:.2f} km"},
+        {'label': "Coverage Area", 'value': f"{summary['geographic_analysis']['coverage_area_km2']:.2f} km²"}
+    ], header="<hr><h4>Geographic Coverage</h4>")
     
     st.markdown("---")
     
@@ -595,13 +757,15 @@ def render_operation_summary(analytics):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("#### Signal Analysis")
-        st.metric("Average RSSI", f"{summary['signal_analysis']['average_rssi']:.1f} dBm")
-        st.metric("Weak Signals", summary['signal_analysis']['weak_signals'])
-        st.metric("Deteriorating", summary['signal_analysis']['deteriorating_count'])
+        render_metric_grid([
+            {'label': "Average RSSI", 'value': f"{summary['signal_analysis']['average_rssi']:.1f} dBm"},
+            {'label': "Weak Signals", 'value': summary['signal_analysis']['weak_signals']},
+            {'label': "Deteriorating", 'value': summary['signal_analysis']['deteriorating_count']}
+        ], columns=1, header="<h4>Signal Analysis</h4>")
     
     with col2:
-        st.markdown("#### Time Analysis")
-        st.metric("Operation Time", f"{summary['time_analysis']['operation_duration_hours']:.1f} hours")
-        st.metric("Detection Rate", f"{summary['time_analysis']['detections_per_hour']:.1f}/hr")
-        st.metric("Stale Data", summary['time_analysis']['stale_data_count'])
\ No newline at end of file
+        render_metric_grid([
+            {'label': "Operation Time", 'value': f"{summary['time_analysis']['operation_duration_hours']:.1f} hours"},
+            {'label': "Detection Rate", 'value': f"{summary['time_analysis']['detections_per_hour']:.1f}/hr"},
+            {'label': "Stale Data", 'value': summary['time_analysis']['stale_data_count']}
+        ], columns=1, header="<h4>Time Analysis</h4>")
@@ -4,19 +4,45 @@ Real-time monitoring and victim management interface
 """
 
 import streamlit as st
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import time
+from typing import Dict, Any
 
-from modules import MapManager, Analytics
+from modules import MapManager, DataManager
+from _pages.widgets import get_cached_statistics, render_metric_grid, rerun_on_new_packets
 from utils.helpers import calculate_priority, format_time_ago, get_signal_color
 import config
 
-# ===== REAL-TIME UPDATE CHECK =====
-if st.session_state.get('force_rerun', False):
-    st.session_state.force_rerun = False
-    st.rerun()
+
+@st.cache_resource(
+    max_entries=16,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_victims_snapshot(data_manager: DataManager) -> Dict[int, Dict[str, Any]]:
+    """
+    Snapshot of all victims, shared by every section until the data version changes
+    
+    cache_resource hands back the same dict instead of pickling a copy of
+    every record on each hit; callers must treat it as read-only.
+    
+    Args:
+        data_manager: DataManager instance
+        
+    Returns:
+        Dict of all victims
+    """
+    return data_manager.get_all_victims()
+
+
+@st.cache_resource(show_spinner=False)
+def get_map_manager() -> MapManager:
+    """Process-wide MapManager; it holds no per-session state"""
+    return MapManager()
+
 
 def render_metrics_bar(data_manager):
     """
@@ -24,56 +50,44 @@ def render_metrics_bar(data_manager):
     Shows Total, Stranded, En-Route, Rescued, and Success Rate.
     """
     
-    # 1. Fetch the latest stats from your data manager
-    stats = data_manager.get_statistics()
-    
-    # 2. Create 5 columns for a professional monitoring look
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            label="Total Detected",
-            value=stats['total'],
-            help="Total unique victim IDs detected by the ground station"
-        )
+    # 1. Fetch the latest stats from your data manager (cached per data version)
+    stats = get_cached_statistics(data_manager)
     
-    with col2:
-        # Show a negative delta if people are still stranded (priority to clear this)
-        stranded_val = stats['stranded']
-        st.metric(
-            label="Stranded",
-            value=stranded_val,
-            delta=-stranded_val,
-            delta_color="normal", 
-            help="Victims currently awaiting rescue"
-        )
-    
-    with col3:
-        st.metric(
-            label="En-Route",
-            value=stats['enroute'],
-            help="Rescue teams dispatched"
-        )
+    # 2. One HTML block for all five metrics instead of a widget per column
+    stranded_val = stats['stranded']
+    rescued_count = stats['rescued']
     
-    with col4:
-        # Show a positive green delta for successful rescues
-        rescued_count = stats['rescued']
-        st.metric(
-            label="Rescued",
-            value=rescued_count,
-            delta=f"+{rescued_count}" if rescued_count > 0 else None,
-            delta_color="normal",
-            help="Victims successfully reached and moved to safety"
-        )
-    
-    with col5:
-        # Calculate success percentage
-        rescue_pct = stats['rescued_pct']
-        st.metric(
-            label="Success Rate",
-            value=f"{rescue_pct:.1f}%",
-            help="Overall operation efficiency (Rescued / Total)"
-        )
+    render_metric_grid([
+        {
+            'label': "Total Detected",
+            'value': stats['total'],
+            'help': "Total unique victim IDs detected by the ground station"
+        },
+        {
+            # Show a negative delta if people are still stranded (priority to clear this)
+            'label': "Stranded",
+            'value': stranded_val,
+            'delta': -stranded_val if stranded_val else None,
+            'help': "Victims currently awaiting rescue"
+        },
+        {
+            'label': "En-Route",
+            'value': stats['enroute'],
+            'help': "Rescue teams dispatched"
+        },
+        {
+            # Show a positive green delta for successful rescues
+            'label': "Rescued",
+            'value': rescued_count,
+            'delta': f"+{rescued_count}" if rescued_count > 0 else None,
+            'help': "Victims successfully reached and moved to safety"
+        },
+        {
+            'label': "Success Rate",
+            'value': f"{stats['rescued_pct']:.1f}%",
+            'help': "Overall operation efficiency (Rescued / Total)"
+        }
+    ])
 
     # Optional: Add a progress bar for visual impact
     if stats['total'] > 0:
@@ -81,103 +95,135 @@ def render_metrics_bar(data_manager):
         st.progress(progress_val, text=f"Mission Progress: {int(progress_val*100)}%")
 
 
+def _apply_rescue_edits(data_manager):
+    """
+    Apply Rescued checkbox edits from the victim table (data_editor on_change)
+    
+    Runs before the rerun's script, against the IDs of the frame the operator
+    actually clicked on, so packets arriving in between cannot shift an edit
+    onto another victim. Edits accumulate in the widget state, so each one is
+    applied only when it differs from the victim's current status.
+    
+    Args:
+        data_manager: DataManager instance
+    """
+    
+    edited_rows = st.session_state.victim_editor.get('edited_rows', {})
+    shown_ids = st.session_state.get('_victim_editor_ids')
+    if shown_ids is None:
+        return
+    
+    operator_name = st.session_state.get('operator_name', 'Unknown Operator')
+    
+    for pos, change in edited_rows.items():
+        if 'Rescued' not in change:
+            continue
+        
+        victim = data_manager.get_victim(int(shown_ids[int(pos)]))
+        if victim is None:
+            continue
+        
+        is_rescued = victim['STATUS'] == config.STATUS_RESCUED
+        if change['Rescued'] and not is_rescued:
+            data_manager.mark_rescued(victim['ID'], operator_name)
+        elif not change['Rescued'] and is_rescued:
+            # Undo rescue
+            data_manager.mark_stranded(victim['ID'])
+
+
 def render_victim_table_with_rescue(data_manager):
     """Render victim data preview with rescue checkbox in single-line format"""
     
     st.subheader("Live Data Preview")
     st.markdown("Live preview of current victim data")
     
-    victims = data_manager.get_all_victims()
+    victims = get_victims_snapshot(data_manager)
     
     if victims:
-        # Convert to DataFrame
-        df = pd.DataFrame(list(victims.values()))
+        # Prebuilt column arrays, already in display order
+        columns = data_manager.get_column_arrays()
+        available_columns = list(columns)
         
-        # Select and reorder columns for display
-        display_columns = ['ID', 'LAT', 'LON', 'RSSI', 'LAST_UPDATE', 'UPDATE_COUNT', 'STATUS']
-        available_columns = [col for col in display_columns if col in df.columns]
-        df_display = df[available_columns].copy()
-        
-        # Display with filters
-        col1, col2, col3 = st.columns(3)
+        # Display with filters; grouped in a form so changing filter, sort and
+        # order together costs one rerun on Apply instead of one per widget
+        with st.form("dashboard_table_controls"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                status_filter = st.selectbox(
+                    "Filter by Status",
+                    ["All"] + config.ALL_STATUSES,
+                    key="dashboard_status_filter"
+                )
+            
+            with col2:
+                sort_column = st.selectbox(
+                    "Sort by",
+                    available_columns,
+                    index=0,
+                    key="dashboard_sort_column"
+                )
+            
+            with col3:
+                sort_order = st.selectbox(
+                    "Order",
+                    ["Ascending", "Descending"],
+                    key="dashboard_sort_order"
+                )
+            
+            st.form_submit_button("Apply")
         
-        with col1:
-            status_filter = st.selectbox(
-                "Filter by Status",
-                ["All"] + config.ALL_STATUSES,
-                key="dashboard_status_filter"
-            )
+        # Filter on int8 status codes, then order the surviving positions with
+        # one argsort; the frame is built once from the final row selection
+        status_codes = pd.Categorical(columns['STATUS'], categories=config.ALL_STATUSES).codes
+        if status_filter != "All":
+            rows = np.flatnonzero(status_codes == config.ALL_STATUSES.index(status_filter))
+        else:
+            rows = np.arange(len(columns['ID']))
         
-        with col2:
-            sort_column = st.selectbox(
-                "Sort by",
-                available_columns,
-                index=0,
-                key="dashboard_sort_column"
-            )
+        order = np.argsort(columns[sort_column][rows], kind='stable')
+        if sort_order == "Descending":
+            order = order[::-1]
+        rows = rows[order]
         
-        with col3:
-            sort_order = st.selectbox(
-                "Order",
-                ["Ascending", "Descending"],
-                key="dashboard_sort_order"
-            )
+        # Numeric columns keep the compact DataManager dtypes (int32 ID and
+        # UPDATE_COUNT, int16 RSSI); STATUS goes out as an int8 categorical.
+        # LAT/LON stay float64: float32 would round coordinates by about a metre.
+        # Indexed by victim ID, so the editor's identity follows which victims
+        # are shown and in what order, not just the row count
+        df_display = pd.DataFrame(
+            {name: values[rows] for name, values in columns.items()},
+            index=pd.Index(columns['ID'][rows], name='VICTIM_ID'),
+            copy=False
+        )
+        df_display['STATUS'] = pd.Categorical.from_codes(status_codes[rows], categories=config.ALL_STATUSES)
         
-        # Apply filters
-        if status_filter != "All":
-            df_display = df_display[df_display['STATUS'] == status_filter]
+        # One data_editor for the whole table instead of a checkbox widget per row
+        rescued_mask = status_codes[rows] == config.ALL_STATUSES.index(config.STATUS_RESCUED)
+        df_display.insert(0, 'Rescued', rescued_mask)
         
-        # Apply sorting
-        ascending = (sort_order == "Ascending")
-        df_display = df_display.sort_values(by=sort_column, ascending=ascending)
+        # Row positions in the editor's edit state refer to these IDs
+        st.session_state._victim_editor_ids = df_display.index.to_numpy()
         
-        # Display each victim in single-line format
-        for idx, row in df_display.iterrows():
-            victim_id = int(row['ID'])
-            current_victim = victims[victim_id]
-            is_currently_rescued = current_victim['STATUS'] == config.STATUS_RESCUED
-            
-            # Status text
-            status_text = "Rescued" if is_currently_rescued else "Stranded"
-            
-            # Create single line with checkbox and info
-            col_checkbox, col_info = st.columns([0.05, 0.95])
-            
-            with col_checkbox:
-                # Editable checkbox
-                new_state = st.checkbox(
-                    label="",
-                    value=is_currently_rescued,
-                    key=f"rescue_cb_{victim_id}_{idx}"
-                )
-                
-                # Handle state change
-                if new_state and not is_currently_rescued:
-                    # Mark as rescued
-                    operator_name = st.session_state.get('operator_name', 'Unknown Operator')
-                    data_manager.mark_rescued(victim_id, operator_name)
-                    st.rerun()
-                elif not new_state and is_currently_rescued:
-                    # Undo rescue
-                    current_victim['STATUS'] = config.STATUS_STRANDED
-                    current_victim['RESCUED_TIME'] = None
-                    current_victim['RESCUED_BY'] = None
-                    data_manager._auto_save()
-                    st.rerun()
-            
-            with col_info:
-                # Format with extra spacing for clarity
-                status_color = config.STATUS_COLORS.get(current_victim['STATUS'], '#333')
-                info_text = (
-                    f"**ID: {int(row['ID'])}**&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"Lat: {row['LAT']:.6f}&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"Lon: {row['LON']:.6f}&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"RSSI: {row['RSSI']} dBm&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"Date & Time: {row['LAST_UPDATE']}&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"Data Packs: {int(row['UPDATE_COUNT'])}&nbsp;&nbsp;&nbsp;&nbsp;"
-                    f"<span style='color: {status_color}; font-weight: bold;'>{status_text}</span>"
-                )
-                st.markdown(info_text, unsafe_allow_html=True)
+        st.data_editor(
+            df_display,
+            use_container_width=True,
+            hide_index=True,
+            disabled=[col for col in df_display.columns if col != 'Rescued'],
+            column_config={
+                "Rescued": st.column_config.CheckboxColumn("Rescued", width="small"),
+                "ID": st.column_config.NumberColumn("ID", format="%d", width="small"),
+                "LAT": st.column_config.NumberColumn("Lat", format="%.6f"),
+                "LON": st.column_config.NumberColumn("Lon", format="%.6f"),
+                "RSSI": st.column_config.NumberColumn("RSSI", format="%d dBm"),
+                "LAST_UPDATE": st.column_config.TextColumn("Date & Time"),
+                "UPDATE_COUNT": st.column_config.NumberColumn("Data Packs", format="%d"),
+                "STATUS": st.column_config.TextColumn("Status")
+            },
+            key="victim_editor",
+            on_change=_apply_rescue_edits,
+            args=(data_manager,)
+        )
         
         st.caption(f"Showing {len(df_display)} of {len(victims)} record(s)")
     
@@ -190,8 +236,8 @@ def render_dashboard():
     
     # Get instances
     data_manager = st.session_state.data_manager
-    map_manager = MapManager()
-    analytics = Analytics(data_manager)
+    map_manager = get_map_manager()
+    analytics = st.session_state.analytics
     
     st.title("FalconResQ Dashboard")
     st.markdown("### Active Rescue Operations")
@@ -202,6 +248,9 @@ def render_dashboard():
     
     # Main content
     render_main_content(data_manager, map_manager, analytics)
+    
+    # ===== REAL-TIME UPDATE CHECK =====
+    rerun_on_new_packets()
 
 
 def render_main_content(data_manager, map_manager, analytics):
@@ -243,28 +292,49 @@ def render_map_section(data_manager, map_manager):
         float(st.session_state.get('rescue_centre_lon', 77.587))
     ]
 
-    victims = data_manager.get_all_victims()
+    victims = get_victims_snapshot(data_manager)
     
     if victims:
-        # Generate the map using MapManager
-        victim_map = map_manager.create_victim_map(
-            victims=victims,
-            center=rescue_centre,
-            show_rescued=show_rescued,
-            show_priority_only=show_priority,
-            show_heatmap=show_heatmap,
-            rssi_strong_threshold=st.session_state.get('rssi_strong_threshold', config.RSSI_STRONG_THRESHOLD),
-            rssi_weak_threshold=st.session_state.get('rssi_weak_threshold', config.RSSI_WEAK_THRESHOLD),
-            time_critical_threshold=st.session_state.get('time_critical_threshold', config.TIME_CRITICAL_THRESHOLD)
+        thresholds = (
+            st.session_state.get('rssi_strong_threshold', config.RSSI_STRONG_THRESHOLD),
+            st.session_state.get('rssi_weak_threshold', config.RSSI_WEAK_THRESHOLD),
+            st.session_state.get('time_critical_threshold', config.TIME_CRITICAL_THRESHOLD)
         )
         
-        # Display map - Note: returned_objects=[] prevents unnecessary refreshes
-        st_folium(victim_map, width=None, height=550, returned_objects=[])
-        st.caption(f"Rescue Station synced to: {rescue_centre[0]:.6f}, {rescue_centre[1]:.6f}")
+        # Reuse the last map while nothing it depends on has changed; the minute
+        # bucket keeps "last seen" popups and time-based priority current
+        map_key = (
+            id(data_manager), data_manager.version,
+            show_rescued, show_priority, show_heatmap,
+            tuple(rescue_centre), thresholds,
+            int(time.time() // 60)
+        )
+        
+        if st.session_state.get('_dashboard_map_key') == map_key:
+            map_html, visible_count = st.session_state._dashboard_map
+        else:
+            # Generate the map using MapManager; filtering and the marker count come from the same pass
+            victim_map, visible_count = map_manager.create_victim_map(
+                victims=victims,
+                center=rescue_centre,
+                show_rescued=show_rescued,
+                show_priority_only=show_priority,
+                show_heatmap=show_heatmap,
+                rssi_strong_threshold=thresholds[0],
+                rssi_weak_threshold=thresholds[1],
+                time_critical_threshold=thresholds[2]
+            )
+            # Keep the rendered HTML, not the folium object: unchanged reruns
+            # then skip folium rendering entirely
+            map_html = victim_map.get_root().render()
+            st.session_state._dashboard_map = (map_html, visible_count)
+            st.session_state._dashboard_map_key = map_key
+        
+        # Display-only map: a static component, since no map events are read back
+        components.html(map_html, height=550)
+        st.caption(
+            f"Showing {visible_count} of {len(victims)} victim(s) | "
+            f"Rescue Station synced to: {rescue_centre[0]:.6f}, {rescue_centre[1]:.6f}"
+        )
     else:
         st.info("Waiting for victim signals... Map will appear when data is received.")
-
-
-# Run the dashboard
-if __name__ == "__main__" or True:  # Always run in Streamlit
-    render_dashboard()
\ No newline at end of file
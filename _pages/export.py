@@ -5,40 +5,285 @@ Professional data export interface with multiple formats and filters
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
 import json
 import io
+import csv
+from typing import Tuple, Iterable, Iterator, Dict, Any, List
 
-from modules import Analytics
+from modules import DataManager
+from _pages.widgets import fragment
 import config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode export data as indented JSON, using orjson when it is installed
+    
+    Args:
+        data: JSON-serializable data (non-string keys and other objects are stringified)
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+# Rescue log export columns, in file order
+RESCUE_LOG_COLUMNS = [
+    'Victim_ID', 'Rescued_Time', 'Rescued_By', 'Location_Lat', 'Location_Lon',
+    'First_Detected', 'Total_Updates', 'Final_Signal_RSSI', 'Notes'
+]
+
+
+@st.cache_resource(
+    max_entries=16,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_status_buckets(data_manager: DataManager) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """
+    Victims grouped by status in a single pass, shared until the data version changes
+    
+    cache_resource hands back the same dicts instead of copying them on
+    each hit; callers must treat them as read-only.
+    
+    Args:
+        data_manager: DataManager instance
+        
+    Returns:
+        Dict mapping each status to a dict of its victims
+    """
+    
+    buckets = {status: {} for status in config.ALL_STATUSES}
+    
+    for vid, victim in data_manager.get_all_victims().items():
+        buckets.setdefault(victim['STATUS'], {})[vid] = victim
+    
+    return buckets
+
+
+# Payloads are rebuilt only when the victim data changes, not on every rerun
+@st.cache_data(
+    max_entries=16,
+    ttl=60,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_csv_payload(data_manager: DataManager, status: str = None) -> bytes:
+    """
+    CSV export of all victims or of one status
+    
+    Args:
+        data_manager: DataManager instance
+        status: Status to export (all victims if None)
+        
+    Returns:
+        UTF-8 encoded CSV content
+    """
+    
+    if status is None:
+        victims = data_manager.get_all_victims()
+    else:
+        victims = get_status_buckets(data_manager).get(status, {})
+    
+    return generate_csv(victims.values())
+
+
+@st.cache_data(
+    max_entries=16,
+    ttl=60,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_priority_csv_payload(data_manager: DataManager, thresholds: Tuple[int, int, int]) -> Tuple[bytes, int]:
+    """
+    CSV export of high priority victims
+    
+    Args:
+        data_manager: DataManager instance
+        thresholds: (rssi_strong, rssi_weak, time_critical)
+        
+    Returns:
+        Tuple of (UTF-8 encoded CSV content, number of victims in it)
+    """
+    
+    rssi_strong, rssi_weak, time_critical = thresholds
+    priority_victims = data_manager.get_priority_victims(
+        rssi_strong_threshold=rssi_strong,
+        rssi_weak_threshold=rssi_weak,
+        time_critical_threshold=time_critical
+    )
+    
+    return generate_csv(priority_victims.values()), len(priority_victims)
+
+
+@st.cache_data(
+    max_entries=16,
+    ttl=60,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_json_payload(data_manager: DataManager) -> bytes:
+    """
+    JSON export of all victims
+    
+    Args:
+        data_manager: DataManager instance
+        
+    Returns:
+        UTF-8 encoded JSON content
+    """
+    return dumps_json(data_manager.get_all_victims())
+
+
+@st.cache_data(
+    max_entries=16,
+    ttl=60,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_backup_payload(data_manager: DataManager, operator: str, operation_start: datetime) -> bytes:
+    """
+    JSON backup package of victims, statistics and operation details
+    
+    The export timestamp is when the payload was built; the ttl keeps it
+    within a minute of the download.
+    
+    Args:
+        data_manager: DataManager instance
+        operator: Operator name
+        operation_start: Operation start time
+        
+    Returns:
+        UTF-8 encoded JSON content
+    """
+    
+    backup_data = {
+        'export_timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'operation_start': operation_start.strftime("%Y-%m-%d %H:%M:%S"),
+        'operator': operator,
+        'victims': data_manager.get_all_victims(),
+        'statistics': data_manager.get_statistics()
+    }
+    
+    return dumps_json(backup_data)
+
+
+@st.cache_data(
+    max_entries=16,
+    ttl=60,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_rescue_log_payload(data_manager: DataManager) -> Tuple[pd.DataFrame, str]:
+    """
+    Rescue log table and its CSV export
+    
+    Args:
+        data_manager: DataManager instance
+        
+    Returns:
+        Tuple of (rescue log DataFrame, CSV content); the frame is empty
+        when nobody has been rescued
+    """
+    
+    rescued_victims = get_status_buckets(data_manager)[config.STATUS_RESCUED]
+    
+    rescue_log = []
+    
+    for vid, victim in rescued_victims.items():
+        rescue_log.append({
+            'Victim_ID': vid,
+            'Rescued_Time': victim.get('RESCUED_TIME', ''),
+            'Rescued_By': victim.get('RESCUED_BY', ''),
+            'Location_Lat': victim['LAT'],
+            'Location_Lon': victim['LON'],
+            'First_Detected': victim['FIRST_DETECTED'],
+            'Total_Updates': victim.get('UPDATE_COUNT', 0),
+            'Final_Signal_RSSI': victim['RSSI'],
+            'Notes': victim.get('NOTES', '')
+        })
+    
+    # The frame is only for the on-page preview; the CSV is written straight
+    # from the row dicts and does not depend on it
+    df = pd.DataFrame(rescue_log, columns=RESCUE_LOG_COLUMNS)
+    csv_log = "".join(iter_csv_chunks(rescue_log, columns=RESCUE_LOG_COLUMNS))
+    
+    return df, csv_log
+
+
+# File extension for each download MIME type
+DOWNLOAD_EXTENSIONS = {
+    "text/csv": "csv",
+    "application/json": "json",
+    "text/plain": "txt"
+}
+
+
+def render_download(label: str, data, prefix: str, timestamp: str, mime: str = "text/csv"):
+    """
+    Render a full-width download button with a timestamped filename
+    
+    Args:
+        label: Button label
+        data: File content (str or bytes)
+        prefix: Filename prefix, e.g. "all_victims"
+        timestamp: Filename timestamp for this rerun
+        mime: MIME type of the content
+    """
+    
+    st.download_button(
+        label=label,
+        data=data,
+        file_name=f"{prefix}_{timestamp}.{DOWNLOAD_EXTENSIONS[mime]}",
+        mime=mime,
+        use_container_width=True
+    )
+
 
 def render_export():
     """Render the export page"""
     
     # Get instances from session state
     data_manager = st.session_state.data_manager
-    analytics = Analytics(data_manager)
+    analytics = st.session_state.analytics
     
     # Page header
     st.title("Data Export & Reporting")
     st.markdown("Export victim data and generate operation reports")
     
     # Check if data exists
-    victims = data_manager.get_all_victims()
-    
-    if not victims:
+    if not data_manager.get_victim_count():
         st.warning("No data available to export")
         st.info("Data will be available once victims are detected by the system")
         return
     
+    # One filename timestamp and one statistics snapshot shared by every
+    # section on this rerun
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    stats = data_manager.get_statistics()
+    
     # Overview statistics
-    render_export_overview(data_manager)
+    render_export_overview(stats)
     
     st.divider()
     
     # Export options
-    render_export_options(data_manager, analytics)
+    render_export_options(data_manager, analytics, timestamp, stats)
     
     st.divider()
     
@@ -46,11 +291,9 @@ def render_export():
     render_data_preview(data_manager)
 
 
-def render_export_overview(data_manager):
+def render_export_overview(stats):
     """Render export overview with statistics"""
     
-    stats = data_manager.get_statistics()
-    
     st.subheader("Export Overview")
     
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -73,7 +316,7 @@ def render_export_overview(data_manager):
         st.metric("Operation Time", f"{hours}h")
 
 
-def render_export_options(data_manager, analytics):
+def render_export_options(data_manager, analytics, timestamp, stats):
     """Render export options and buttons"""
     
     st.subheader("Export Options")
@@ -87,24 +330,27 @@ def render_export_options(data_manager, analytics):
     ])
     
     with tab1:
-        render_csv_exports(data_manager)
+        render_csv_exports(data_manager, timestamp, stats)
     
     with tab2:
-        render_json_exports(data_manager)
+        render_json_exports(data_manager, timestamp)
     
     with tab3:
-        render_operation_report(data_manager, analytics)
+        render_operation_report(data_manager, analytics, timestamp, stats)
     
     with tab4:
-        render_rescue_log(data_manager)
+        render_rescue_log(data_manager, timestamp)
 
 
-def render_csv_exports(data_manager):
+def render_csv_exports(data_manager, timestamp, stats):
     """Render CSV export options"""
     
     st.markdown("### CSV Data Exports")
     st.markdown("Export victim data in CSV format for analysis in Excel, databases, or other tools")
     
+    # Per-status counts come from the page's statistics snapshot; the victims
+    # themselves are only touched when a cached payload has to be rebuilt
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -114,16 +360,9 @@ def render_csv_exports(data_manager):
         st.markdown("**All Victims**")
         st.caption("Complete dataset with all victim records")
         
-        all_victims = data_manager.get_all_victims()
-        if all_victims:
-            csv_all = generate_csv(list(all_victims.values()))
-            st.download_button(
-                label="Download All Data (CSV)",
-                data=csv_all,
-                file_name=f"all_victims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+        if stats['total']:
+            csv_all = get_csv_payload(data_manager)
+            render_download("Download All Data (CSV)", csv_all, "all_victims", timestamp)
         else:
             st.info("No data available")
         
@@ -133,17 +372,10 @@ def render_csv_exports(data_manager):
         st.markdown("**Stranded Victims**")
         st.caption("Victims currently awaiting rescue")
         
-        stranded = data_manager.get_victims_by_status(config.STATUS_STRANDED)
-        if stranded:
-            csv_stranded = generate_csv(list(stranded.values()))
-            st.download_button(
-                label="Download Stranded (CSV)",
-                data=csv_stranded,
-                file_name=f"stranded_victims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-            st.caption(f"{len(stranded)} record(s)")
+        if stats['stranded']:
+            csv_stranded = get_csv_payload(data_manager, config.STATUS_STRANDED)
+            render_download("Download Stranded (CSV)", csv_stranded, "stranded_victims", timestamp)
+            st.caption(f"{stats['stranded']} record(s)")
         else:
             st.info("No stranded victims")
     
@@ -154,17 +386,10 @@ def render_csv_exports(data_manager):
         st.markdown("**En-Route Victims**")
         st.caption("Rescue teams dispatched")
         
-        enroute = data_manager.get_victims_by_status(config.STATUS_EN_ROUTE)
-        if enroute:
-            csv_enroute = generate_csv(list(enroute.values()))
-            st.download_button(
-                label="Download En-Route (CSV)",
-                data=csv_enroute,
-                file_name=f"enroute_victims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-            st.caption(f"{len(enroute)} record(s)")
+        if stats['enroute']:
+            csv_enroute = get_csv_payload(data_manager, config.STATUS_EN_ROUTE)
+            render_download("Download En-Route (CSV)", csv_enroute, "enroute_victims", timestamp)
+            st.caption(f"{stats['enroute']} record(s)")
         else:
             st.info("No en-route victims")
         
@@ -174,17 +399,10 @@ def render_csv_exports(data_manager):
         st.markdown("**Rescued Victims**")
         st.caption("Successfully rescued individuals")
         
-        rescued = data_manager.get_victims_by_status(config.STATUS_RESCUED)
-        if rescued:
-            csv_rescued = generate_csv(list(rescued.values()))
-            st.download_button(
-                label="Download Rescued (CSV)",
-                data=csv_rescued,
-                file_name=f"rescued_victims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-            st.caption(f"{len(rescued)} record(s)")
+        if stats['rescued']:
+            csv_rescued = get_csv_payload(data_manager, config.STATUS_RESCUED)
+            render_download("Download Rescued (CSV)", csv_rescued, "rescued_victims", timestamp)
+            st.caption(f"{stats['rescued']} record(s)")
         else:
             st.info("No rescued victims")
     
@@ -198,26 +416,20 @@ def render_csv_exports(data_manager):
         st.markdown("**High Priority Cases**")
         st.caption("Victims requiring immediate attention")
         
-        priority_victims = data_manager.get_priority_victims(
-            rssi_strong_threshold=st.session_state.rssi_strong_threshold,
-            rssi_weak_threshold=st.session_state.rssi_weak_threshold,
-            time_critical_threshold=st.session_state.time_critical_threshold
+        thresholds = (
+            st.session_state.rssi_strong_threshold,
+            st.session_state.rssi_weak_threshold,
+            st.session_state.time_critical_threshold
         )
-        if priority_victims:
-            csv_priority = generate_csv(list(priority_victims.values()))
-            st.download_button(
-                label="Download High Priority (CSV)",
-                data=csv_priority,
-                file_name=f"priority_victims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-            st.caption(f"{len(priority_victims)} record(s)")
+        csv_priority, priority_count = get_priority_csv_payload(data_manager, thresholds)
+        if priority_count:
+            render_download("Download High Priority (CSV)", csv_priority, "priority_victims", timestamp)
+            st.caption(f"{priority_count} record(s)")
         else:
             st.success("No high priority cases")
 
 
-def render_json_exports(data_manager):
+def render_json_exports(data_manager, timestamp):
     """Render JSON export options"""
     
     st.markdown("### JSON Data Exports")
@@ -229,16 +441,9 @@ def render_json_exports(data_manager):
         st.markdown("**Complete Dataset (JSON)**")
         st.caption("Full victim data with all metadata")
         
-        all_data = data_manager.get_all_victims()
-        if all_data:
-            json_data = json.dumps(all_data, indent=2, default=str)
-            st.download_button(
-                label="Download All Data (JSON)",
-                data=json_data,
-                file_name=f"victims_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
+        if data_manager.get_victim_count():
+            json_data = get_json_payload(data_manager)
+            render_download("Download All Data (JSON)", json_data, "victims_data", timestamp, mime="application/json")
         else:
             st.info("No data available")
     
@@ -246,159 +451,120 @@ def render_json_exports(data_manager):
         st.markdown("**Backup Package**")
         st.caption("Complete system backup including configuration")
         
-        backup_data = {
-            'export_timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'operation_start': st.session_state.operation_start_time.strftime("%Y-%m-%d %H:%M:%S"),
-            'operator': st.session_state.operator_name,
-            'victims': data_manager.get_all_victims(),
-            'statistics': data_manager.get_statistics()
-        }
-        
-        json_backup = json.dumps(backup_data, indent=2, default=str)
-        st.download_button(
-            label="Download Backup Package (JSON)",
-            data=json_backup,
-            file_name=f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json",
-            use_container_width=True
+        json_backup = get_backup_payload(
+            data_manager,
+            st.session_state.operator_name,
+            st.session_state.operation_start_time
         )
+        render_download("Download Backup Package (JSON)", json_backup, "backup", timestamp, mime="application/json")
 
 
-def render_operation_report(data_manager, analytics):
+def render_operation_report(data_manager, analytics, timestamp, stats):
     """Render comprehensive operation report"""
     
     st.markdown("### Operation Report")
     st.markdown("Comprehensive summary report with analytics and insights")
     
-    # Generate report
-    report_content = generate_operation_report(data_manager, analytics)
+    # The analytics chain behind the report only runs when asked for
+    if st.button("Generate Report", key="generate_operation_report"):
+        st.session_state.operation_report = {
+            'content': generate_operation_report(data_manager, analytics, stats),
+            'version': data_manager.version,
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    report = st.session_state.get('operation_report')
+    
+    if report is None:
+        st.info("Click Generate Report to build the report from the current data")
+        return
+    
+    report_content = report['content']
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Display report preview
         st.markdown("#### Report Preview")
-        with st.expander("View Report Content", expanded=False):
+        # Unlike a collapsed expander, an off toggle sends no report text
+        # to the browser; the preview is only rendered when asked for
+        if st.toggle("View Report Content", key="show_operation_report"):
             st.text(report_content)
     
     with col2:
         st.markdown("#### Download Options")
         
         # Text report
-        st.download_button(
-            label="Download Report (TXT)",
-            data=report_content,
-            file_name=f"operation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
+        render_download("Download Report (TXT)", report_content, "operation_report", timestamp, mime="text/plain")
         
         st.markdown("---")
         
         # Summary statistics
-        stats = data_manager.get_statistics()
         st.metric("Report Sections", "6")
         st.metric("Total Records", stats['total'])
-        st.caption(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        st.caption(f"Generated: {report['generated']}")
+        
+        if report['version'] != data_manager.version:
+            st.caption("Data has changed since this report was generated")
 
 
-def render_rescue_log(data_manager):
+def render_rescue_log(data_manager, timestamp):
     """Render rescue log export"""
     
     st.markdown("### Rescue Event Log")
     st.markdown("Historical log of all rescue operations")
     
-    rescued_victims = data_manager.get_victims_by_status(config.STATUS_RESCUED)
+    # Rescue log table and CSV, cached per data version
+    df, csv_log = get_rescue_log_payload(data_manager)
     
-    if rescued_victims:
-        # Create rescue log DataFrame
-        rescue_log = []
-        
-        for vid, victim in rescued_victims.items():
-            rescue_log.append({
-                'Victim_ID': vid,
-                'Rescued_Time': victim.get('RESCUED_TIME', ''),
-                'Rescued_By': victim.get('RESCUED_BY', ''),
-                'Location_Lat': victim['LAT'],
-                'Location_Lon': victim['LON'],
-                'First_Detected': victim['FIRST_DETECTED'],
-                'Total_Updates': victim.get('UPDATE_COUNT', 0),
-                'Final_Signal_RSSI': victim['RSSI'],
-                'Notes': victim.get('NOTES', '')
-            })
-        
-        df = pd.DataFrame(rescue_log)
-        
+    if not df.empty:
         # Display preview
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         # Download button
-        csv_log = df.to_csv(index=False)
-        st.download_button(
-            label="Download Rescue Log (CSV)",
-            data=csv_log,
-            file_name=f"rescue_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
+        render_download("Download Rescue Log (CSV)", csv_log, "rescue_log", timestamp)
         
-        st.success(f"Log contains {len(rescue_log)} rescue event(s)")
+        st.success(f"Log contains {len(df)} rescue event(s)")
     
     else:
         st.info("No rescue events recorded yet")
 
 
+@fragment
 def render_data_preview(data_manager):
-    """Render data preview table"""
+    """Render data preview table; its filters rerun only this section"""
     
     st.subheader("Data Preview")
     st.markdown("Live preview of current victim data")
     
-    victims = data_manager.get_all_victims()
+    # Arrow table kept by DataManager, rebuilt only when data changes;
+    # st.dataframe takes it as is, with no pandas conversion per rerun
+    table = data_manager.get_arrow_table()
     
-    if victims:
-        # Convert to DataFrame
-        df = pd.DataFrame(list(victims.values()))
-        
+    if table.num_rows:
         # Select and reorder columns for display
         display_columns = ['ID', 'STATUS', 'LAT', 'LON', 'RSSI', 'LAST_UPDATE', 'UPDATE_COUNT']
-        available_columns = [col for col in display_columns if col in df.columns]
-        df_display = df[available_columns]
         
-        # Format columns
-        if 'LAT' in df_display.columns:
-            df_display['LAT'] = df_display['LAT'].apply(lambda x: f"{x:.6f}")
-        if 'LON' in df_display.columns:
-            df_display['LON'] = df_display['LON'].apply(lambda x: f"{x:.6f}")
+        # LAT/LON stay numeric; the column config formats them to six
+        # decimals in the browser, so no per-row string formatting is needed
         
-        # Display with filters
-        col1, col2, col3 = st.columns(3)
+        # Only the status filter runs on the server; sorting is left to the
+        # table's clickable column headers, which sort in the browser
+        col1, _ = st.columns([1, 2])
         
         with col1:
             status_filter = st.selectbox(
                 "Filter by Status",
-                ["All"] + config.ALL_STATUSES
-            )
-        
-        with col2:
-            sort_column = st.selectbox(
-                "Sort by",
-                display_columns
-            )
-        
-        with col3:
-            sort_order = st.selectbox(
-                "Order",
-                ["Ascending", "Descending"]
+                ["All"] + config.ALL_STATUSES,
+                key="export_status_filter"
             )
         
-        # Apply filters
+        # Filter on the STATUS category codes, then take the selected rows
+        # from the table in one call
+        df_display = table.select(display_columns)
         if status_filter != "All":
-            df_display = df_display[df_display['STATUS'] == status_filter]
-        
-        # Apply sorting
-        ascending = (sort_order == "Ascending")
-        df_display = df_display.sort_values(by=sort_column, ascending=ascending)
+            status_codes = table['STATUS'].combine_chunks().indices.to_numpy()
+            df_display = df_display.take(np.flatnonzero(status_codes == config.ALL_STATUSES.index(status_filter)))
         
         # Display table
         st.dataframe(
@@ -408,130 +574,234 @@ def render_data_preview(data_manager):
             column_config={
                 "ID": st.column_config.NumberColumn("ID", width="small"),
                 "STATUS": st.column_config.TextColumn("Status", width="medium"),
-                "LAT": st.column_config.TextColumn("Latitude", width="medium"),
-                "LON": st.column_config.TextColumn("Longitude", width="medium"),
+                "LAT": st.column_config.NumberColumn("Latitude", width="medium", format="%.6f"),
+                "LON": st.column_config.NumberColumn("Longitude", width="medium", format="%.6f"),
                 "RSSI": st.column_config.NumberColumn("Signal (dBm)", width="small"),
                 "LAST_UPDATE": st.column_config.TextColumn("Last Update", width="large"),
                 "UPDATE_COUNT": st.column_config.NumberColumn("Updates", width="small")
             }
         )
         
-        st.caption(f"Showing {len(df_display)} of {len(df)} record(s)")
+        st.caption(f"Showing {df_display.num_rows} of {table.num_rows} record(s)")
     
     else:
         st.info("No data to preview")
 
 
-def generate_csv(victims_list):
-    """Generate CSV content from victims list"""
-    
-    df = pd.DataFrame(victims_list)
-    
-    # Select columns based on config
-    columns = [col for col in config.EXPORT_COLUMNS if col in df.columns]
-    df = df[columns]
-    
-    return df.to_csv(index=False)
-
-
-def generate_operation_report(data_manager, analytics):
-    """Generate comprehensive operation report"""
-    
-    stats = data_manager.get_statistics()
-    rescue_metrics = analytics.calculate_rescue_rate()
-    efficiency = analytics.calculate_rescue_efficiency()
-    signal_analysis = analytics.analyze_signal_trends()
-    time_patterns = analytics.analyze_time_patterns()
-    coverage = analytics.get_coverage_area(
-        rescue_centre_lat=st.session_state.get('rescue_centre_lat', 13.022),
-        rescue_centre_lon=st.session_state.get('rescue_centre_lon', 77.587)
-    )
-    
-    report = f"""
+def iter_csv_chunks(
+    victims: Iterable[Dict[str, Any]],
+    columns: List[str] = config.EXPORT_COLUMNS,
+    chunk_size: int = 65536
+) -> Iterator[str]:
+    """
+    Encode victims as CSV incrementally, without building a DataFrame
+    
+    Args:
+        victims: Iterable of victim dicts
+        columns: Columns to write, in order (other keys are ignored)
+        chunk_size: Approximate number of characters per yielded chunk
+        
+    Yields:
+        Consecutive pieces of the CSV text, header first
+    """
+    
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction='ignore', lineterminator='\n')
+    writer.writeheader()
+    
+    for victim in victims:
+        writer.writerow(victim)
+        
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue()
+
+
+# Non-string export columns; anything else in config.EXPORT_COLUMNS is text
+_EXPORT_TYPES = {
+    'ID': pa.int64(),
+    'LAT': pa.float64(),
+    'LON': pa.float64(),
+    'RSSI': pa.int64(),
+    'UPDATE_COUNT': pa.int64()
+}
+
+# Export schema fixed once at import, in config.EXPORT_COLUMNS order;
+# keys a victim lacks are written empty
+EXPORT_SCHEMA = pa.schema([(col, _EXPORT_TYPES.get(col, pa.string())) for col in config.EXPORT_COLUMNS])
+
+# Integer columns are read as float64 first, so a fractional value fails
+# the safe cast to int64 instead of being truncated
+_BUILD_SCHEMA = pa.schema([
+    (field.name, pa.float64() if pa.types.is_integer(field.type) else field.type)
+    for field in EXPORT_SCHEMA
+])
+
+
+def generate_csv(victims_list) -> bytes:
+    """
+    Generate CSV content from victims list
+    
+    Rows go into an Arrow table with EXPORT_SCHEMA and are encoded by
+    Arrow's C++ CSV writer rather than row by row in Python. Columns no
+    victim has are left out, and floats are written as pandas writes them
+    (2.0, not Arrow's 2). Arrow quotes every string it writes, so values are
+    written unquoted. Rows Arrow cannot take as they are (a value needing
+    quotes, a fractional or mistyped field from a loaded backup) go
+    through pandas instead, as the export did before.
+    
+    Args:
+        victims_list: Iterable of victim dicts
+        
+    Returns:
+        UTF-8 encoded CSV content, columns in EXPORT_COLUMNS order
+    """
+    
+    victims_list = list(victims_list)
+    present = set().union(*victims_list)
+    columns = [col for col in config.EXPORT_COLUMNS if col in present]
+    
+    buffer = io.BytesIO()
+    buffer.write((",".join(columns) + "\n").encode())
+    try:
+        table = pa.Table.from_pylist(victims_list, schema=_BUILD_SCHEMA).select(columns)
+        
+        arrays = []
+        for name, column in zip(table.column_names, table.columns):
+            export_type = EXPORT_SCHEMA.field(name).type
+            if pa.types.is_integer(export_type):
+                column = column.cast(export_type)
+            elif pa.types.is_floating(export_type):
+                column = pa.array(
+                    [None if v is None or v != v else repr(v) for v in column.to_pylist()],
+                    type=pa.string()
+                )
+            arrays.append(column)
+        
+        table = pa.Table.from_arrays(arrays, names=columns)
+        pacsv.write_csv(table, buffer, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.DataFrame(victims_list)[columns].to_csv(index=False).encode()
+    
+    return buffer.getvalue()
+
+
+# Operation report body; filled by generate_operation_report() with str.format
+_REPORT_TEMPLATE = """
 ================================================================================
                     DISASTER MANAGEMENT OPERATION REPORT
 ================================================================================
 
-Report Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Operator: {st.session_state.operator_name}
-Operation Start: {st.session_state.operation_start_time.strftime("%Y-%m-%d %H:%M:%S")}
-Operation Duration: {time_patterns['operation_duration_hours']:.2f} hours
+Report Generated: {generated}
+Operator: {operator}
+Operation Start: {operation_start}
+Operation Duration: {time_patterns[operation_duration_hours]:.2f} hours
 
 ================================================================================
                          EXECUTIVE SUMMARY
 ================================================================================
 
-Total Victims Detected:     {stats['total']}
-Currently Stranded:         {stats['stranded']} ({stats['stranded_pct']:.1f}%)
-Rescue Teams En-Route:      {stats['enroute']} ({stats['enroute_pct']:.1f}%)
-Successfully Rescued:       {stats['rescued']} ({stats['rescued_pct']:.1f}%)
+Total Victims Detected:     {stats[total]}
+Currently Stranded:         {stats[stranded]} ({stats[stranded_pct]:.1f}%)
+Rescue Teams En-Route:      {stats[enroute]} ({stats[enroute_pct]:.1f}%)
+Successfully Rescued:       {stats[rescued]} ({stats[rescued_pct]:.1f}%)
 
-Operation Efficiency:       {efficiency['efficiency_percentage']:.1f}% ({efficiency['grade']})
+Operation Efficiency:       {efficiency[efficiency_percentage]:.1f}% ({efficiency[grade]})
 
 ================================================================================
                        RESCUE PERFORMANCE METRICS
 ================================================================================
 
-Rescue Rate:                {rescue_metrics['rescues_per_hour']:.2f} victims/hour
-Average Rescue Time:        {rescue_metrics['average_rescue_time_minutes']:.1f} minutes
-Fastest Rescue:             {rescue_metrics['fastest_rescue_minutes']:.1f} minutes
-Slowest Rescue:             {rescue_metrics['slowest_rescue_minutes']:.1f} minutes
+Rescue Rate:                {rescue_metrics[rescues_per_hour]:.2f} victims/hour
+Average Rescue Time:        {rescue_metrics[average_rescue_time_minutes]:.1f} minutes
+Fastest Rescue:             {rescue_metrics[fastest_rescue_minutes]:.1f} minutes
+Slowest Rescue:             {rescue_metrics[slowest_rescue_minutes]:.1f} minutes
 
 ================================================================================
                       GEOGRAPHIC COVERAGE ANALYSIS
 ================================================================================
 
-Coverage Distance:          {coverage.get('distance_km', 0):.2f} km (Rescue Station to First Beacon)
-Coverage Area:              {coverage['area_km2']:.2f} km²
-Latitude Range:             {coverage['min_lat']:.6f} to {coverage['max_lat']:.6f}
-Longitude Range:            {coverage['min_lon']:.6f} to {coverage['max_lon']:.6f}
+Coverage Distance:          {distance_km:.2f} km (Rescue Station to First Beacon)
+Coverage Area:              {coverage[area_km2]:.2f} km²
+Latitude Range:             {coverage[min_lat]:.6f} to {coverage[max_lat]:.6f}
+Longitude Range:            {coverage[min_lon]:.6f} to {coverage[max_lon]:.6f}
 
 ================================================================================
                        SIGNAL STRENGTH ANALYSIS
 ================================================================================
 
-Average Signal Strength:    {signal_analysis['average_rssi']:.1f} dBm
-Median Signal Strength:     {signal_analysis['median_rssi']:.1f} dBm
+Average Signal Strength:    {signal_analysis[average_rssi]:.1f} dBm
+Median Signal Strength:     {signal_analysis[median_rssi]:.1f} dBm
 
 Signal Distribution:
-  - Strong Signals:         {signal_analysis['strong_signals']} victims
-  - Medium Signals:         {signal_analysis['medium_signals']} victims
-  - Weak Signals:           {signal_analysis['weak_signals']} victims
+  - Strong Signals:         {signal_analysis[strong_signals]} victims
+  - Medium Signals:         {signal_analysis[medium_signals]} victims
+  - Weak Signals:           {signal_analysis[weak_signals]} victims
 
-Deteriorating Signals:      {len(signal_analysis['deteriorating_signals'])} victims
+Deteriorating Signals:      {deteriorating_count} victims
 
 ================================================================================
                          TIME-BASED ANALYSIS
 ================================================================================
 
-Detection Rate:             {time_patterns['detections_per_hour']:.2f} victims/hour
-Stale Data Instances:       {time_patterns['stale_data_count']} victims
-(No update for >{time_patterns['no_update_threshold_minutes']} minutes)
+Detection Rate:             {time_patterns[detections_per_hour]:.2f} victims/hour
+Stale Data Instances:       {time_patterns[stale_data_count]} victims
+(No update for >{time_patterns[no_update_threshold_minutes]} minutes)
 
 ================================================================================
                               RECOMMENDATIONS
 ================================================================================
 
 """
+
+
+def generate_operation_report(data_manager, analytics, stats):
+    """Generate comprehensive operation report"""
+    
+    rescue_metrics = analytics.calculate_rescue_rate()
+    efficiency = analytics.calculate_rescue_efficiency()
+    signal_analysis = analytics.analyze_signal_trends()
+    time_patterns = analytics.analyze_time_patterns()
+    coverage = analytics.get_coverage_area(
+        rescue_centre_lat=st.session_state.get('rescue_centre_lat', 13.022),
+        rescue_centre_lon=st.session_state.get('rescue_centre_lon', 77.587)
+    )
+    
+    parts = [_REPORT_TEMPLATE.format(
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        operator=st.session_state.operator_name,
+        operation_start=st.session_state.operation_start_time.strftime("%Y-%m-%d %H:%M:%S"),
+        distance_km=coverage.get('distance_km', 0),
+        deteriorating_count=len(signal_analysis['deteriorating_signals']),
+        stats=stats,
+        efficiency=efficiency,
+        rescue_metrics=rescue_metrics,
+        coverage=coverage,
+        signal_analysis=signal_analysis,
+        time_patterns=time_patterns
+    )]
     
     # Add recommendations based on data
     if stats['stranded'] > stats['rescued']:
-        report += "1. PRIORITY: Increase rescue team deployment - more victims stranded than rescued\n"
+        parts.append("1. PRIORITY: Increase rescue team deployment - more victims stranded than rescued\n")
     
     if signal_analysis['weak_signals'] > 5:
-        report += f"2. ALERT: {signal_analysis['weak_signals']} victims with weak signals - batteries may be dying\n"
+        parts.append(f"2. ALERT: {signal_analysis['weak_signals']} victims with weak signals - batteries may be dying\n")
     
     if time_patterns['stale_data_count'] > 0:
-        report += f"3. WARNING: {time_patterns['stale_data_count']} victims with stale data - verify status\n"
+        parts.append(f"3. WARNING: {time_patterns['stale_data_count']} victims with stale data - verify status\n")
     
     if efficiency['efficiency_percentage'] < 60:
-        report += "4. ATTENTION: Operation efficiency below 60% - review rescue procedures\n"
+        parts.append("4. ATTENTION: Operation efficiency below 60% - review rescue procedures\n")
     
     if len(signal_analysis['deteriorating_signals']) > 0:
-        report += f"5. URGENT: {len(signal_analysis['deteriorating_signals'])} victims with deteriorating signals\n"
+        parts.append(f"5. URGENT: {len(signal_analysis['deteriorating_signals'])} victims with deteriorating signals\n")
     
-    report += "\n================================================================================\n"
-    report += "                           END OF REPORT\n"
-    report += "================================================================================\n"
+    parts.append("\n================================================================================\n")
+    parts.append("                           END OF REPORT\n")
+    parts.append("================================================================================\n")
     
-    return report
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
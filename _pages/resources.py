@@ -0,0 +1,52 @@
+"""
+Shared Application Resources
+Process-wide objects and page loading, kept out of app.py because Streamlit
+re-executes the main script on every rerun while this module loads once
+"""
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import streamlit as st
+
+from modules import DataManager, SerialReader, PacketIngest
+from modules.websocket_server import broadcast_packets
+
+
+@st.cache_resource
+def get_data_manager() -> DataManager:
+    """Process-wide DataManager; every browser session sees the same victims"""
+    return DataManager()
+
+
+@st.cache_resource
+def get_serial_reader() -> SerialReader:
+    """Process-wide SerialReader, so only one thread ever owns the port"""
+    return SerialReader()
+
+
+@st.cache_resource
+def get_packet_ingest() -> PacketIngest:
+    """Process-wide packet consumer; applies and broadcasts packets in batches"""
+    return PacketIngest(get_data_manager(), on_batch=broadcast_packets)
+
+
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """Process-wide worker for slow one-off jobs (manual backups); one job at a time"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="background")
+
+
+@lru_cache(maxsize=None)
+def load_page(name: str):
+    """
+    Import a page module on first use
+    
+    Args:
+        name: Module name inside _pages (e.g. 'dashboard')
+        
+    Returns:
+        The page module; later reruns reuse the same object
+    """
+    return importlib.import_module(f"_pages.{name}")
@@ -7,19 +7,70 @@ import streamlit as st
 import serial.tools.list_ports
 from datetime import datetime
 import os
+import time
+from typing import List, Tuple, Optional, Dict, Any
 import streamlit.components.v1 as components
 
 import config
+from modules import SerialReader
+from _pages.resources import get_background_executor
+from _pages.widgets import fragment, get_cached_statistics, render_metric_grid
+from utils.helpers import format_operation_time
 from streamlit_js_eval import get_geolocation
 
 
+# Session state the settings page relies on; app.py sets most of these too,
+# this covers the keys only this page uses and sessions that skipped app init
+_DEFAULTS = {
+    'rescue_centre_lat': 13.022,
+    'rescue_centre_lon': 77.587,
+    'show_rescued': True,
+    'show_heatmap': False,
+    'location_just_detected': False,
+    'operator_id': ''
+}
+
+
+def _init_settings_state():
+    """Fill in missing settings defaults, once per session"""
+    
+    if st.session_state.get('_settings_initialized'):
+        return
+    
+    for key, value in _DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    st.session_state._settings_initialized = True
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_serial_ports() -> List[Tuple[str, str, str, Optional[str]]]:
+    """
+    Available serial ports, enumerated at most once every few seconds
+    
+    Port enumeration is an OS query (slow on Windows with many virtual
+    COM ports), so reruns within the TTL reuse the last result.
+    
+    Returns:
+        List of (device, description, hwid, manufacturer) tuples
+    """
+    return [
+        (port.device, port.description, port.hwid, getattr(port, 'manufacturer', None))
+        for port in serial.tools.list_ports.comports()
+    ]
+
+
 def render_settings():
     """Render the settings page"""
     
+    _init_settings_state()
+    
     # Page header
     st.title("System Settings & Configuration")
     st.markdown("Configure system parameters and manage operation settings")
     
+    # Each tab body is a fragment: a widget change reruns only its own tab,
+    # not the port scan, geolocation bridge and statistics of the others
+    
     # Create tabs for different setting categories
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "Serial Port",
@@ -45,6 +96,7 @@ def render_settings():
         render_system_management()
 
 
+@fragment
 def render_serial_settings():
     """Render serial port configuration settings"""
     
@@ -70,26 +122,27 @@ def render_serial_settings():
                 st.success("Disconnected")
                 st.rerun()
     
-    st.divider()
-    
     # Port selection
-    st.markdown("#### Port Selection")
+    st.markdown("---\n#### Port Selection")
     
     # Refresh ports button
     if st.button("🔄 Refresh Port List", help="Scan for available COM ports"):
+        get_serial_ports.clear()
         st.rerun()
     
-    # List available ports
-    available_ports = serial.tools.list_ports.comports()
-    port_list = [port.device for port in available_ports]
+    # List available ports (cached for a few seconds across reruns)
+    available_ports = get_serial_ports()
+    port_list = [device for device, _, _, _ in available_ports]
     
     if not port_list:
         st.error("No COM ports detected on this system")
         st.info("Please ensure your ground station hardware is connected via USB")
-        st.markdown("**Troubleshooting:**")
-        st.markdown("- Check USB cable connection")
-        st.markdown("- Install CH340/CP2102 USB drivers if needed")
-        st.markdown("- Try a different USB port")
+        st.markdown(
+            "**Troubleshooting:**\n"
+            "- Check USB cable connection\n"
+            "- Install CH340/CP2102 USB drivers if needed\n"
+            "- Try a different USB port"
+        )
         return
     
     col1, col2 = st.columns(2)
@@ -99,9 +152,8 @@ def render_serial_settings():
         st.markdown("**Select COM Port:**")
         
         # If no port selected, default to first available
-        default_index = 0
-        if st.session_state.serial_port and st.session_state.serial_port in port_list:
-            default_index = port_list.index(st.session_state.serial_port)
+        port_index = {device: i for i, device in enumerate(port_list)}
+        default_index = port_index.get(st.session_state.serial_port, 0)
         
         selected_port = st.selectbox(
             "COM Port",
@@ -111,18 +163,18 @@ def render_serial_settings():
             label_visibility="collapsed"
         )
         
-        # Update session state if changed
+        # Update session state if changed; the sidebar's connect button lives
+        # outside this fragment, so rerun the whole app to refresh it
         if selected_port != st.session_state.serial_port:
             st.session_state.serial_port = selected_port
-            st.success(f"Port set to {selected_port}")
-            st.info("Click 'Connect to Serial' in sidebar to connect")
+            st.rerun()
     
     with col2:
         # Baud rate selection
         st.markdown("**Select Baud Rate:**")
         
         baud_rates = config.AVAILABLE_BAUD_RATES
-        current_baud_index = baud_rates.index(st.session_state.baud_rate) if st.session_state.baud_rate in baud_rates else 4
+        current_baud_index = config.BAUD_RATE_INDEX.get(st.session_state.baud_rate, config.BAUD_RATE_INDEX[config.DEFAULT_BAUD_RATE])
         
         selected_baud = st.selectbox(
             "Baud Rate",
@@ -138,81 +190,144 @@ def render_serial_settings():
             st.success(f"Baud rate set to {selected_baud}")
             if st.session_state.serial_connected:
                 st.warning("Disconnect and reconnect for baud rate change to take effect")
+        
+        low_latency = st.checkbox(
+            "Low-latency mode",
+            value=st.session_state.low_latency,
+            help="Ask the USB-serial driver to pass each byte on immediately instead of batching (FTDI default: 16 ms)"
+        )
+        
+        if low_latency != st.session_state.low_latency:
+            st.session_state.low_latency = low_latency
+            if st.session_state.serial_connected:
+                st.warning("Disconnect and reconnect for this change to take effect")
     
     # Port information
-    st.markdown("#### Connected Devices")
-    
-    if available_ports:
-        for port in available_ports:
-            is_selected = (port.device == st.session_state.serial_port)
-            with st.expander(
-                f"{'✓ ' if is_selected else ''}{port.device} - {port.description}",
-                expanded=is_selected
-            ):
-                st.markdown(f"**Device:** {port.device}")
-                st.markdown(f"**Description:** {port.description}")
-                st.markdown(f"**Hardware ID:** {port.hwid}")
-                if hasattr(port, 'manufacturer') and port.manufacturer:
-                    st.markdown(f"**Manufacturer:** {port.manufacturer}")
-                
-                if is_selected:
-                    st.success("This port is currently selected")
+    render_connected_devices(available_ports)
     
     # Hardware specifications
-    st.divider()
-    st.markdown("#### Hardware Specifications")
+    st.markdown("---\n#### Hardware Specifications")
     
     col1, col2 = st.columns(2)
     
+    # One markdown block per column; "  \n" is a line break within a paragraph
     with col1:
-        st.markdown("**Victim Device:**")
-        st.caption(config.VICTIM_DEVICE)
-        
-        st.markdown("**Drone Device:**")
-        st.caption(config.DRONE_DEVICE)
+        st.markdown(
+            f"**Victim Device:**  \n{config.VICTIM_DEVICE}\n\n"
+            f"**Drone Device:**  \n{config.DRONE_DEVICE}"
+        )
     
     with col2:
-        st.markdown("**Ground Station:**")
-        st.caption(config.GROUND_STATION_DEVICE)
-        
-        st.markdown("**Protocol:**")
-        st.caption(config.COMMUNICATION_PROTOCOL)
+        st.markdown(
+            f"**Ground Station:**  \n{config.GROUND_STATION_DEVICE}\n\n"
+            f"**Protocol:**  \n{config.COMMUNICATION_PROTOCOL}"
+        )
     
     # Quick connection test
-    st.divider()
-    st.markdown("#### Quick Connection Test")
+    st.markdown("---\n#### Quick Connection Test")
     
     if st.session_state.serial_port and not st.session_state.serial_connected:
         if st.button("Test Connection", type="primary"):
             try:
                 test_serial = serial.Serial(st.session_state.serial_port, st.session_state.baud_rate, timeout=2)
+                if st.session_state.low_latency:
+                    SerialReader.apply_low_latency(test_serial)
                 test_serial.close()
                 st.success(f"✓ {st.session_state.serial_port} is accessible and ready!")
                 st.info("Go back to Dashboard and click 'Connect to Serial' in sidebar")
             except Exception as e:
                 st.error(f"✗ Connection test failed: {str(e)}")
-                st.markdown("**Troubleshooting:**")
-                st.markdown("- Close Arduino Serial Monitor if open")
-                st.markdown("- Check if another program is using the port")
-                st.markdown("- Verify correct COM port is selected")
+                st.markdown(
+                    "**Troubleshooting:**\n"
+                    "- Close Arduino Serial Monitor if open\n"
+                    "- Check if another program is using the port\n"
+                    "- Verify correct COM port is selected"
+                )
 
 
+@fragment
+def render_connected_devices(available_ports: List[Tuple[str, str, str, Optional[str]]]):
+    """
+    Render the detected ports; its toggle reruns only this section
+    
+    Args:
+        available_ports: Port tuples from get_serial_ports()
+    """
+    
+    st.markdown("#### Connected Devices")
+    
+    # The selected port is always shown; the rest (possibly dozens of
+    # virtual ports) only when asked for, and then at most MAX_PORTS_SHOWN
+    selected_ports = [port for port in available_ports if port[0] == st.session_state.serial_port]
+    other_ports = [port for port in available_ports if port[0] != st.session_state.serial_port]
+    
+    for port in selected_ports:
+        render_port_details(port, is_selected=True)
+    
+    if other_ports and st.toggle(f"Show all {len(other_ports)} other devices", key="show_other_ports"):
+        for port in other_ports[:config.MAX_PORTS_SHOWN]:
+            render_port_details(port, is_selected=False)
+        
+        if len(other_ports) > config.MAX_PORTS_SHOWN:
+            st.caption(f"{len(other_ports) - config.MAX_PORTS_SHOWN} more not shown")
+
+
+def render_port_details(port, is_selected: bool):
+    """
+    Render one serial port as an expander with its details
+    
+    Args:
+        port: (device, description, hwid, manufacturer) tuple from get_serial_ports()
+        is_selected: Whether this is the currently selected port
+    """
+    
+    device, description, hwid, manufacturer = port
+    with st.expander(
+        f"{'✓ ' if is_selected else ''}{device} - {description}",
+        expanded=is_selected
+    ):
+        details = [
+            f"**Device:** {device}",
+            f"**Description:** {description}",
+            f"**Hardware ID:** {hwid}"
+        ]
+        if manufacturer:
+            details.append(f"**Manufacturer:** {manufacturer}")
+        st.markdown("  \n".join(details))
+        
+        if is_selected:
+            st.success("This port is currently selected")
+
+
+def _sync_rescue_centre():
+    """Copy the station inputs into the location every page reads; runs only on edits"""
+    st.session_state.rescue_centre_lat = st.session_state.lat_box_input
+    st.session_state.rescue_centre_lon = st.session_state.lon_box_input
+
+
+@fragment
 def render_map_settings():
     """Render map configuration settings with auto-update capability"""
     
     st.subheader("Map Configuration")
     st.markdown("Configure default map settings and visualization options")
     
-    # 1. THE GEOLOCATION BRIDGE
-    # This must be called at the top level. It returns None until the browser provides data.
-    loc = get_geolocation()
-    
     st.markdown("#### Detect Your Location")
     st.info("Click 'Detect' to fetch your current GPS coordinates. Once coordinates appear in the green box, the input fields will update.")
 
-    # 2. DETECTION LOGIC
+    # 1. DETECTION REQUEST
+    # The button only raises a flag; the JS bridge is not mounted on other reruns
     if st.button("📍 Detect My Location", type="primary", use_container_width=True):
-        if loc:
+        st.session_state.request_geolocation = True
+        st.session_state.location_just_detected = False
+        st.rerun()
+
+    # 2. THE GEOLOCATION BRIDGE
+    # Returns None until the browser provides data, which triggers another rerun
+    if st.session_state.request_geolocation:
+        loc = get_geolocation()
+        
+        if loc and 'coords' in loc:
             # Extract coordinates from the JS bridge
             new_lat = float(loc['coords']['latitude'])
             new_lon = float(loc['coords']['longitude'])
@@ -220,58 +335,56 @@ def render_map_settings():
             # Update the source of truth in session state
             st.session_state.rescue_centre_lat = new_lat
             st.session_state.rescue_centre_lon = new_lon
+            # The keyed inputs below keep their own state, so seed it too
+            st.session_state.lat_box_input = new_lat
+            st.session_state.lon_box_input = new_lon
             st.session_state.location_just_detected = True
+            st.session_state.request_geolocation = False
             
             st.rerun() 
             # Rerun is vital to push the values into the number_input widgets below
         else:
-            st.warning("Requesting browser location... Please wait 2 seconds and click 'Detect' again. Ensure you allow location access in your browser popup.")
+            st.warning("Requesting browser location... Ensure you allow location access in your browser popup.")
 
-    if st.session_state.get('location_just_detected', False):
+    if st.session_state.location_just_detected:
         st.success(f"✓ Location Detected: {st.session_state.rescue_centre_lat:.6f}, {st.session_state.rescue_centre_lon:.6f}")
     
-    st.divider()
-    
     # 3. MANUAL OVERRIDE / INPUT BOXES
-    st.markdown("#### Rescue Station Location")
+    st.markdown("---\n#### Rescue Station Location")
     st.caption("These coordinates are used as the center point for the rescue mission.")
     
     col1, col2 = st.columns(2)
     
-    # Ensure variables exist in session state so number_input has a starting point
-    if 'rescue_centre_lat' not in st.session_state:
-        st.session_state.rescue_centre_lat = 13.022000
-    if 'rescue_centre_lon' not in st.session_state:
-        st.session_state.rescue_centre_lon = 77.587000
+    # The inputs own their keys; seed them from the station location when
+    # they are (re)created, e.g. after visiting another page
+    if 'lat_box_input' not in st.session_state:
+        st.session_state.lat_box_input = st.session_state.rescue_centre_lat
+    if 'lon_box_input' not in st.session_state:
+        st.session_state.lon_box_input = st.session_state.rescue_centre_lon
 
     with col1:
-        # We bind the 'value' to the session_state we just updated
-        res_lat = st.number_input(
+        st.number_input(
             "Rescue Station Latitude",
-            value=st.session_state.rescue_centre_lat,
             format="%.6f",
             step=0.000001,
-            key="lat_box_input"
+            key="lat_box_input",
+            on_change=_sync_rescue_centre
         )
-        st.session_state.rescue_centre_lat = res_lat
 
     with col2:
-        res_lon = st.number_input(
+        st.number_input(
             "Rescue Station Longitude",
-            value=st.session_state.rescue_centre_lon,
             format="%.6f",
             step=0.000001,
-            key="lon_box_input"
+            key="lon_box_input",
+            on_change=_sync_rescue_centre
         )
-        st.session_state.rescue_centre_lon = res_lon
 
     # Status indicator
     st.info(f"📡 Current Active Station: `{st.session_state.rescue_centre_lat:.6f}, {st.session_state.rescue_centre_lon:.6f}`")
     
-    st.divider()
-    
     # 4. API CONFIGURATION
-    st.markdown("#### API Configuration")
+    st.markdown("---\n#### API Configuration")
     if config.validate_api_key():
         st.success("Google Maps API key is configured")
         st.caption(f"API Key: {config.GOOGLE_MAPS_API_KEY[:10]}...{config.GOOGLE_MAPS_API_KEY[-4:]}")
@@ -279,10 +392,8 @@ def render_map_settings():
         st.error("Google Maps API key not configured")
         st.warning("Please add GOOGLE_MAPS_API_KEY to your .env file")
     
-    st.divider()
-
     # 5. MAP DISPLAY PREFERENCES
-    st.markdown("#### Map Display Preferences")
+    st.markdown("---\n#### Map Display Preferences")
     
     col_p1, col_p2 = st.columns(2)
     
@@ -290,18 +401,19 @@ def render_map_settings():
         # Simplified: Use the checkbox to update session state directly
         st.session_state.show_rescued = st.checkbox(
             "Show rescued victims by default",
-            value=st.session_state.get('show_rescued', True),
+            value=st.session_state.show_rescued,
             help="Display rescued victims on map by default"
         )
     
     with col_p2:
         st.session_state.show_heatmap = st.checkbox(
             "Show density heatmap by default",
-            value=st.session_state.get('show_heatmap', False),
+            value=st.session_state.show_heatmap,
             help="Display victim density heatmap by default"
         )
 
 
+@fragment
 def render_operator_settings():
     """Render operator configuration settings"""
     
@@ -327,34 +439,56 @@ def render_operator_settings():
     with col2:
         operator_id = st.text_input(
             "Operator ID (Optional)",
-            value=st.session_state.get('operator_id', ''),
+            value=st.session_state.operator_id,
             help="Unique identifier for the operator"
         )
         st.session_state.operator_id = operator_id
     
-    st.divider()
-    
     # Operation metadata
-    st.markdown("#### Current Operation")
+    render_operation_metrics()
+
+
+@fragment(run_every="30s")
+def render_operation_metrics():
+    """Render the current operation metrics; refreshes itself every 30 seconds"""
+    
+    render_metric_grid([
+        {'label': "Operation Start", 'value': st.session_state.operation_start_time.strftime("%H:%M:%S")},
+        {'label': "Duration", 'value': format_operation_time(st.session_state.operation_start_time)},
+        {'label': "Ground Station", 'value': "Active" if st.session_state.serial_connected else "Standby"}
+    ], header="<hr><h4>Current Operation</h4>")
+
+
+def _on_threshold_change(name: str, message: str):
+    """Copy an edited threshold input into session state and confirm it once"""
+    value = st.session_state[f"{name}_input"]
+    st.session_state[name] = value
+    st.toast(message.format(value))
+
+
+def _threshold_input(name: str, message: str) -> Dict[str, Any]:
+    """
+    Widget arguments binding a number_input to a threshold in session state
     
-    col1, col2, col3 = st.columns(3)
+    The input owns its own key (seeded from the threshold when created), so
+    the threshold itself survives when the settings page is not rendered.
     
-    with col1:
-        st.metric(
-            "Operation Start",
-            st.session_state.operation_start_time.strftime("%H:%M:%S")
-        )
+    Args:
+        name: Session state key of the threshold
+        message: Confirmation shown on change, with {} for the new value
+        
+    Returns:
+        Dict of key, on_change and args for st.number_input
+    """
     
-    with col2:
-        duration = datetime.now() - st.session_state.operation_start_time
-        hours = int(duration.total_seconds() / 3600)
-        minutes = int((duration.total_seconds() % 3600) / 60)
-        st.metric("Duration", f"{hours}h {minutes}m")
+    input_key = f"{name}_input"
+    if input_key not in st.session_state:
+        st.session_state[input_key] = st.session_state[name]
     
-    with col3:
-        st.metric("Ground Station", "Active" if st.session_state.serial_connected else "Standby")
+    return {'key': input_key, 'on_change': _on_threshold_change, 'args': (name, message)}
 
 
+@fragment
 def render_threshold_settings():
     """Render priority threshold configuration"""
     
@@ -372,39 +506,29 @@ def render_threshold_settings():
     
     with col1:
         st.markdown("**Strong Signal Threshold**")
-        rssi_strong = st.number_input(
+        st.number_input(
             "Strong Signal (greater than)",
-            value=st.session_state.rssi_strong_threshold,
             min_value=-120,
             max_value=-30,
             step=1,
-            help="Signals stronger than this are considered 'good'"
+            help="Signals stronger than this are considered 'good'",
+            **_threshold_input('rssi_strong_threshold', "Strong threshold updated to {} dBm")
         )
         
-        # Update session state immediately
-        if rssi_strong != st.session_state.rssi_strong_threshold:
-            st.session_state.rssi_strong_threshold = rssi_strong
-            st.success(f"Strong threshold updated to {rssi_strong} dBm")
-        
         st.caption(f"Current: {st.session_state.rssi_strong_threshold} dBm")
         st.caption("Typical range: -60 to -75 dBm")
     
     with col2:
         st.markdown("**Weak Signal Threshold**")
-        rssi_weak = st.number_input(
+        st.number_input(
             "Weak Signal (less than)",
-            value=st.session_state.rssi_weak_threshold,
             min_value=-120,
             max_value=-30,
             step=1,
-            help="Signals weaker than this are considered 'critical'"
+            help="Signals weaker than this are considered 'critical'",
+            **_threshold_input('rssi_weak_threshold', "Weak threshold updated to {} dBm")
         )
         
-        # Update session state immediately
-        if rssi_weak != st.session_state.rssi_weak_threshold:
-            st.session_state.rssi_weak_threshold = rssi_weak
-            st.success(f"Weak threshold updated to {rssi_weak} dBm")
-        
         st.caption(f"Current: {st.session_state.rssi_weak_threshold} dBm")
         st.caption("Typical range: -85 to -95 dBm")
     
@@ -412,36 +536,27 @@ def render_threshold_settings():
     if st.session_state.rssi_weak_threshold >= st.session_state.rssi_strong_threshold:
         st.error("Error: Weak signal threshold must be less than strong signal threshold")
     
-    st.divider()
-    
     # Time thresholds
-    st.markdown("#### Time-Based Thresholds")
+    st.markdown("---\n#### Time-Based Thresholds")
     st.caption("Time limits for detecting stale or critical data")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**Critical Time Threshold**")
-        time_critical = st.number_input(
+        st.number_input(
             "High Priority After (minutes)",
-            value=st.session_state.time_critical_threshold,
             min_value=1,
             max_value=60,
             step=1,
-            help="No update for this long = high priority"
+            help="No update for this long = high priority",
+            **_threshold_input('time_critical_threshold', "Critical time threshold updated to {} minutes")
         )
         
-        # Update session state immediately
-        if time_critical != st.session_state.time_critical_threshold:
-            st.session_state.time_critical_threshold = time_critical
-            st.success(f"Critical time threshold updated to {time_critical} minutes")
-        
         st.caption(f"Current: {st.session_state.time_critical_threshold} minutes")
     
-    st.divider()
-    
     # Priority summary
-    st.markdown("#### Priority Classification Summary")
+    st.markdown("---\n#### Priority Classification Summary")
     
     st.markdown(f"""
     **HIGH Priority** assigned when:
@@ -458,54 +573,149 @@ def render_threshold_settings():
     """)
 
 
-def render_system_management():
-    """Render system management and data operations"""
+def _backup_mtime() -> Optional[float]:
+    """
+    Modification time of the backup file, re-stat'ed at most every 2 seconds
     
-    st.subheader("System Management")
-    st.markdown("Manage system data, backups, and perform maintenance operations")
+    The result is kept in session state so repeated reruns (and slow
+    network filesystems) do not hit the disk each time.
     
-    # System information
-    st.markdown("#### System Information")
+    Returns:
+        mtime as a timestamp, or None if there is no backup file
+    """
     
-    data_manager = st.session_state.data_manager
-    stats = data_manager.get_statistics()
+    checked_at, mtime = st.session_state.get('_backup_stat', (None, None))
+    now = time.monotonic()
     
-    col1, col2, col3, col4 = st.columns(4)
+    if checked_at is None or now - checked_at > 2:
+        try:
+            mtime = os.path.getmtime(config.BACKUP_FILE_PATH)
+        except OSError:
+            mtime = None
+        st.session_state._backup_stat = (now, mtime)
     
-    with col1:
-        st.metric("Total Records", stats['total'])
+    return mtime
+
+
+@fragment
+def render_reset_operations(data_manager):
+    """
+    Render the reset controls; ticking the confirmation reruns only this section
     
-    with col2:
-        st.metric("Active Records", stats['stranded'] + stats['enroute'])
+    Args:
+        data_manager: DataManager instance
+    """
+    
+    with st.expander("Reset Operations (Use with Caution)"):
+        st.warning("These operations will permanently delete data")
+        
+        # Reset all data
+        st.markdown("**Reset All Victim Data**")
+        st.caption("Permanently deletes all victim records and statistics")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            confirm_reset = st.checkbox(
+                "I understand this will delete all data",
+                key="confirm_reset_data"
+            )
+        
+        with col2:
+            if st.button(
+                "Reset All Data",
+                type="primary",
+                disabled=not confirm_reset,
+                use_container_width=True
+            ):
+                data_manager.reset_all_data()
+                data_manager.reset_stream_counters()
+                st.session_state.operation_start_time = datetime.now()
+                st.success("All data has been reset")
+                st.rerun()
+        
+        # Reset statistics only
+        st.markdown("---\n**Reset Statistics Only**")
+        st.caption("Reset packet counters and error counts (keeps victim data)")
+        
+        if st.button("Reset Statistics", type="secondary", use_container_width=True):
+            data_manager.reset_stream_counters()
+            st.success("Statistics reset")
+            st.rerun()
+
+
+def render_backup_status():
+    """Render the state of a backup started with 'Save Backup Now'"""
+    
+    future = st.session_state.get('_backup_future')
+    if future is None:
+        return
     
-    with col3:
-        st.metric("Packets Received", st.session_state.packet_count)
+    if not future.done():
+        _poll_backup_status()
+        return
+    
+    st.session_state._backup_future = None
+    st.session_state.pop('_backup_stat', None)
+    if future.result():
+        st.success(f"Backup saved to {config.BACKUP_FILE_PATH}")
+    else:
+        st.error("Backup failed")
+
+
+@fragment(run_every="1s")
+def _poll_backup_status():
+    """Show a running status until the backup finishes, then rerun to report it"""
+    
+    if st.session_state._backup_future.done():
+        st.rerun()
+    
+    st.status("Saving backup...", state="running")
+
+
+@fragment
+def render_system_management():
+    """Render system management and data operations"""
+    
+    st.subheader("System Management")
+    st.markdown("Manage system data, backups, and perform maintenance operations")
     
-    with col4:
-        st.metric("Parse Errors", st.session_state.error_count)
+    # System information
+    data_manager = st.session_state.data_manager
+    stats = get_cached_statistics(data_manager)
     
-    st.divider()
+    # Heading and four metrics as one CSS grid block instead of st.columns
+    render_metric_grid([
+        {'label': "Total Records", 'value': stats['total']},
+        {'label': "Active Records", 'value': stats['stranded'] + stats['enroute']},
+        {'label': "Packets Received", 'value': data_manager.packet_count},
+        {'label': "Parse Errors", 'value': data_manager.error_count}
+    ], header="<h4>System Information</h4>")
     
     # Data management
-    st.markdown("#### Data Management")
+    st.markdown("---\n#### Data Management")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**Backup Operations**")
         
-        if st.button("Save Backup Now", type="secondary", use_container_width=True):
-            success = data_manager.save_to_file()
-            if success:
-                st.success(f"Backup saved to {config.BACKUP_FILE_PATH}")
-            else:
-                st.error("Backup failed")
+        saving = st.session_state.get('_backup_future') is not None
+        if st.button("Save Backup Now", type="secondary", use_container_width=True, disabled=saving):
+            # Write on the shared worker thread so a large backup does not hold
+            # up the page; saves from several sessions run one after another
+            st.session_state._backup_future = get_background_executor().submit(data_manager.save_to_file)
+        
+        render_backup_status()
         
         st.caption("Manual backup of all victim data")
         
-        # Check last backup time
+        # Check last backup time; fall back to a backup file left on disk
+        backup_mtime = _backup_mtime()
         if data_manager.last_backup_time:
             st.info(f"Last backup: {data_manager.last_backup_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        elif backup_mtime is not None:
+            st.info(f"Backup file from {datetime.fromtimestamp(backup_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
         else:
             st.warning("No backup performed yet")
     
@@ -513,7 +723,7 @@ def render_system_management():
         st.markdown("**Data Restore**")
         
         if st.button("Load from Backup", type="secondary", use_container_width=True):
-            if os.path.exists(config.BACKUP_FILE_PATH):
+            if backup_mtime is not None:
                 success = data_manager.load_from_file()
                 if success:
                     st.success("Data restored from backup")
@@ -525,69 +735,30 @@ def render_system_management():
         
         st.caption("Restore victim data from backup file")
     
-    st.divider()
-    
     # Dangerous operations
-    st.markdown("#### System Reset")
+    st.markdown("---\n#### System Reset")
     st.error("⚠️ DANGER ZONE - These operations are irreversible")
     
-    with st.expander("Reset Operations (Use with Caution)"):
-        st.warning("These operations will permanently delete data")
-        
-        # Reset all data
-        st.markdown("**Reset All Victim Data**")
-        st.caption("Permanently deletes all victim records and statistics")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            confirm_reset = st.checkbox(
-                "I understand this will delete all data",
-                key="confirm_reset_data"
-            )
-        
-        with col2:
-            if st.button(
-                "Reset All Data",
-                type="primary",
-                disabled=not confirm_reset,
-                use_container_width=True
-            ):
-                data_manager.reset_all_data()
-                st.session_state.packet_count = 0
-                st.session_state.error_count = 0
-                st.session_state.operation_start_time = datetime.now()
-                st.success("All data has been reset")
-                st.rerun()
-        
-        st.divider()
-        
-        # Reset statistics only
-        st.markdown("**Reset Statistics Only**")
-        st.caption("Reset packet counters and error counts (keeps victim data)")
-        
-        if st.button("Reset Statistics", type="secondary", use_container_width=True):
-            st.session_state.packet_count = 0
-            st.session_state.error_count = 0
-            st.success("Statistics reset")
-            st.rerun()
-    
-    st.divider()
+    render_reset_operations(data_manager)
     
     # Application information
-    st.markdown("#### Application Information")
+    st.markdown("---\n#### Application Information")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("**Version:** 1.0.0")
-        st.markdown("**Build:** Production")
-        st.markdown("**Framework:** Streamlit")
+        st.markdown(
+            "**Version:** 1.0.0  \n"
+            "**Build:** Production  \n"
+            "**Framework:** Streamlit"
+        )
     
     with col2:
-        st.markdown("**Developer:** FalconResQ Team")
-        st.markdown("**License:** Proprietary")
-        st.markdown("**Support:** Technical Support Available")
+        st.markdown(
+            "**Developer:** FalconResQ Team  \n"
+            "**License:** Proprietary  \n"
+            "**Support:** Technical Support Available"
+        )
     
     # File paths
     st.markdown("#### File Locations")
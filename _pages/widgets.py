@@ -0,0 +1,178 @@
+"""
+Shared Page Widgets
+Rendering helpers used by more than one page
+"""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import html
+import os
+import queue
+import time
+from typing import Dict, Any, List
+
+from modules import DataManager
+from modules.websocket_server import get_websocket_server
+import config
+
+# st.fragment (1.37+) or its experimental name (1.33+); None on older Streamlit
+_st_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+
+def fragment(func=None, *, run_every=None):
+    """
+    Run a self-contained section as a fragment where Streamlit supports it
+    
+    Usable bare (@fragment) or with arguments (@fragment(run_every="30s")).
+    On Streamlit without fragments the function is returned unchanged and
+    simply reruns with the page.
+    
+    Args:
+        func: Function to decorate
+        run_every: Optional interval for rerunning the fragment on its own
+        
+    Returns:
+        The decorated function, or a decorator when func is None
+    """
+    
+    if _st_fragment is None:
+        return func if func is not None else (lambda f: f)
+    return _st_fragment(func, run_every=run_every)
+
+
+@st.cache_data(
+    max_entries=16,
+    show_spinner=False,
+    hash_funcs={DataManager: lambda dm: (id(dm), dm.version)}
+)
+def get_cached_statistics(data_manager: DataManager) -> Dict[str, Any]:
+    """
+    Victim statistics, recomputed only when the data version changes
+    
+    Args:
+        data_manager: DataManager instance
+        
+    Returns:
+        Dict from DataManager.get_statistics()
+    """
+    return data_manager.get_statistics()
+
+
+def drain_packet_queue() -> int:
+    """
+    Empty the session's packet queue
+    
+    PacketIngest has already applied each batch to the DataManager; the
+    queue only signals that the page is behind the data.
+    
+    Returns:
+        Number of packets that were pending
+    """
+    
+    packet_queue = st.session_state.get('packet_queue')
+    drained = 0
+    
+    while packet_queue is not None:
+        try:
+            drained += len(packet_queue.get_nowait())
+        except queue.Empty:
+            break
+    
+    return drained
+
+
+# Browser-side WebSocket subscriber (static HTML, no build step)
+_packet_listener = components.declare_component(
+    "packet_listener",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "packet_listener")
+)
+
+
+def listen_for_packets() -> bool:
+    """
+    Have the browser rerun the app when the WebSocket server pushes packets
+    
+    The component holds one WebSocket connection per browser tab and changes
+    its value at most once per config.RERUN_MIN_INTERVAL, so an idle page
+    costs nothing until data actually arrives. Its value reports whether the
+    browser is connected; until it is (server not bound, or not reachable
+    from the operator's machine) the pages keep using rerun_on_new_packets.
+    
+    Returns:
+        True if push updates are active for this session
+    """
+    
+    server = get_websocket_server()
+    if not server.running:
+        return False
+    
+    state = _packet_listener(
+        port=server.port,
+        min_interval_ms=int(config.RERUN_MIN_INTERVAL * 1000),
+        key="packet_listener",
+        default=None
+    )
+    return bool(state and state.get('connected'))
+
+
+def rerun_on_new_packets():
+    """
+    Rerun the app if packets arrived while the page was rendering
+    
+    Any number of packets costs one rerun, and reruns are spaced at least
+    config.RERUN_MIN_INTERVAL apart. Call it last on pages that follow the
+    live data. Does nothing while the browser listener pushes updates.
+    """
+    
+    if st.session_state.get('_packet_push'):
+        return
+    
+    packet_queue = st.session_state.get('packet_queue')
+    if packet_queue is None or packet_queue.empty():
+        return
+    
+    wait = config.RERUN_MIN_INTERVAL - (time.monotonic() - st.session_state.get('_last_rerun_ts', 0.0))
+    if wait > 0:
+        time.sleep(wait)
+    
+    st.session_state._last_rerun_ts = time.monotonic()
+    st.rerun()
+
+
+def render_metric_grid(metrics: List[Dict[str, Any]], columns: int = None, header: str = ""):
+    """
+    Render a row of metrics as one HTML block instead of one st.metric per column
+    
+    Args:
+        metrics: List of dicts with 'label' and 'value', optional 'delta'
+                 (number or string, a leading '-' means negative) and 'help'
+        columns: Number of grid columns (defaults to one per metric)
+        header: Optional HTML (separator, heading) emitted in the same block
+    """
+    
+    cells = []
+    for metric in metrics:
+        tooltip = html.escape(str(metric.get('help', '')), quote=True)
+        cell = (
+            f'<div title="{tooltip}" style="padding:0.25rem 0;">'
+            f'<div style="font-size:0.875rem;opacity:0.7;">{html.escape(str(metric["label"]))}</div>'
+            f'<div style="font-size:2rem;line-height:1.3;">{html.escape(str(metric["value"]))}</div>'
+        )
+        
+        delta = metric.get('delta')
+        if delta is not None:
+            negative = delta < 0 if isinstance(delta, (int, float)) else str(delta).startswith('-')
+            colour = "#ff2b2b" if negative else "#09ab3b"
+            arrow = "&#8595;" if negative else "&#8593;"
+            cell += (
+                f'<div style="font-size:0.875rem;color:{colour};">'
+                f'{arrow} {html.escape(str(delta).lstrip("-"))}</div>'
+            )
+        
+        cells.append(cell + '</div>')
+    
+    st.markdown(
+        f'{header}<div style="display:grid;grid-template-columns:repeat({columns or len(metrics)},minmax(0,1fr));'
+        f'gap:1rem;">{"".join(cells)}</div>',
+        unsafe_allow_html=True
+    )
@@ -5,19 +5,23 @@ Handles navigation, sidebar, and global state initialization
 
 import streamlit as st
 from datetime import datetime
-import threading
-import time
+import queue
 
 # Import configuration
 import config
 
-# Import modules
-from modules.serial_reader import SerialReader
-from modules.data_manager import DataManager
-from modules.websocket_server import start_websocket_server, broadcast_packet
-from utils.helpers import format_time_ago
+# Import modules (each loads once per process; process-wide objects and page
+# imports live in _pages.resources so reruns do not rebuild them)
+from modules.analytics import Analytics
+from modules.websocket_server import start_websocket_server
+from utils.helpers import format_operation_time
+from utils.log import get_logger
+from _pages.resources import get_data_manager, get_serial_reader, get_packet_ingest, load_page
+from _pages.widgets import (
+    drain_packet_queue, get_cached_statistics, listen_for_packets, render_metric_grid
+)
 
-# Page Configuration
+# Page Configuration (Streamlit expects it on every run, before other elements)
 st.set_page_config(
     page_title="FalconResQ: Disaster Management Ground Station",
     layout="wide",
@@ -32,194 +36,92 @@ By: Asshray Sudhakara ECE'27
     }
 )
 
-# ==================== GEOLOCATION DETECTION ====================
-
-def get_user_location():
-    """Get user's current location using browser geolocation"""
-    
-    # JavaScript to get geolocation
-    location_js = """
-    <script>
-    function getLocation() {
-        if (navigator.geolocation) {
-            navigator.geolocation.getCurrentPosition(
-                function(position) {
-                    window.parent.postMessage({
-                        type: 'streamlit:setComponentValue',
-                        lat: position.coords.latitude,
-                        lon: position.coords.longitude
-                    }, '*');
-                },
-                function(error) {
-                    console.log('Geolocation error:', error);
-                }
-            );
-        }
-    }
-    getLocation();
-    </script>
-    """
-    return location_js
+logger = get_logger("app")
 
 # ==================== SESSION STATE INITIALIZATION ====================
 
-def initialize_session_state():
-    """Initialize all session state variables"""
-    
-    # Data Manager
-    if 'data_manager' not in st.session_state:
-        st.session_state.data_manager = DataManager()
-    
-    # Serial Reader
-    if 'serial_reader' not in st.session_state:
-        st.session_state.serial_reader = SerialReader()
-    
-    # Connection State
-    if 'serial_connected' not in st.session_state:
-        st.session_state.serial_connected = False
-    
+# Plain session values; filled in once per session by initialize_session_state
+_SESSION_DEFAULTS = {
     # Operator Info
-    if 'operator_name' not in st.session_state:
-        st.session_state.operator_name = "Operator"
-    
-    # Operation Tracking
-    if 'operation_start_time' not in st.session_state:
-        st.session_state.operation_start_time = datetime.now()
-    
-    # Statistics
-    if 'packet_count' not in st.session_state:
-        st.session_state.packet_count = 0
-    
-    if 'error_count' not in st.session_state:
-        st.session_state.error_count = 0
-    
-    if 'last_packet_time' not in st.session_state:
-        st.session_state.last_packet_time = None
+    'operator_name': "Operator",
     
     # UI State
-    if 'show_rescued' not in st.session_state:
-        st.session_state.show_rescued = True
+    'show_rescued': True,
+    'show_heatmap': False,
+    'show_priority_only': False,
     
-    if 'show_heatmap' not in st.session_state:
-        st.session_state.show_heatmap = False
+    # Serial Port Settings - NO DEFAULT PORT, user must select
+    'serial_port': None,
+    'baud_rate': 115200,  # Default but user can change
+    'low_latency': config.SERIAL_LOW_LATENCY,
     
-    if 'show_priority_only' not in st.session_state:
-        st.session_state.show_priority_only = False
+    # Map Settings - fallback until geolocation is detected
+    'map_center': [13.022, 77.587],
+    'map_zoom': 14,
     
-    # Serial Port Settings - NO DEFAULTS
-    if 'serial_port' not in st.session_state:
-        st.session_state.serial_port = None  # User must select
+    # Rescue Centre Location - dynamically loaded from browser geolocation
+    'rescue_centre_lat': 13.022,
+    'rescue_centre_lon': 77.587,
+    'location_detected': False,
     
-    if 'baud_rate' not in st.session_state:
-        st.session_state.baud_rate = 115200  # Default but user can change
+    # Browser geolocation is only requested after 'Detect My Location'
+    'request_geolocation': False,
     
-    # Map Settings - Use geolocation or fallback
-    if 'map_center' not in st.session_state:
-        # Try to get user's location, fallback to default
-        st.session_state.map_center = [13.022, 77.587]  # Fallback
-        st.session_state.location_detected = False
+    # Dynamic threshold settings
+    'rssi_strong_threshold': config.THRESHOLDS.rssi_strong,
+    'rssi_weak_threshold': config.THRESHOLDS.rssi_weak,
+    'time_critical_threshold': config.THRESHOLDS.time_critical,
     
-    # Rescue Centre Location - dynamically loaded from browser geolocation
-    if 'rescue_centre_lat' not in st.session_state:
-        st.session_state.rescue_centre_lat = 13.022
+    '_last_rerun_ts': 0.0
+}
+
+
+def initialize_session_state():
+    """Initialize all session state variables"""
     
-    if 'rescue_centre_lon' not in st.session_state:
-        st.session_state.rescue_centre_lon = 77.587
+    # Connection State - follows the shared reader, which another session
+    # may have connected or disconnected, so it is refreshed on every run
+    if st.session_state.get('_initialized'):
+        st.session_state.serial_connected = bool(st.session_state.serial_reader.is_connected())
+        return
     
-    # Check if user has allowed geolocation via settings
-    # The JavaScript in settings.py stores location in browser localStorage
-    if 'location_detected' not in st.session_state:
-        st.session_state.location_detected = False
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     
-    if 'map_zoom' not in st.session_state:
-        st.session_state.map_zoom = 14
+    # Shared objects
+    st.session_state.setdefault('data_manager', get_data_manager())
+    st.session_state.setdefault('serial_reader', get_serial_reader())
     
-    # ==================== DYNAMIC THRESHOLD SETTINGS ====================
-    # RSSI Thresholds
-    if 'rssi_strong_threshold' not in st.session_state:
-        st.session_state.rssi_strong_threshold = config.RSSI_STRONG_THRESHOLD
+    # Analytics (kept across reruns so its per-data-version results are reused)
+    if 'analytics' not in st.session_state:
+        st.session_state.analytics = Analytics(st.session_state.data_manager)
     
-    if 'rssi_weak_threshold' not in st.session_state:
-        st.session_state.rssi_weak_threshold = config.RSSI_WEAK_THRESHOLD
+    # Operation Tracking
+    if 'operation_start_time' not in st.session_state:
+        st.session_state.operation_start_time = datetime.now()
     
-    # Time-based Thresholds
-    if 'time_critical_threshold' not in st.session_state:
-        st.session_state.time_critical_threshold = config.TIME_CRITICAL_THRESHOLD
+    # Packet batches applied since the page last rendered; PacketIngest only
+    # signals through this queue, reruns are coalesced by the pages
+    if 'packet_queue' not in st.session_state:
+        st.session_state.packet_queue = queue.Queue(maxsize=config.PACKET_QUEUE_SIZE)
+        get_packet_ingest().subscribe(st.session_state.packet_queue)
     
-    # Force rerun flag for real-time updates
-    if 'force_rerun' not in st.session_state:
-        st.session_state.force_rerun = False
+    # WebSocket Server for real-time updates (one per process)
+    start_websocket_server()
     
-    # WebSocket Server for real-time updates
-    if 'ws_server_started' not in st.session_state:
-        start_websocket_server()
-        st.session_state.ws_server_started = True
+    st.session_state.serial_connected = bool(st.session_state.serial_reader.is_connected())
+    st.session_state._initialized = True
 
 # Initialize session state
 initialize_session_state()
 
-# Check if we need to rerun due to new packet - do this EARLY for fast updates
-if st.session_state.get('force_rerun', False):
-    st.session_state.force_rerun = False
-    st.rerun()
-
-# ==================== AUTO-LOAD GEOLOCATION FROM BROWSER ====================
-# Read geolocation from browser localStorage (set by settings page)
-import streamlit.components.v1 as components
-
-# This component reads from browser localStorage and updates rescue centre location
-auto_geolocation_component = """
-<script>
-// Try to get saved location from browser localStorage
-(function() {
-    try {
-        const userLat = parseFloat(localStorage.getItem('user_lat'));
-        const userLon = parseFloat(localStorage.getItem('user_lon'));
-        
-        if (userLat && userLon && !isNaN(userLat) && !isNaN(userLon)) {
-            // Found valid geolocation, mark it as detected
-            sessionStorage.setItem('geo_lat', userLat.toString());
-            sessionStorage.setItem('geo_lon', userLon.toString());
-        }
-    } catch(e) {
-        // Geolocation not available
-    }
-})();
-</script>
-"""
+# This run renders everything received so far; only packets arriving while it
+# renders should cause another rerun (see rerun_on_new_packets)
+drain_packet_queue()
 
-# Try to load geolocation from browser
-try:
-    components.html(auto_geolocation_component, height=0)
-    
-    # Create a container to check geolocation status
-    if st.session_state.location_detected:
-        # User has clicked to detect location in settings
-        # Try to update from browser's detected location
-        geolocation_check = """
-        <script>
-        (function() {
-            try {
-                const userLat = parseFloat(localStorage.getItem('user_lat'));
-                const userLon = parseFloat(localStorage.getItem('user_lon'));
-                
-                if (userLat && userLon && !isNaN(userLat) && !isNaN(userLon)) {
-                    // Update parent window (Streamlit) about the new location
-                    window.parent.postMessage({
-                        type: 'streamlit:setComponentValue',
-                        data: {lat: userLat, lon: userLon}
-                    }, '*');
-                }
-            } catch(e) {}
-        })();
-        </script>
-        """
-        try:
-            components.html(geolocation_check, height=0)
-        except:
-            pass
-except:
-    pass
+# New packets are pushed to the browser over the WebSocket server, which then
+# reruns the app; without it the pages fall back to rerun_on_new_packets
+st.session_state._packet_push = listen_for_packets()
 
 # ==================== SIDEBAR ====================
 
@@ -233,7 +135,7 @@ def render_sidebar():
         st.subheader("Navigation")
         page = st.radio(
             "Select Page",
-            ["Dashboard", "Analytics", "Export Data", "Settings"],
+            list(PAGE_RENDERERS),
             label_visibility="collapsed"
         )
         
@@ -264,44 +166,32 @@ def render_sidebar():
             if st.button("Connect to Serial", use_container_width=True, type="primary", 
                         disabled=(st.session_state.serial_port is None)):
                 try:
-                    # Start serial reading in background thread
-                    def serial_callback(packet):
-                        try:
-                            data_manager.add_or_update_victim(packet)
-                            # Safely update session state counters
-                            try:
-                                st.session_state.packet_count += 1
-                                st.session_state.last_packet_time = datetime.now()
-                            except:
-                                pass  # Session state not ready yet
-                            # Broadcast to WebSocket clients
-                            broadcast_packet(packet)
-                            # Trigger rerun on new packet
-                            st.session_state.force_rerun = True
-                        except Exception as e:
-                            print(f"Error in serial callback: {e}")
+                    # Updates, broadcasts and page signals happen in batches
+                    # on the ingest thread; the reader thread only enqueues
+                    packet_ingest = get_packet_ingest()
                     
-                    def error_callback():
+                    # Start serial reading in background thread; counters
+                    # live on the DataManager, not in st.session_state
+                    def serial_callback(packet):
                         try:
-                            # Safely update error counter (ignore if not ready)
-                            try:
-                                st.session_state.error_count += 1
-                            except:
-                                pass
-                        except Exception as e:
-                            print(f"Error in error callback: {e}")
+                            packet_ingest.submit(packet)
+                            data_manager.record_packet()
+                        except Exception:
+                            logger.exception("Error in serial callback")
                     
                     success = serial_reader.start_reading(
                         port=st.session_state.serial_port,
                         baudrate=st.session_state.baud_rate,
                         on_packet_received=serial_callback,
-                        on_error=error_callback
+                        on_error=data_manager.record_error,
+                        low_latency=st.session_state.low_latency
                     )
                     
                     if success:
                         st.session_state.serial_connected = True
                         st.success("Connected successfully!")
-                        time.sleep(0.5)
+                        # Returns as soon as the reader has polled the port
+                        serial_reader.ready.wait(timeout=0.5)
                         st.rerun()
                     else:
                         st.error("Failed to connect")
@@ -309,47 +199,49 @@ def render_sidebar():
                 except Exception as e:
                     st.error(f"Connection error: {str(e)}")
         
-        st.divider()
-        
-        # Quick Statistics
-        st.subheader("Quick Statistics")
-        
-        stats = data_manager.get_statistics()
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total", stats['total'])
-            st.metric("Stranded", stats['stranded'])
-        with col2:
-            st.metric("Rescued", stats['rescued'])
-            st.metric("En-Route", stats['enroute'])
+        # Quick Statistics - each section (divider, heading, metrics) is one
+        # HTML block, so a rerun sends three elements instead of fourteen
+        stats = get_cached_statistics(data_manager)
         
-        st.divider()
+        render_metric_grid([
+            {'label': "Total", 'value': stats['total']},
+            {'label': "Rescued", 'value': stats['rescued']},
+            {'label': "Stranded", 'value': stats['stranded']},
+            {'label': "En-Route", 'value': stats['enroute']}
+        ], columns=2, header="<hr><h3>Quick Statistics</h3>")
         
         # Data Stream Info
-        st.subheader("Data Stream")
-        
-        st.metric("Packets", st.session_state.packet_count)
-        st.metric("Errors", st.session_state.error_count)
-        
-        if st.session_state.last_packet_time:
-            seconds_ago = (datetime.now() - st.session_state.last_packet_time).total_seconds()
-            st.metric("Last Packet", f"{int(seconds_ago)}s ago")
+        last_packet_time = data_manager.last_packet_time
+        if last_packet_time:
+            seconds_ago = (datetime.now() - last_packet_time).total_seconds()
+            last_packet = f"{int(seconds_ago)}s ago"
         else:
-            st.metric("Last Packet", "Never")
+            last_packet = "Never"
         
-        st.divider()
+        render_metric_grid([
+            {'label': "Packets", 'value': data_manager.packet_count},
+            {'label': "Errors", 'value': data_manager.error_count},
+            {'label': "Last Packet", 'value': last_packet}
+        ], columns=1, header="<hr><h3>Data Stream</h3>")
         
         # Operation Duration
-        duration = datetime.now() - st.session_state.operation_start_time
-        hours = int(duration.total_seconds() / 3600)
-        minutes = int((duration.total_seconds() % 3600) / 60)
-        st.metric("Operation Time", f"{hours}h {minutes}m")
+        render_metric_grid([
+            {'label': "Operation Time", 'value': format_operation_time(st.session_state.operation_start_time)}
+        ], header="<hr>")
         
         return page
 
 # ==================== MAIN APPLICATION ====================
 
+# Sidebar label -> page renderer (page modules load only when first selected)
+PAGE_RENDERERS = {
+    "Dashboard": lambda: load_page("dashboard").render_dashboard(),
+    "Analytics": lambda: load_page("analytics").render_analytics(),
+    "Export Data": lambda: load_page("export").render_export(),
+    "Settings": lambda: load_page("settings").render_settings()
+}
+
+
 def main():
     """Main application logic"""
     
@@ -357,21 +249,7 @@ def main():
     selected_page = render_sidebar()
     
     # Route to appropriate page
-    if selected_page == "Dashboard":
-        from _pages import dashboard
-        dashboard.render_dashboard()
-    
-    elif selected_page == "Analytics":
-        from _pages import analytics
-        analytics.render_analytics()
-    
-    elif selected_page == "Export Data":
-        from _pages import export
-        export.render_export()
-    
-    elif selected_page == "Settings":
-        from _pages import settings
-        settings.render_settings()
+    PAGE_RENDERERS[selected_page]()
 
 # ==================== RUN APPLICATION ====================
 
@@ -4,6 +4,9 @@ Loads settings from environment variables and defines constants
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -27,9 +30,19 @@ DEFAULT_BAUD_RATE = 115200  # Default, but user can change
 
 SERIAL_TIMEOUT = 1  # seconds
 
+# Ask the USB-serial driver to deliver bytes immediately instead of
+# batching them (FTDI default latency timer is 16 ms)
+SERIAL_LOW_LATENCY = True
+
 # Available baud rates for selection
 AVAILABLE_BAUD_RATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
 
+# Position of each baud rate in AVAILABLE_BAUD_RATES, for selectbox defaults
+BAUD_RATE_INDEX = {rate: i for i, rate in enumerate(AVAILABLE_BAUD_RATES)}
+
+# Most serial ports listed on the settings page when showing all devices
+MAX_PORTS_SHOWN = 20
+
 # ==================== MAP SETTINGS ====================
 
 # Default map center - Will be overridden by user's location
@@ -38,6 +51,10 @@ DEFAULT_MAP_CENTER_LAT = float(os.getenv('MAP_CENTER_LAT', '13.022'))
 DEFAULT_MAP_CENTER_LON = float(os.getenv('MAP_CENTER_LON', '77.587'))
 DEFAULT_MAP_ZOOM = int(os.getenv('MAP_ZOOM', '14'))
 
+# Above this many victims the analytics overview uses a WebGL (pydeck) map
+# instead of folium, which serializes every marker as its own JS object
+LARGE_MAP_VICTIM_THRESHOLD = 1000
+
 # Map tile providers (fallback options)
 MAP_TILE_PROVIDERS = {
     'google_roadmap': 'https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}',
@@ -48,13 +65,25 @@ MAP_TILE_PROVIDERS = {
 
 # ==================== PRIORITY THRESHOLDS ====================
 
-# RSSI (Signal Strength) thresholds in dBm
-RSSI_STRONG_THRESHOLD = -70  # Signal stronger than this is "good"
-RSSI_WEAK_THRESHOLD = -85    # Signal weaker than this is "critical"
+@dataclass(frozen=True, slots=True)
+class Thresholds:
+    """Default priority thresholds; sessions copy the ones they edit"""
+    
+    # RSSI (Signal Strength) thresholds in dBm
+    rssi_strong: int = -70   # Signal stronger than this is "good"
+    rssi_weak: int = -85     # Signal weaker than this is "critical"
+    
+    # Time thresholds in minutes
+    time_stale: int = 20     # No update for this long = stale data
+    time_critical: int = 15  # No update for this long = high priority
 
-# Time thresholds in minutes
-TIME_STALE_THRESHOLD = 20    # No update for this long = stale data
-TIME_CRITICAL_THRESHOLD = 15 # No update for this long = high priority
+
+THRESHOLDS = Thresholds()
+
+RSSI_STRONG_THRESHOLD = THRESHOLDS.rssi_strong
+RSSI_WEAK_THRESHOLD = THRESHOLDS.rssi_weak
+TIME_STALE_THRESHOLD = THRESHOLDS.time_stale
+TIME_CRITICAL_THRESHOLD = THRESHOLDS.time_critical
 
 # ==================== STATUS DEFINITIONS ====================
 
@@ -92,6 +121,7 @@ MARKER_COLORS = {
 
 # Data backup settings
 BACKUP_INTERVAL_SECONDS = 30  # Auto-save every 30 seconds
+AUTO_SAVE_DELAY_SECONDS = 0.5  # Coalesce bursts of edits into one background write
 BACKUP_FILE_PATH = os.path.join('data', 'victims_backup.json')
 RESCUE_LOG_PATH = os.path.join('data', 'rescue_log.csv')
 
@@ -103,6 +133,15 @@ os.makedirs('data', exist_ok=True)
 # NO AUTOMATIC REFRESH - Updates on packet receive
 DASHBOARD_REFRESH_INTERVAL = 0  # Disabled - real-time updates
 ANALYTICS_REFRESH_INTERVAL = 0  # Disabled - real-time updates
+RERUN_MIN_INTERVAL = 0.2  # seconds - cap packet-driven reruns at ~5 Hz
+PACKET_QUEUE_SIZE = 1024  # pending-packet signals kept between reruns
+PACKET_BATCH_SIZE = 64  # most packets applied to the DataManager at once
+# WebSocket server for live updates; bind to 0.0.0.0 so browsers on other
+# machines (LAN operators) can reach it at ws://<server host>:<port>
+WEBSOCKET_HOST = os.getenv('WEBSOCKET_HOST', 'localhost')
+WEBSOCKET_PORT = int(os.getenv('WEBSOCKET_PORT', '8765'))
+WEBSOCKET_START_TIMEOUT = 2  # seconds to wait for the server to bind
+WS_CLIENT_QUEUE_SIZE = 32  # messages buffered per WebSocket client before dropping the oldest
 
 # Table display settings
 MAX_ROWS_DISPLAY = 100
@@ -164,16 +203,20 @@ DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
 # Logging level
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+# Most log lines written per second; bounds output during error storms
+LOG_RATE_LIMIT = 10
+
 # ==================== HELPER FUNCTIONS ====================
 
+@lru_cache(maxsize=1)
 def get_priority_threshold_config():
-    """Return priority threshold configuration"""
-    return {
+    """Return priority threshold configuration (read-only, built once)"""
+    return MappingProxyType({
         'rssi_weak': RSSI_WEAK_THRESHOLD,
         'rssi_strong': RSSI_STRONG_THRESHOLD,
         'time_critical': TIME_CRITICAL_THRESHOLD,
         'time_stale': TIME_STALE_THRESHOLD
-    }
+    })
 
 def get_map_config():
     """Return map configuration"""
@@ -192,8 +235,9 @@ def get_serial_config():
         'available_baudrates': AVAILABLE_BAUD_RATES
     }
 
+@lru_cache(maxsize=1)
 def validate_api_key():
-    """Check if Google Maps API key is configured"""
+    """Check if Google Maps API key is configured (read once at import, so checked once)"""
     return bool(GOOGLE_MAPS_API_KEY and len(GOOGLE_MAPS_API_KEY) > 10)
 
 # ==================== CONFIGURATION VALIDATION ====================
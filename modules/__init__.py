@@ -6,18 +6,21 @@ This package contains core business logic modules:
 - data_manager: Victim data management and CRUD operations
 - analytics: Statistics calculation and data analysis
 - map_manager: Map creation and rendering with Google Maps
+- packet_ingest: Batched application of received packets
 """
 
 from .serial_reader import SerialReader
 from .data_manager import DataManager
 from .analytics import Analytics
 from .map_manager import MapManager
+from .packet_ingest import PacketIngest
 
 __all__ = [
     'SerialReader',
     'DataManager',
     'Analytics',
-    'MapManager'
+    'MapManager',
+    'PacketIngest'
 ]
 
 __version__ = '1.0.0'
@@ -5,11 +5,14 @@ Provides insights for rescue operations
 """
 
 import numpy as np
+import pyarrow as pa
+from math import radians, sin, cos, sqrt, atan2
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 import config
+from utils.helpers import calculate_priority_batch, minutes_since_batch, PRIORITY_LEVELS
 
 
 class Analytics:
@@ -32,6 +35,32 @@ class Analytics:
             data_manager: DataManager instance
         """
         self.data_manager = data_manager
+        
+        # Results of purely data-dependent methods, valid for one data version
+        self._memo: Dict[Any, Any] = {}
+        self._memo_version: Optional[int] = None
+    
+    def _memoized(self, key: Any, compute, *args):
+        """
+        Return a cached result for the current data version, computing it on a miss
+        
+        Args:
+            key: Cache key (method name plus any arguments)
+            compute: Callable producing the result
+            *args: Arguments passed to compute
+            
+        Returns:
+            Cached or freshly computed result
+        """
+        
+        version = self.data_manager.version
+        if version != self._memo_version:
+            self._memo.clear()
+            self._memo_version = version
+        
+        if key not in self._memo:
+            self._memo[key] = compute(*args)
+        return self._memo[key]
     
     def calculate_rescue_rate(self, time_window_hours: Optional[float] = None) -> Dict[str, float]:
         """
@@ -113,6 +142,11 @@ class Analytics:
             Dict with density analysis
         """
         
+        return self._memoized('geographic_density', self._analyze_geographic_density)
+    
+    def _analyze_geographic_density(self) -> Dict[str, Any]:
+        """Uncached body of analyze_geographic_density"""
+        
         victims = self.data_manager.get_all_victims()
         
         if not victims:
@@ -176,6 +210,11 @@ class Analytics:
             Dict with signal analysis
         """
         
+        return self._memoized('signal_trends', self._analyze_signal_trends)
+    
+    def _analyze_signal_trends(self) -> Dict[str, Any]:
+        """Uncached body of analyze_signal_trends"""
+        
         victims = self.data_manager.get_all_victims()
         
         if not victims:
@@ -188,34 +227,33 @@ class Analytics:
                 'deteriorating_signals': []
             }
         
-        all_rssi = []
         deteriorating = []
         
         for vid, victim in victims.items():
-            rssi = victim.get('RSSI', -999)
-            if rssi != -999:
-                all_rssi.append(rssi)
-            
             # Check for deteriorating signal
             rssi_history = victim.get('RSSI_HISTORY', [])
             if len(rssi_history) >= 5:
                 # Check if signal is getting weaker (more negative)
-                recent_avg = np.mean(rssi_history[-3:])
-                older_avg = np.mean(rssi_history[-6:-3])
+                recent = rssi_history[-3:]
+                older = rssi_history[-6:-3]
                 
-                if recent_avg < older_avg - 5:  # Signal weakened by 5 dBm
+                if sum(recent) / len(recent) < sum(older) / len(older) - 5:  # Signal weakened by 5 dBm
                     deteriorating.append({
                         'id': vid,
-                        'current_rssi': rssi,
+                        'current_rssi': victim.get('RSSI', -999),
                         'trend': 'weakening'
                     })
         
+        # Vectorized mean/median over valid readings
+        rssi = self.data_manager.get_rssi_array()
+        valid_rssi = rssi[rssi != -999]
+        
         # Get signal distribution
         signal_dist = self.data_manager.get_signal_distribution()
         
         return {
-            'average_rssi': round(np.mean(all_rssi), 2) if all_rssi else 0,
-            'median_rssi': round(np.median(all_rssi), 2) if all_rssi else 0,
+            'average_rssi': round(float(valid_rssi.mean()), 2) if valid_rssi.size else 0,
+            'median_rssi': round(float(np.median(valid_rssi)), 2) if valid_rssi.size else 0,
             'weak_signals': signal_dist.get('weak', 0),
             'medium_signals': signal_dist.get('medium', 0),
             'strong_signals': signal_dist.get('strong', 0),
@@ -289,28 +327,17 @@ class Analytics:
             Dict with priority counts
         """
         
-        from utils.helpers import calculate_priority
-        
-        victims = self.data_manager.get_victims_by_status(config.STATUS_STRANDED)
+        columns = self.data_manager.get_column_arrays()
+        stranded = columns['STATUS'] == config.STATUS_STRANDED
         
-        high = 0
-        medium = 0
-        low = 0
-        
-        for victim in victims.values():
-            priority, _ = calculate_priority(
-                victim,
-                rssi_strong_threshold=rssi_strong_threshold,
-                rssi_weak_threshold=rssi_weak_threshold,
-                time_critical_threshold=time_critical_threshold
-            )
-            
-            if priority == "HIGH":
-                high += 1
-            elif priority == "MEDIUM":
-                medium += 1
-            else:
-                low += 1
+        priorities = calculate_priority_batch(
+            columns['RSSI'][stranded],
+            self.data_manager.get_update_times()[stranded],
+            rssi_strong_threshold=rssi_strong_threshold,
+            rssi_weak_threshold=rssi_weak_threshold,
+            time_critical_threshold=time_critical_threshold
+        )
+        low, medium, high = np.bincount(priorities, minlength=len(PRIORITY_LEVELS)).tolist()
         
         return {
             'high': high,
@@ -330,6 +357,14 @@ class Analytics:
             Dict with coverage metrics (distance from station to first beacon)
         """
         
+        return self._memoized(
+            ('coverage_area', rescue_centre_lat, rescue_centre_lon),
+            self._get_coverage_area, rescue_centre_lat, rescue_centre_lon
+        )
+    
+    def _get_coverage_area(self, rescue_centre_lat=None, rescue_centre_lon=None) -> Dict[str, float]:
+        """Uncached body of get_coverage_area"""
+        
         victims = self.data_manager.get_all_victims()
         
         if not victims:
@@ -365,8 +400,6 @@ class Analytics:
             rescue_centre_lon = 77.587
         
         # Calculate distance from rescue centre to first victim using Haversine formula
-        from math import radians, sin, cos, sqrt, atan2
-        
         R = 6371  # Earth's radius in km
         
         lat1, lon1 = radians(rescue_centre_lat), radians(rescue_centre_lon)
@@ -401,35 +434,47 @@ class Analytics:
     
     def generate_operation_summary(self, rssi_strong_threshold=None, rssi_weak_threshold=None,
                                   time_critical_threshold=None, rescue_centre_lat=None, 
-                                  rescue_centre_lon=None) -> Dict[str, Any]:
+                                  rescue_centre_lon=None, *, basic_stats=None, rescue_metrics=None,
+                                  density=None, signal_analysis=None, time_analysis=None,
+                                  coverage=None) -> Dict[str, Any]:
         """
         Generate comprehensive operation summary
         
+        Any sub-result the caller already holds can be passed in and is reused
+        as-is; only the missing ones are computed here.
+        
         Args:
             rssi_strong_threshold: Strong signal threshold (optional)
             rssi_weak_threshold: Weak signal threshold (optional)
             time_critical_threshold: Critical time threshold in minutes (optional)
             rescue_centre_lat: Rescue centre latitude (optional)
             rescue_centre_lon: Rescue centre longitude (optional)
+            basic_stats: Precomputed data_manager.get_statistics() (optional)
+            rescue_metrics: Precomputed calculate_rescue_rate() (optional)
+            density: Precomputed analyze_geographic_density() (optional)
+            signal_analysis: Precomputed analyze_signal_trends() (optional)
+            time_analysis: Precomputed analyze_time_patterns() (optional)
+            coverage: Precomputed get_coverage_area() for the same centre (optional)
         
         Returns:
             Dict with complete operation summary
         """
         
-        stats = self.data_manager.get_statistics()
-        rescue_rate = self.calculate_rescue_rate()
-        density = self.analyze_geographic_density()
-        signals = self.analyze_signal_trends()
-        time_patterns = self.analyze_time_patterns()
+        stats = basic_stats if basic_stats is not None else self.data_manager.get_statistics()
+        rescue_rate = rescue_metrics if rescue_metrics is not None else self.calculate_rescue_rate()
+        density = density if density is not None else self.analyze_geographic_density()
+        signals = signal_analysis if signal_analysis is not None else self.analyze_signal_trends()
+        time_patterns = time_analysis if time_analysis is not None else self.analyze_time_patterns()
         priority = self.calculate_priority_distribution(
             rssi_strong_threshold=rssi_strong_threshold,
             rssi_weak_threshold=rssi_weak_threshold,
             time_critical_threshold=time_critical_threshold
         )
-        coverage = self.get_coverage_area(
-            rescue_centre_lat=rescue_centre_lat,
-            rescue_centre_lon=rescue_centre_lon
-        )
+        if coverage is None:
+            coverage = self.get_coverage_area(
+                rescue_centre_lat=rescue_centre_lat,
+                rescue_centre_lon=rescue_centre_lon
+            )
         
         return {
             'basic_stats': stats,
@@ -449,47 +494,79 @@ class Analytics:
             'priority_distribution': priority
         }
     
-    def identify_critical_victims(self) -> List[Dict[str, Any]]:
+    def identify_critical_victims(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Identify victims requiring immediate attention
         
+        Args:
+            limit: Return only the most severe `limit` victims (all if None)
+        
         Returns:
-            List of critical victim information
+            List of critical victim information, most severe first
         """
         
-        from utils.helpers import calculate_priority
-        
-        victims = self.data_manager.get_victims_by_status(config.STATUS_STRANDED)
-        critical = []
-        
+        columns = self.data_manager.get_column_arrays()
         current_time = datetime.now()
         
-        for vid, victim in victims.items():
-            priority, _ = calculate_priority(victim)
-            
-            # Check if high priority
-            if priority == "HIGH":
-                try:
-                    last_update = datetime.strptime(victim['LAST_UPDATE'], "%Y-%m-%d %H:%M:%S")
-                    minutes_since_update = (current_time - last_update).total_seconds() / 60
-                except:
-                    minutes_since_update = 999
-                
-                critical.append({
-                    'id': vid,
-                    'lat': victim['LAT'],
-                    'lon': victim['LON'],
-                    'rssi': victim['RSSI'],
-                    'minutes_since_update': round(minutes_since_update, 1),
-                    'priority': priority,
-                    'reason': self._get_critical_reason(victim)
-                })
+        rows = np.flatnonzero(self._critical_mask(columns, current_time))
+        minutes = np.nan_to_num(minutes_since_batch(self.data_manager.get_update_times()[rows], now=current_time), nan=999)
+        minutes = np.round(minutes, 1)
+        rssi = columns['RSSI'][rows]
+        
+        if limit is not None and limit < rows.size:
+            # Linear-time cut to the victims whose signal can make the top `limit`
+            # (ties kept), so only those few go through the full sort below
+            cutoff = np.partition(rssi, limit - 1)[limit - 1]
+            keep = np.flatnonzero(rssi <= cutoff)
+            rows, minutes, rssi = rows[keep], minutes[keep], rssi[keep]
         
         # Sort by severity (weakest signal or longest time)
-        critical.sort(key=lambda x: (x['rssi'], -x['minutes_since_update']))
+        order = np.lexsort((-minutes, rssi))[:limit]
+        
+        critical = []
+        
+        for vid, minutes_since_update in zip(columns['ID'][rows[order]].tolist(), minutes[order].tolist()):
+            victim = self.data_manager.get_victim(vid)
+            if victim is None:
+                continue
+            critical.append({
+                'id': vid,
+                'lat': victim['LAT'],
+                'lon': victim['LON'],
+                'rssi': victim['RSSI'],
+                'minutes_since_update': minutes_since_update,
+                'priority': "HIGH",
+                'reason': self._get_critical_reason(victim)
+            })
         
         return critical
     
+    def count_critical_victims(self) -> int:
+        """
+        Count victims requiring immediate attention without building their records
+        
+        Returns:
+            Number of victims identify_critical_victims() would return
+        """
+        
+        columns = self.data_manager.get_column_arrays()
+        return int(np.count_nonzero(self._critical_mask(columns, datetime.now())))
+    
+    def _critical_mask(self, columns: Dict[str, np.ndarray], current_time: datetime) -> np.ndarray:
+        """
+        Mark stranded victims that are HIGH priority under the default thresholds
+        
+        Args:
+            columns: Column arrays from DataManager.get_column_arrays()
+            current_time: Reference time for update age
+            
+        Returns:
+            Boolean array aligned with the columns
+        """
+        
+        priorities = calculate_priority_batch(columns['RSSI'], self.data_manager.get_update_times(), now=current_time)
+        return (columns['STATUS'] == config.STATUS_STRANDED) & (priorities == PRIORITY_LEVELS.index("HIGH"))
+    
     def _get_critical_reason(self, victim: Dict[str, Any]) -> str:
         """
         Determine reason for critical status
@@ -518,16 +595,20 @@ class Analytics:
         
         return ", ".join(reasons) if reasons else "Unknown"
     
-    def calculate_rescue_efficiency(self) -> Dict[str, float]:
+    def calculate_rescue_efficiency(self, *, basic_stats=None, rescue_metrics=None) -> Dict[str, float]:
         """
         Calculate overall rescue operation efficiency metrics
         
+        Args:
+            basic_stats: Precomputed data_manager.get_statistics() (optional)
+            rescue_metrics: Precomputed calculate_rescue_rate() (optional)
+        
         Returns:
             Dict with efficiency metrics
         """
         
-        stats = self.data_manager.get_statistics()
-        rescue_rate = self.calculate_rescue_rate()
+        stats = basic_stats if basic_stats is not None else self.data_manager.get_statistics()
+        rescue_rate = rescue_metrics if rescue_metrics is not None else self.calculate_rescue_rate()
         
         total = stats['total']
         rescued = stats['rescued']
@@ -561,6 +642,11 @@ class Analytics:
             List of sector recommendations
         """
         
+        return self._memoized('sector_recommendations', self._get_sector_recommendations)
+    
+    def _get_sector_recommendations(self) -> List[Dict[str, Any]]:
+        """Uncached body of get_sector_recommendations"""
+        
         density = self.analyze_geographic_density()
         sectors = density.get('sectors', {})
         
@@ -587,6 +673,33 @@ class Analytics:
         
         return recommendations
     
+    def get_sector_recommendations_table(self) -> pa.Table:
+        """
+        Get sector recommendations as a columnar Arrow table
+        
+        Same rows and order as get_sector_recommendations(); convert with
+        to_pandas(types_mapper=pd.ArrowDtype) to get a frame without copying.
+        
+        Returns:
+            pyarrow.Table with sector_id, stranded_count, rescue_percentage,
+            priority_score and recommendation columns
+        """
+        
+        return self._memoized('sector_recommendations_table', self._get_sector_recommendations_table)
+    
+    def _get_sector_recommendations_table(self) -> pa.Table:
+        """Uncached body of get_sector_recommendations_table"""
+        
+        recommendations = self.get_sector_recommendations()
+        
+        return pa.table({
+            'sector_id': pa.array([r['sector_id'] for r in recommendations], type=pa.string()),
+            'stranded_count': pa.array([r['stranded_count'] for r in recommendations], type=pa.int32()),
+            'rescue_percentage': pa.array([r['rescue_percentage'] for r in recommendations], type=pa.float64()),
+            'priority_score': pa.array([r['priority_score'] for r in recommendations], type=pa.float64()),
+            'recommendation': pa.array([r['recommendation'] for r in recommendations], type=pa.string())
+        })
+    
     def _get_sector_recommendation(self, stranded: int, rescue_pct: float) -> str:
         """
         Generate recommendation text for a sector
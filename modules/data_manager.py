@@ -4,13 +4,24 @@ Manages victim data storage, retrieval, and state management
 Handles CRUD operations and data persistence
 """
 
+import csv
 import json
 import os
+import atexit
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
 
 import config
+from utils.helpers import calculate_priority_batch, parse_timestamps_batch, PRIORITY_LEVELS
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class DataManager:
@@ -28,8 +39,45 @@ class DataManager:
     def __init__(self):
         """Initialize the data manager"""
         self.victims: Dict[int, Dict[str, Any]] = {}
+        
+        # Guards victims and everything derived from them; the ingest thread,
+        # the auto-save timer and every browser session share this object
+        self._lock = threading.RLock()
+        
         self.last_backup_time: Optional[datetime] = None
         
+        # Incremented on every mutation - cheap cache key for derived views
+        self.version: int = 0
+        
+        # Victims per status, kept in step with every status change so
+        # statistics never need a pass over all victims
+        self._status_counts: Counter = Counter()
+        
+        # Column (SoA) snapshot rebuilt lazily when version changes
+        self._columns: Dict[str, np.ndarray] = {}
+        self._columns_version: int = -1
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version: int = -1
+        self._arrow_table: Optional[pa.Table] = None
+        self._arrow_table_version: int = -1
+        self._update_times: Optional[np.ndarray] = None
+        self._update_times_version: int = -1
+        
+        # Serial stream counters, updated from the reader thread
+        self._stream_lock = threading.Lock()
+        self.packet_count: int = 0
+        self.error_count: int = 0
+        self.last_packet_time: Optional[datetime] = None
+        
+        # Debounced background auto-save
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        atexit.register(_flush_at_exit, weakref.ref(self))
+        
+        # Rescue log appends happen outside the victims lock
+        self._rescue_log_lock = threading.Lock()
+        
         # Do NOT load existing data automatically
         # Only data from live serial packets should be displayed
         # Backup is available for manual import only
@@ -46,56 +94,89 @@ class DataManager:
             bool: True if successful, False otherwise
         """
         
-        try:
-            victim_id = packet['ID']
-            
-            if victim_id in self.victims:
-                # UPDATE existing victim
-                self.victims[victim_id].update({
-                    'LAT': packet['LAT'],
-                    'LON': packet['LON'],
-                    'TIME': packet['TIME'],
-                    'RSSI': packet.get('RSSI', -999),
-                    'LAST_UPDATE': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'UPDATE_COUNT': self.victims[victim_id].get('UPDATE_COUNT', 0) + 1
-                })
-                
-                # Update RSSI history
-                rssi_history = self.victims[victim_id].get('RSSI_HISTORY', [])
-                rssi_history.append(packet.get('RSSI', -999))
-                
-                # Keep only last 20 RSSI readings
-                if len(rssi_history) > 20:
-                    rssi_history = rssi_history[-20:]
-                
-                self.victims[victim_id]['RSSI_HISTORY'] = rssi_history
-                
-            else:
-                # ADD new victim
-                self.victims[victim_id] = {
-                    'ID': victim_id,
-                    'LAT': packet['LAT'],
-                    'LON': packet['LON'],
-                    'TIME': packet['TIME'],
-                    'RSSI': packet.get('RSSI', -999),
-                    'STATUS': config.STATUS_STRANDED,
-                    'FIRST_DETECTED': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'LAST_UPDATE': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'RESCUED_TIME': None,
-                    'RESCUED_BY': None,
-                    'UPDATE_COUNT': 1,
-                    'RSSI_HISTORY': [packet.get('RSSI', -999)],
-                    'NOTES': ''
-                }
+        return self.add_or_update_victims([packet]) == 1
+    
+    def add_or_update_victims(self, packets: List[Dict[str, Any]]) -> int:
+        """
+        Add or update victims from a batch of packets
+        
+        The whole batch shares one timestamp, one version bump and one
+        auto-save request, so derived views are rebuilt once per batch
+        rather than once per packet.
+        
+        Args:
+            packets: Victim data packets from serial port, oldest first
             
-            # Auto-save periodically
-            self._auto_save()
+        Returns:
+            int: Number of packets applied
+        """
+        
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        applied = 0
+        
+        with self._lock:
+            for packet in packets:
+                try:
+                    self._apply_packet(packet, now_str)
+                    applied += 1
+                except Exception as e:
+                    logger.error("Error adding/updating victim: %s", e)
             
-            return True
+            if applied:
+                self.version += 1
+                
+                # Auto-save periodically
+                self._mark_dirty()
+        
+        return applied
+    
+    def _apply_packet(self, packet: Dict[str, Any], now_str: str):
+        """
+        Merge one packet into the victim records (caller holds the lock)
+        
+        Args:
+            packet: Victim data packet from serial port
+            now_str: Formatted time to record as the update time
+        """
+        
+        victim_id = packet['ID']
+        
+        if victim_id in self.victims:
+            # UPDATE existing victim
+            self.victims[victim_id].update({
+                'LAT': packet['LAT'],
+                'LON': packet['LON'],
+                'TIME': packet['TIME'],
+                'RSSI': packet.get('RSSI', -999),
+                'LAST_UPDATE': now_str,
+                'UPDATE_COUNT': self.victims[victim_id].get('UPDATE_COUNT', 0) + 1
+            })
+            
+            # Update RSSI history as a new list (keeping only the last 20
+            # readings), so copies taken for saving never see it change
+            rssi_history = self.victims[victim_id].get('RSSI_HISTORY', [])[-19:]
+            rssi_history = rssi_history + [packet.get('RSSI', -999)]
+            
+            self.victims[victim_id]['RSSI_HISTORY'] = rssi_history
             
-        except Exception as e:
-            print(f"Error adding/updating victim: {e}")
-            return False
+        else:
+            # ADD new victim
+            self.victims[victim_id] = {
+                'ID': victim_id,
+                'LAT': packet['LAT'],
+                'LON': packet['LON'],
+                'TIME': packet['TIME'],
+                'RSSI': packet.get('RSSI', -999),
+                'STATUS': config.STATUS_STRANDED,
+                'FIRST_DETECTED': now_str,
+                'LAST_UPDATE': now_str,
+                'RESCUED_TIME': None,
+                'RESCUED_BY': None,
+                'UPDATE_COUNT': 1,
+                'RSSI_HISTORY': [packet.get('RSSI', -999)],
+                'NOTES': ''
+            }
+            self._status_counts[config.STATUS_STRANDED] += 1
     
     def mark_enroute(self, victim_id: int) -> bool:
         """
@@ -108,20 +189,22 @@ class DataManager:
             bool: True if successful, False otherwise
         """
         
-        if victim_id not in self.victims:
-            print(f"Victim {victim_id} not found")
-            return False
-        
-        try:
-            self.victims[victim_id]['STATUS'] = config.STATUS_EN_ROUTE
-            self.victims[victim_id]['ENROUTE_TIME'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            self._auto_save()
-            return True
+        with self._lock:
+            if victim_id not in self.victims:
+                print(f"Victim {victim_id} not found")
+                return False
             
-        except Exception as e:
-            print(f"Error marking victim as en-route: {e}")
-            return False
+            try:
+                self._set_status(victim_id, config.STATUS_EN_ROUTE)
+                self.victims[victim_id]['ENROUTE_TIME'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.version += 1
+                
+                self._mark_dirty()
+                return True
+                
+            except Exception as e:
+                print(f"Error marking victim as en-route: {e}")
+                return False
     
     def mark_rescued(
         self,
@@ -141,25 +224,78 @@ class DataManager:
             bool: True if successful, False otherwise
         """
         
-        if victim_id not in self.victims:
-            print(f"Victim {victim_id} not found")
-            return False
-        
-        try:
-            self.victims[victim_id]['STATUS'] = config.STATUS_RESCUED
-            self.victims[victim_id]['RESCUED_TIME'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.victims[victim_id]['RESCUED_BY'] = operator_name
-            self.victims[victim_id]['NOTES'] = notes
+        with self._lock:
+            if victim_id not in self.victims:
+                print(f"Victim {victim_id} not found")
+                return False
             
-            # Log rescue event
-            self._log_rescue(victim_id, operator_name, notes)
+            try:
+                self._set_status(victim_id, config.STATUS_RESCUED)
+                self.victims[victim_id]['RESCUED_TIME'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.victims[victim_id]['RESCUED_BY'] = operator_name
+                self.victims[victim_id]['NOTES'] = notes
+                self.version += 1
+                
+                # Build the rescue log row now; it is written once the lock
+                # is released, so packet ingest never waits on the log file
+                log_entry = self._rescue_log_entry(victim_id, operator_name, notes)
+                
+                self._mark_dirty()
+                
+            except Exception as e:
+                print(f"Error marking victim as rescued: {e}")
+                return False
+        
+        # Log rescue event
+        self._log_rescue(log_entry)
+        return True
+    
+    def mark_stranded(self, victim_id: int) -> bool:
+        """
+        Revert victim to STRANDED (undo a rescue or dispatch)
+        
+        Args:
+            victim_id: Victim ID
             
-            self._auto_save()
-            return True
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        
+        with self._lock:
+            if victim_id not in self.victims:
+                print(f"Victim {victim_id} not found")
+                return False
             
-        except Exception as e:
-            print(f"Error marking victim as rescued: {e}")
-            return False
+            try:
+                self._set_status(victim_id, config.STATUS_STRANDED)
+                self.victims[victim_id]['RESCUED_TIME'] = None
+                self.victims[victim_id]['RESCUED_BY'] = None
+                self.version += 1
+                
+                self._mark_dirty()
+                return True
+                
+            except Exception as e:
+                print(f"Error marking victim as stranded: {e}")
+                return False
+    
+    def _set_status(self, victim_id: int, status: str):
+        """
+        Change a victim's status and move it between the status counters
+        
+        Args:
+            victim_id: Victim ID
+            status: New status
+        """
+        
+        victim = self.victims[victim_id]
+        self._status_counts[victim['STATUS']] -= 1
+        self._status_counts[status] += 1
+        victim['STATUS'] = status
+    
+    def _recount_statuses(self):
+        """Rebuild the status counters after the victim dict is replaced wholesale (caller holds the lock)"""
+        self._status_counts = Counter(v['STATUS'] for v in self.victims.values())
     
     def get_victim(self, victim_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -180,7 +316,8 @@ class DataManager:
         Returns:
             Dict of all victims
         """
-        return self.victims.copy()
+        with self._lock:
+            return self.victims.copy()
     
     def get_victims_by_status(self, status: str) -> Dict[int, Dict[str, Any]]:
         """
@@ -192,10 +329,11 @@ class DataManager:
         Returns:
             Dict of filtered victims
         """
-        return {
-            vid: data for vid, data in self.victims.items()
-            if data['STATUS'] == status
-        }
+        with self._lock:
+            return {
+                vid: data for vid, data in self.victims.items()
+                if data['STATUS'] == status
+            }
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -205,20 +343,22 @@ class DataManager:
             Dict with statistics
         """
         
-        total = len(self.victims)
-        
-        stranded = len([v for v in self.victims.values() if v['STATUS'] == config.STATUS_STRANDED])
-        enroute = len([v for v in self.victims.values() if v['STATUS'] == config.STATUS_EN_ROUTE])
-        rescued = len([v for v in self.victims.values() if v['STATUS'] == config.STATUS_RESCUED])
+        # Counts are maintained incrementally; this only reads them
+        with self._lock:
+            total = len(self.victims)
+            stranded = self._status_counts[config.STATUS_STRANDED]
+            enroute = self._status_counts[config.STATUS_EN_ROUTE]
+            rescued = self._status_counts[config.STATUS_RESCUED]
+        divisor = max(total, 1)
         
         return {
             'total': total,
             'stranded': stranded,
             'enroute': enroute,
             'rescued': rescued,
-            'stranded_pct': (stranded / total * 100) if total > 0 else 0,
-            'enroute_pct': (enroute / total * 100) if total > 0 else 0,
-            'rescued_pct': (rescued / total * 100) if total > 0 else 0
+            'stranded_pct': stranded / divisor * 100,
+            'enroute_pct': enroute / divisor * 100,
+            'rescued_pct': rescued / divisor * 100
         }
     
     def get_priority_victims(self, rssi_strong_threshold=None, rssi_weak_threshold=None, 
@@ -234,22 +374,20 @@ class DataManager:
         Returns:
             Dict of high priority victims
         """
-        from utils.helpers import calculate_priority
-        
-        priority_victims = {}
         
-        for vid, data in self.victims.items():
-            if data['STATUS'] == config.STATUS_STRANDED:
-                priority, _ = calculate_priority(
-                    data,
-                    rssi_strong_threshold=rssi_strong_threshold,
-                    rssi_weak_threshold=rssi_weak_threshold,
-                    time_critical_threshold=time_critical_threshold
-                )
-                if priority == "HIGH":
-                    priority_victims[vid] = data
-        
-        return priority_victims
+        with self._lock:
+            columns = self.get_column_arrays()
+            priorities = calculate_priority_batch(
+                columns['RSSI'],
+                self.get_update_times(),
+                rssi_strong_threshold=rssi_strong_threshold,
+                rssi_weak_threshold=rssi_weak_threshold,
+                time_critical_threshold=time_critical_threshold
+            )
+            
+            mask = (columns['STATUS'] == config.STATUS_STRANDED) & (priorities == PRIORITY_LEVELS.index("HIGH"))
+            
+            return {vid: self.victims[vid] for vid in columns['ID'][mask].tolist()}
     
     def get_geographic_clusters(self, sector_size: float = None) -> Dict[str, List[int]]:
         """
@@ -267,13 +405,14 @@ class DataManager:
         
         clusters = defaultdict(list)
         
-        for vid, data in self.victims.items():
-            # Calculate sector coordinates
-            sector_lat = int(data['LAT'] / sector_size)
-            sector_lon = int(data['LON'] / sector_size)
-            sector_id = f"{sector_lat},{sector_lon}"
-            
-            clusters[sector_id].append(vid)
+        with self._lock:
+            for vid, data in self.victims.items():
+                # Calculate sector coordinates
+                sector_lat = int(data['LAT'] / sector_size)
+                sector_lon = int(data['LON'] / sector_size)
+                sector_id = f"{sector_lat},{sector_lon}"
+                
+                clusters[sector_id].append(vid)
         
         return dict(clusters)
     
@@ -285,26 +424,139 @@ class DataManager:
             Dict with counts for each signal category
         """
         
-        strong = 0
-        medium = 0
-        weak = 0
+        rssi = self.get_rssi_array()
         
-        for victim in self.victims.values():
-            rssi = victim.get('RSSI', -999)
-            
-            if rssi > config.RSSI_STRONG_THRESHOLD:
-                strong += 1
-            elif rssi >= config.RSSI_WEAK_THRESHOLD:
-                medium += 1
-            else:
-                weak += 1
+        strong = int(np.count_nonzero(rssi > config.RSSI_STRONG_THRESHOLD))
+        weak = int(np.count_nonzero(rssi < config.RSSI_WEAK_THRESHOLD))
         
         return {
             'strong': strong,
-            'medium': medium,
+            'medium': rssi.size - strong - weak,
             'weak': weak
         }
     
+    def get_column_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Get the table-facing victim fields as one array per column
+        
+        Columns are built in a single pass and reused until the data version
+        changes, so a DataFrame can be made from them without dtype inference.
+        Treat the arrays as read-only.
+        
+        Returns:
+            Dict of ID, LAT, LON, RSSI, LAST_UPDATE, UPDATE_COUNT and STATUS
+            arrays in victim insertion order
+        """
+        
+        with self._lock:
+            if self._columns_version != self.version:
+                n = len(self.victims)
+                columns = {
+                    'ID': np.empty(n, dtype=np.int32),
+                    'LAT': np.empty(n, dtype=np.float64),
+                    'LON': np.empty(n, dtype=np.float64),
+                    'RSSI': np.empty(n, dtype=np.int16),
+                    'LAST_UPDATE': np.empty(n, dtype=object),
+                    'UPDATE_COUNT': np.empty(n, dtype=np.int32),
+                    'STATUS': np.empty(n, dtype=object)
+                }
+                
+                for i, victim in enumerate(self.victims.values()):
+                    columns['ID'][i] = victim['ID']
+                    columns['LAT'][i] = victim['LAT']
+                    columns['LON'][i] = victim['LON']
+                    columns['RSSI'][i] = victim.get('RSSI', -999)
+                    columns['LAST_UPDATE'][i] = victim.get('LAST_UPDATE')
+                    columns['UPDATE_COUNT'][i] = victim.get('UPDATE_COUNT', 0)
+                    columns['STATUS'][i] = victim['STATUS']
+                
+                self._columns = columns
+                self._columns_version = self.version
+            
+            return self._columns
+    
+    def get_dataframe(self) -> pd.DataFrame:
+        """
+        Get the table-facing victim fields as a DataFrame
+        
+        Built from get_column_arrays() without copying the numeric columns,
+        with STATUS as a categorical over config.ALL_STATUSES, and reused
+        until the data version changes. Treat it as read-only.
+        
+        Returns:
+            DataFrame with one row per victim in insertion order
+        """
+        
+        with self._lock:
+            if self._frame_version != self.version:
+                columns = dict(self.get_column_arrays())
+                columns['STATUS'] = pd.Categorical(columns['STATUS'], categories=config.ALL_STATUSES)
+                
+                self._frame = pd.DataFrame(columns, copy=False)
+                self._frame_version = self.version
+            
+            return self._frame
+    
+    def get_arrow_table(self) -> pa.Table:
+        """
+        Get the table-facing victim fields as a PyArrow Table
+        
+        Numeric columns wrap the get_column_arrays() buffers without copying
+        and STATUS is dictionary-encoded over config.ALL_STATUSES, so the
+        table can be filtered, sliced and handed to Streamlit without a pandas
+        round trip. Reused until the data version changes.
+        
+        Returns:
+            pa.Table with one row per victim in insertion order
+        """
+        
+        with self._lock:
+            if self._arrow_table_version != self.version:
+                status = self.get_dataframe()['STATUS'].array
+                arrays = {
+                    name: pa.array(values) for name, values in self.get_column_arrays().items()
+                    if name != 'STATUS'
+                }
+                arrays['STATUS'] = pa.DictionaryArray.from_arrays(
+                    pa.array(status.codes),
+                    pa.array(list(status.categories), type=pa.string())
+                )
+                
+                self._arrow_table = pa.table(arrays)
+                self._arrow_table_version = self.version
+            
+            return self._arrow_table
+    
+    def get_update_times(self) -> np.ndarray:
+        """
+        Get LAST_UPDATE of every victim parsed to datetime64
+        
+        Parsed once per data version so age and priority checks only
+        subtract from the current time. Treat the array as read-only.
+        
+        Returns:
+            datetime64 array in victim insertion order, NaT where unparseable
+        """
+        
+        with self._lock:
+            if self._update_times_version != self.version:
+                self._update_times = parse_timestamps_batch(self.get_column_arrays()['LAST_UPDATE']).to_numpy()
+                self._update_times_version = self.version
+            
+            return self._update_times
+    
+    def get_rssi_array(self) -> np.ndarray:
+        """
+        Get current RSSI of every victim as an int16 array
+        
+        Missing readings are kept as -999.
+        
+        Returns:
+            np.ndarray of RSSI values in victim insertion order
+        """
+        
+        return self.get_column_arrays()['RSSI']
+    
     def delete_victim(self, victim_id: int) -> bool:
         """
         Delete a victim record (use with caution)
@@ -316,10 +568,12 @@ class DataManager:
             bool: True if deleted, False if not found
         """
         
-        if victim_id in self.victims:
-            del self.victims[victim_id]
-            self._auto_save()
-            return True
+        with self._lock:
+            if victim_id in self.victims:
+                self._status_counts[self.victims.pop(victim_id)['STATUS']] -= 1
+                self.version += 1
+                self._mark_dirty()
+                return True
         
         return False
     
@@ -332,8 +586,11 @@ class DataManager:
         """
         
         try:
-            self.victims = {}
-            self._auto_save()
+            with self._lock:
+                self.victims = {}
+                self._recount_statuses()
+                self.version += 1
+                self._mark_dirty()
             return True
         except Exception as e:
             print(f"Error resetting data: {e}")
@@ -357,9 +614,18 @@ class DataManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
-            # Save data
-            with open(filepath, 'w') as f:
-                json.dump(self.victims, f, indent=2)
+            # Copy the records under the lock, then write without it so
+            # packets keep flowing while the file is written
+            with self._lock:
+                victims = {vid: dict(victim) for vid, victim in self.victims.items()}
+            
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated backup behind
+            temp_path = f"{filepath}.tmp"
+            with self._save_lock:
+                with open(temp_path, 'w') as f:
+                    json.dump(victims, f, indent=2)
+                os.replace(temp_path, filepath)
             
             self.last_backup_time = datetime.now()
             return True
@@ -391,7 +657,12 @@ class DataManager:
                 data = json.load(f)
             
             # Convert string keys back to integers
-            self.victims = {int(k): v for k, v in data.items()}
+            victims = {int(k): v for k, v in data.items()}
+            
+            with self._lock:
+                self.victims = victims
+                self._recount_statuses()
+                self.version += 1
             
             print(f"Loaded {len(self.victims)} victims from backup")
             return True
@@ -413,25 +684,16 @@ class DataManager:
         """
         
         try:
-            import pandas as pd
-            
             # Filter victims if needed
             if status_filter:
                 victims = self.get_victims_by_status(status_filter)
             else:
-                victims = self.victims
+                victims = self.get_all_victims()
             
             if not victims:
                 print("No victims to export")
                 return False
             
-            # Convert to DataFrame
-            df = pd.DataFrame(list(victims.values()))
-            
-            # Select columns
-            columns = [col for col in config.EXPORT_COLUMNS if col in df.columns]
-            df = df[columns]
-            
             # Generate filename if not provided
             if filepath is None:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -445,48 +707,93 @@ class DataManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
-            # Export to CSV
-            df.to_csv(filepath, index=False)
+            # Export to CSV, row by row straight from the victim dicts
+            with open(filepath, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=config.EXPORT_COLUMNS, extrasaction='ignore', lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(victims.values())
             
-            print(f"Exported {len(df)} victims to {filepath}")
+            print(f"Exported {len(victims)} victims to {filepath}")
             return True
             
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
             return False
     
-    def _auto_save(self):
-        """Auto-save data periodically"""
+    def _mark_dirty(self):
+        """
+        Schedule a background auto-save for the latest changes
         
-        current_time = datetime.now()
+        Changes made while a save is pending ride along with it, and saves
+        stay at least BACKUP_INTERVAL_SECONDS apart, so bursts of edits cost
+        one write off the UI thread instead of one write per call.
+        """
         
-        # Check if enough time has passed since last backup
-        if self.last_backup_time is None:
-            should_save = True
-        else:
-            time_since_backup = (current_time - self.last_backup_time).total_seconds()
-            should_save = time_since_backup >= config.BACKUP_INTERVAL_SECONDS
+        with self._lock:
+            self._dirty = True
+            
+            if self._save_timer is not None:
+                return
+            
+            delay = config.AUTO_SAVE_DELAY_SECONDS
+            if self.last_backup_time is not None:
+                time_since_backup = (datetime.now() - self.last_backup_time).total_seconds()
+                delay = max(delay, config.BACKUP_INTERVAL_SECONDS - time_since_backup)
+            
+            timer = threading.Timer(delay, self._flush)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+    
+    def _flush(self):
+        """Write pending changes to the backup file"""
+        
+        with self._lock:
+            self._save_timer = None
+            
+            if not self._dirty:
+                return
+            
+            self._dirty = False
+        
+        # save_to_file copies the victims under the lock and swaps the file in
+        # atomically, so a failure here means the disk write itself failed
+        if not self.save_to_file():
+            # Backup directory unwritable or disk full; try again later
+            self._mark_dirty()
+    
+    def flush_pending_save(self):
+        """Cancel any scheduled auto-save and write pending changes now"""
         
-        if should_save:
-            self.save_to_file()
+        with self._lock:
+            timer = self._save_timer
+            if timer is not None:
+                timer.cancel()
+        
+        self._flush()
     
-    def _log_rescue(self, victim_id: int, operator_name: str, notes: str):
+    def _rescue_log_entry(
+        self,
+        victim_id: int,
+        operator_name: str,
+        notes: str
+    ) -> Optional[Dict[str, Any]]:
         """
-        Log rescue event to CSV file
+        Build the rescue log row for a victim (caller holds the lock)
         
         Args:
             victim_id: Victim ID
             operator_name: Operator who performed rescue
             notes: Rescue notes
+            
+        Returns:
+            Log row, or None if the victim record is incomplete
         """
         
         try:
-            import pandas as pd
-            
             victim = self.victims[victim_id]
             
-            # Prepare log entry
-            log_entry = {
+            return {
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'victim_id': victim_id,
                 'operator': operator_name,
@@ -500,32 +807,84 @@ class DataManager:
                 'notes': notes
             }
             
+        except Exception as e:
+            print(f"Error logging rescue: {e}")
+            return None
+    
+    def _log_rescue(self, log_entry: Optional[Dict[str, Any]]):
+        """
+        Log rescue event to CSV file (called without the victims lock)
+        
+        Args:
+            log_entry: Row built by _rescue_log_entry; None is skipped
+        """
+        
+        if log_entry is None:
+            return
+        
+        try:
             # Append to rescue log
             log_path = config.RESCUE_LOG_PATH
             
-            # Check if file exists
-            if os.path.exists(log_path):
-                df = pd.read_csv(log_path)
-                df = pd.concat([df, pd.DataFrame([log_entry])], ignore_index=True)
-            else:
-                df = pd.DataFrame([log_entry])
-            
             # Ensure directory exists
             os.makedirs(os.path.dirname(log_path), exist_ok=True)
             
-            # Save log
-            df.to_csv(log_path, index=False)
+            # Append one row instead of reading and rewriting the whole log;
+            # the header is written only when starting a new file. Rescues
+            # from several sessions append one at a time
+            with self._rescue_log_lock:
+                write_header = not os.path.exists(log_path) or os.path.getsize(log_path) == 0
+                with open(log_path, 'a', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(log_entry), lineterminator='\n')
+                    if write_header:
+                        writer.writeheader()
+                    writer.writerow(log_entry)
             
         except Exception as e:
             print(f"Error logging rescue: {e}")
     
+    def record_packet(self) -> int:
+        """
+        Count a received packet (safe to call from the serial reader thread)
+        
+        Returns:
+            int: Packets received so far
+        """
+        with self._stream_lock:
+            self.packet_count += 1
+            self.last_packet_time = datetime.now()
+            return self.packet_count
+    
+    def record_error(self) -> int:
+        """
+        Count a packet parse error (safe to call from the serial reader thread)
+        
+        Returns:
+            int: Errors seen so far
+        """
+        with self._stream_lock:
+            self.error_count += 1
+            return self.error_count
+    
+    def reset_stream_counters(self):
+        """Zero the packet and error counters (keeps victim data)"""
+        with self._stream_lock:
+            self.packet_count = 0
+            self.error_count = 0
+    
     def get_victim_count(self) -> int:
         """Get total number of victims"""
         return len(self.victims)
     
     def get_active_count(self) -> int:
         """Get number of active (stranded + en-route) victims"""
-        return len([
-            v for v in self.victims.values()
-            if v['STATUS'] in [config.STATUS_STRANDED, config.STATUS_EN_ROUTE]
-        ])
\ No newline at end of file
+        with self._lock:
+            return self._status_counts[config.STATUS_STRANDED] + self._status_counts[config.STATUS_EN_ROUTE]
+
+
+def _flush_at_exit(manager_ref: "weakref.ReferenceType[DataManager]"):
+    """Write any pending auto-save when the interpreter exits"""
+    
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush_pending_save()
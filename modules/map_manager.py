@@ -5,12 +5,31 @@ Creates interactive maps with victim markers and overlays
 """
 
 import folium
+from math import radians, cos, sin, asin, sqrt
 from folium import plugins
 from typing import Dict, List, Tuple, Any, Optional
 import numpy as np
+import pandas as pd
 
 import config
-from utils.helpers import calculate_priority, get_signal_color, format_time_ago
+from utils.helpers import (
+    calculate_priority, get_signal_color, format_time_ago,
+    calculate_priority_batch, get_signal_color_batch, format_time_ago_batch, PRIORITY_LEVELS
+)
+
+try:
+    import pydeck as pdk
+    PYDECK_AVAILABLE = True
+except ImportError:
+    PYDECK_AVAILABLE = False
+
+# RGB per status in config.ALL_STATUSES order, plus a trailing grey row for
+# unknown statuses; indexed directly by categorical code (-1 hits the grey row)
+_STATUS_RGB_PALETTE = np.array(
+    [[int(config.STATUS_COLORS[status][i:i + 2], 16) for i in (1, 3, 5)] for status in config.ALL_STATUSES]
+    + [[128, 128, 128]],
+    dtype=np.uint8
+)
 
 
 class MapManager:
@@ -43,7 +62,7 @@ class MapManager:
         rssi_strong_threshold: int = None,
         rssi_weak_threshold: int = None,
         time_critical_threshold: int = None
-    ) -> folium.Map:
+    ) -> Tuple[folium.Map, int]:
         """
         Create interactive map with victim markers
         
@@ -60,7 +79,7 @@ class MapManager:
             time_critical_threshold: Critical time threshold in minutes (optional)
             
         Returns:
-            Folium map object
+            Tuple of (folium map object, number of victim markers drawn)
         """
         
         # Calculate center if not provided
@@ -97,9 +116,10 @@ class MapManager:
             control=True
         ).add_to(m)
         
-        # Add victim markers
+        # Add victim markers; visibility and priority filtering share one pass
+        visible_count = 0
         if victims:
-            self._add_victim_markers(
+            visible_count = self._add_victim_markers(
                 m, 
                 victims, 
                 show_rescued, 
@@ -127,7 +147,100 @@ class MapManager:
         # Add legend with thresholds
         self._add_legend(m, rssi_strong_threshold, rssi_weak_threshold, time_critical_threshold)
         
-        return m
+        return m, visible_count
+    
+    def create_deck_map(
+        self,
+        victims: Dict[int, Dict[str, Any]],
+        center: Optional[List[float]] = None,
+        zoom: Optional[int] = None,
+        show_rescued: bool = True,
+        show_heatmap: bool = False
+    ):
+        """
+        Create a WebGL (deck.gl) victim map for large victim counts
+        
+        Markers are sent as plain columns and drawn on the GPU, so cost stays
+        flat where folium would emit one JS object (and popup) per victim.
+        
+        Args:
+            victims: Dictionary of victim data
+            center: Map center [lat, lon] (auto-calculated if None)
+            zoom: Zoom level (default from config if None)
+            show_rescued: Include rescued victims on map
+            show_heatmap: Add density heatmap layer
+            
+        Returns:
+            pydeck.Deck object, or None if pydeck is not installed
+        """
+        
+        if not PYDECK_AVAILABLE:
+            return None
+        
+        if center is None and victims:
+            center = self._calculate_map_center(victims)
+        elif center is None:
+            center = self.default_center
+        
+        if zoom is None:
+            zoom = self.default_zoom
+        
+        rows = [
+            v for v in victims.values()
+            if show_rescued or v.get('STATUS') != config.STATUS_RESCUED
+        ]
+        
+        points = {
+            'lat': np.fromiter((v['LAT'] for v in rows), dtype=np.float64, count=len(rows)),
+            'lon': np.fromiter((v['LON'] for v in rows), dtype=np.float64, count=len(rows)),
+            'id': [v['ID'] for v in rows],
+            'status': [v.get('STATUS', config.STATUS_STRANDED) for v in rows],
+            'rssi': [v.get('RSSI', -999) for v in rows]
+        }
+        status_codes = pd.Categorical(points['status'], categories=config.ALL_STATUSES).codes
+        points['color'] = _STATUS_RGB_PALETTE[status_codes].tolist()
+        
+        data = pd.DataFrame(points)
+        
+        layers = []
+        
+        if show_heatmap and rows:
+            layers.append(pdk.Layer(
+                'HeatmapLayer',
+                data=data,
+                get_position='[lon, lat]',
+                opacity=0.4
+            ))
+        
+        layers.append(pdk.Layer(
+            'ScatterplotLayer',
+            data=data,
+            get_position='[lon, lat]',
+            get_fill_color='color',
+            get_radius=20,
+            radius_min_pixels=3,
+            pickable=True
+        ))
+        
+        # Rescue station
+        layers.append(pdk.Layer(
+            'ScatterplotLayer',
+            data=[{'lat': center[0], 'lon': center[1]}],
+            get_position='[lon, lat]',
+            get_fill_color=[0, 102, 204],
+            get_radius=40,
+            radius_min_pixels=6
+        ))
+        
+        return pdk.Deck(
+            layers=layers,
+            initial_view_state=pdk.ViewState(
+                latitude=center[0],
+                longitude=center[1],
+                zoom=zoom
+            ),
+            tooltip={'text': 'ID: {id}\nStatus: {status}\nRSSI: {rssi} dBm'}
+        )
     
     def _add_victim_markers(
         self,
@@ -139,7 +252,7 @@ class MapManager:
         rssi_strong_threshold: int = None,
         rssi_weak_threshold: int = None,
         time_critical_threshold: int = None
-    ):
+    ) -> int:
         """
         Add victim markers to map
         
@@ -152,9 +265,32 @@ class MapManager:
             rssi_strong_threshold: Strong signal threshold (optional)
             rssi_weak_threshold: Weak signal threshold (optional)
             time_critical_threshold: Critical time threshold in minutes (optional)
+            
+        Returns:
+            Number of markers added
         """
         
-        for vid, victim in victims.items():
+        count = 0
+        
+        # Timestamps are parsed and signals classified once for the whole
+        # map instead of several times per marker inside the loop
+        rssi = np.fromiter((v.get('RSSI', -999) for v in victims.values()), dtype=np.int16, count=len(victims))
+        last_updates = [v.get('LAST_UPDATE') for v in victims.values()]
+        
+        priority_codes = calculate_priority_batch(rssi, last_updates)
+        signal_labels, signal_colors = get_signal_color_batch(rssi)
+        last_update_strs = format_time_ago_batch(last_updates)
+        
+        if show_priority_only:
+            high_priority = calculate_priority_batch(
+                rssi,
+                last_updates,
+                rssi_strong_threshold=rssi_strong_threshold,
+                rssi_weak_threshold=rssi_weak_threshold,
+                time_critical_threshold=time_critical_threshold
+            ) == PRIORITY_LEVELS.index("HIGH")
+        
+        for i, (vid, victim) in enumerate(victims.items()):
             # Skip invalid coordinates
             if victim['LAT'] == 0 and victim['LON'] == 0:
                 continue
@@ -166,21 +302,20 @@ class MapManager:
                 continue
             
             # Filter by priority if needed
-            if show_priority_only:
-                priority, _ = calculate_priority(
-                    victim,
-                    rssi_strong_threshold=rssi_strong_threshold,
-                    rssi_weak_threshold=rssi_weak_threshold,
-                    time_critical_threshold=time_critical_threshold
-                )
-                if priority != "HIGH":
-                    continue
+            if show_priority_only and not high_priority[i]:
+                continue
             
             # Determine marker properties
             marker_color, icon_name, opacity = self._get_marker_properties(victim)
             
             # Create popup content
-            popup_html = self._create_popup_html(victim, station_location)
+            popup_html = self._create_popup_html(
+                victim,
+                station_location,
+                priority=PRIORITY_LEVELS[priority_codes[i]],
+                signal=(signal_labels[i], signal_colors[i]),
+                last_update_str=last_update_strs[i]
+            )
             
             # Create marker
             folium.Marker(
@@ -194,6 +329,9 @@ class MapManager:
                 ),
                 opacity=opacity
             ).add_to(map_obj)
+            count += 1
+        
+        return count
     
     def _get_marker_properties(self, victim: Dict[str, Any]) -> Tuple[str, str, float]:
         """
@@ -219,24 +357,36 @@ class MapManager:
         
         return 'gray', 'question-circle', 1.0
     
-    def _create_popup_html(self, victim: Dict[str, Any], station_location: List[float] = None) -> str:
+    def _create_popup_html(
+        self,
+        victim: Dict[str, Any],
+        station_location: List[float] = None,
+        priority: Optional[str] = None,
+        signal: Optional[Tuple[str, str]] = None,
+        last_update_str: Optional[str] = None
+    ) -> str:
         """
         Create HTML content for marker popup
         
         Args:
             victim: Victim data dictionary
             station_location: Rescue station coordinates [lat, lon]
+            priority: Precomputed priority level (computed if None)
+            signal: Precomputed (label, color) for the RSSI (computed if None)
+            last_update_str: Precomputed "time ago" text (computed if None)
             
         Returns:
             HTML string for popup
         """
         
         # Calculate priority and signal strength
-        priority, priority_label = calculate_priority(victim)
-        signal_label, signal_color = get_signal_color(victim['RSSI'])
+        if priority is None:
+            priority, _ = calculate_priority(victim)
+        signal_label, signal_color = signal if signal is not None else get_signal_color(victim['RSSI'])
         
         # Format time
-        last_update_str = format_time_ago(victim['LAST_UPDATE'])
+        if last_update_str is None:
+            last_update_str = format_time_ago(victim['LAST_UPDATE'])
         
         # Calculate distance from rescue station
         distance_html = ""
@@ -591,8 +741,6 @@ class MapManager:
             Distance in kilometers
         """
         
-        from math import radians, cos, sin, asin, sqrt
-        
         # Convert to radians
         lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
         
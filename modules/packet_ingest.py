@@ -0,0 +1,105 @@
+"""
+Packet Ingest Module
+Decouples the serial reader thread from data updates and broadcasts
+Applies received packets to the DataManager in batches on one worker thread
+"""
+
+import queue
+import threading
+import weakref
+from typing import Callable, Optional, Dict, Any, List
+
+import config
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class PacketIngest:
+    """
+    Single consumer for packets coming off the serial port
+
+    Features:
+    - Non-blocking submit for the reader thread
+    - Bursts applied as one DataManager batch and one broadcast
+    - Per-session signal queues notified after each batch
+    """
+
+    def __init__(
+        self,
+        data_manager,
+        on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        max_batch: int = config.PACKET_BATCH_SIZE
+    ):
+        """
+        Initialize the ingest queue and start its worker thread
+
+        Args:
+            data_manager: DataManager the packets are applied to
+            on_batch: Optional callback run with each applied batch
+            max_batch: Most packets taken from the queue at once
+        """
+        self.data_manager = data_manager
+        self.on_batch = on_batch
+        self.max_batch = max_batch
+
+        self.packets: queue.Queue = queue.Queue()
+
+        # Signal queues of the open browser sessions; dropped with the session
+        self._subscribers: weakref.WeakSet = weakref.WeakSet()
+        self._subscribers_lock = threading.Lock()
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, packet: Dict[str, Any]):
+        """
+        Queue a packet for the worker thread (never blocks)
+
+        Args:
+            packet: Parsed victim data packet
+        """
+        self.packets.put_nowait(packet)
+
+    def subscribe(self, signal_queue: queue.Queue):
+        """
+        Register a session queue to receive each applied batch
+
+        Args:
+            signal_queue: Bounded queue polled by the session's pages
+        """
+        with self._subscribers_lock:
+            self._subscribers.add(signal_queue)
+
+    def _run(self):
+        """
+        Worker loop (runs in background thread)
+        Waits for a packet, then takes whatever else is already queued
+        """
+
+        while True:
+            batch = [self.packets.get()]
+
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.packets.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.data_manager.add_or_update_victims(batch)
+
+                if self.on_batch:
+                    self.on_batch(batch)
+            except Exception:
+                logger.exception("Error applying packet batch")
+
+            with self._subscribers_lock:
+                subscribers = list(self._subscribers)
+
+            for signal_queue in subscribers:
+                try:
+                    signal_queue.put_nowait(batch)
+                except queue.Full:
+                    # Already behind by a full queue; a rerun is due either way
+                    pass
@@ -7,12 +7,16 @@ Reads and parses JSON packets from COM port
 import serial
 import serial.tools.list_ports
 import json
+import os
 import threading
 import time
 from typing import Callable, Optional, Dict, Any
 from datetime import datetime
 
 import config
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class SerialReader:
@@ -32,6 +36,9 @@ class SerialReader:
         self.is_reading: bool = False
         self.read_thread: Optional[threading.Thread] = None
         
+        # Set by the read thread once its first poll of the open port succeeds
+        self.ready = threading.Event()
+        
         # Callbacks
         self.on_packet_received: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
@@ -51,7 +58,8 @@ class SerialReader:
         port: str,
         baudrate: int,
         on_packet_received: Callable[[Dict[str, Any]], None],
-        on_error: Optional[Callable[[], None]] = None
+        on_error: Optional[Callable[[], None]] = None,
+        low_latency: bool = config.SERIAL_LOW_LATENCY
     ) -> bool:
         """
         Start reading from serial port in background thread
@@ -61,6 +69,7 @@ class SerialReader:
             baudrate: Baud rate (e.g., 115200)
             on_packet_received: Callback function for valid packets
             on_error: Optional callback for errors
+            low_latency: Put the port in low-latency mode after opening
             
         Returns:
             bool: True if connection successful, False otherwise
@@ -78,6 +87,9 @@ class SerialReader:
                 timeout=self.timeout
             )
             
+            if low_latency:
+                self.apply_low_latency(self.serial_port)
+            
             # Store configuration
             self.port_name = port
             self.baud_rate = baudrate
@@ -85,6 +97,7 @@ class SerialReader:
             self.on_error = on_error
             
             # Start reading thread
+            self.ready.clear()
             self.is_reading = True
             self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
             self.read_thread.start()
@@ -106,6 +119,7 @@ class SerialReader:
         
         print("Stopping serial reader...")
         self.is_reading = False
+        self.ready.clear()
         
         # Wait for thread to finish
         if self.read_thread and self.read_thread.is_alive():
@@ -129,7 +143,13 @@ class SerialReader:
             try:
                 if self.serial_port and self.serial_port.is_open:
                     # Check if data is available
-                    if self.serial_port.in_waiting > 0:
+                    in_waiting = self.serial_port.in_waiting
+                    
+                    # The port answered; let start-up waiters continue
+                    if not self.ready.is_set():
+                        self.ready.set()
+                    
+                    if in_waiting > 0:
                         # Read line from serial port
                         line = self.serial_port.readline()
                         
@@ -163,11 +183,11 @@ class SerialReader:
                         time.sleep(0.01)
                 else:
                     # Serial port not open
-                    print("Serial port not open, stopping reader")
+                    logger.warning("Serial port not open, stopping reader")
                     self.is_reading = False
 
             except serial.SerialException as e:
-                print(f"Serial error: {e}")
+                logger.error("Serial error: %s", e)
                 self.errors_encountered += 1
                 if self.on_error:
                     self.on_error()
@@ -175,8 +195,8 @@ class SerialReader:
                 # Try to reconnect after error
                 time.sleep(1)
                 
-            except Exception as e:
-                print(f"Unexpected error in read loop: {e}")
+            except Exception:
+                logger.exception("Unexpected error in read loop")
                 self.errors_encountered += 1
                 if self.on_error:
                     self.on_error()
@@ -211,7 +231,7 @@ class SerialReader:
             required_fields = ['ID', 'LAT', 'LON', 'TIME']
             
             if not all(field in packet for field in required_fields):
-                print(f"Packet missing required fields: {packet}")
+                logger.warning("Packet missing required fields: %s", packet)
                 return None
             
             # Validate data types
@@ -228,12 +248,12 @@ class SerialReader:
                     packet['RSSI'] = -999  # Default value for missing RSSI
                     
             except (ValueError, TypeError) as e:
-                print(f"Invalid data types in packet: {e}")
+                logger.warning("Invalid data types in packet: %s", e)
                 return None
             
             # Basic validation
             if not self._validate_packet(packet):
-                print(f"Packet failed validation: {packet}")
+                logger.warning("Packet failed validation: %s", packet)
                 return None
             
             return packet
@@ -241,8 +261,8 @@ class SerialReader:
         except json.JSONDecodeError as e:
             # Not a JSON line, ignore (Arduino debug messages)
             return None
-        except Exception as e:
-            print(f"Unexpected error parsing packet: {e}")
+        except Exception:
+            logger.exception("Unexpected error parsing packet")
             return None
     
     def _validate_packet(self, packet: Dict[str, Any]) -> bool:
@@ -294,6 +314,46 @@ class SerialReader:
         """Check if serial port is connected and reading"""
         return self.is_reading and self.serial_port and self.serial_port.is_open
     
+    @staticmethod
+    def apply_low_latency(serial_port: serial.Serial) -> bool:
+        """
+        Ask the driver of an open port to stop batching received bytes
+        
+        USB-serial adapters hold incoming data for up to their latency
+        timer (16 ms on FTDI) before passing it on. This sets the port's
+        ASYNC_LOW_LATENCY flag (what 'setserial low_latency' does) and, on
+        Linux, the FTDI latency_timer to 1 ms. Failures are not fatal; the
+        port keeps working at the driver default.
+        
+        Args:
+            serial_port: Open serial.Serial instance
+            
+        Returns:
+            bool: True if either setting was applied, False otherwise
+        """
+        
+        applied = False
+        
+        # POSIX pyserial only; Windows exposes no equivalent
+        try:
+            serial_port.set_low_latency_mode(True)
+            applied = True
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            logger.warning("Low-latency mode not available on %s: %s", serial_port.port, e)
+        
+        # FTDI adapters on Linux also expose their latency timer in sysfs
+        tty_name = os.path.basename(os.path.realpath(serial_port.port or ''))
+        timer_path = f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer"
+        if tty_name and os.path.exists(timer_path):
+            try:
+                with open(timer_path, 'w') as f:
+                    f.write('1')
+                applied = True
+            except OSError as e:
+                logger.warning("Could not set latency timer for %s: %s", tty_name, e)
+        
+        return applied
+    
     @staticmethod
     def list_available_ports() -> list:
         """
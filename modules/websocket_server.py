@@ -7,9 +7,11 @@ Replaces polling with push-based updates
 import asyncio
 import json
 import threading
-from typing import Set, Dict, Any, Callable
+from typing import Set, Dict, Any, Callable, List
 from datetime import datetime
 
+import config
+
 try:
     import websockets
     WEBSOCKETS_AVAILABLE = True
@@ -17,12 +19,52 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
 
 
+class ClientChannel:
+    """
+    One connected client with its own outgoing queue and relay task
+    
+    A slow client only backs up its own queue; once full, its oldest
+    message is dropped so the newest state always gets through.
+    """
+    
+    def __init__(self, websocket, maxsize: int = config.WS_CLIENT_QUEUE_SIZE):
+        """
+        Initialize the channel (must be created on the server's event loop)
+        
+        Args:
+            websocket: Client connection
+            maxsize: Most messages held for this client
+        """
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.task = asyncio.create_task(self._relay())
+    
+    def offer(self, message: str):
+        """Queue a message for this client without waiting (event loop thread only)"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+    
+    async def _relay(self):
+        """Send queued messages to the client in order until it disconnects"""
+        try:
+            while True:
+                message = await self.queue.get()
+                await self.websocket.send(message)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+    
+    def close(self):
+        """Stop the relay task"""
+        self.task.cancel()
+
+
 class WebSocketServer:
     """
     WebSocket server for broadcasting real-time victim data
     """
     
-    def __init__(self, host: str = "localhost", port: int = 8765):
+    def __init__(self, host: str = config.WEBSOCKET_HOST, port: int = config.WEBSOCKET_PORT):
         """
         Initialize WebSocket server
         
@@ -36,22 +78,33 @@ class WebSocketServer:
         self.server = None
         self.loop = None
         self.thread = None
+        
+        # True only while the socket is bound and serving
         self.running = False
+        self._started = threading.Event()
         
         if not WEBSOCKETS_AVAILABLE:
             print("[!] WebSockets not installed. Install with: pip install websockets")
     
     def start(self):
-        """Start the WebSocket server in background thread"""
+        """
+        Start the WebSocket server in background thread
+        
+        Returns:
+            bool: True once the server is listening, False if it could not bind
+        """
         if not WEBSOCKETS_AVAILABLE:
             print("[!] WebSockets library not available")
             return False
         
+        print(f"✓ WebSocket server starting on ws://{self.host}:{self.port}")
+        self._started.clear()
         self.thread = threading.Thread(target=self._run_server, daemon=True)
         self.thread.start()
-        self.running = True
-        print(f"✓ WebSocket server starting on ws://{self.host}:{self.port}")
-        return True
+        
+        # Set by the server thread once bound, or when it gives up
+        self._started.wait(timeout=config.WEBSOCKET_START_TIMEOUT)
+        return self.running
     
     def stop(self):
         """Stop the WebSocket server"""
@@ -70,19 +123,24 @@ class WebSocketServer:
         except Exception as e:
             print(f"[!] WebSocket server error: {e}")
         finally:
+            self.running = False
+            self._started.set()
             self.loop.close()
     
     async def _start_server(self):
         """Start listening for WebSocket connections"""
         async with websockets.serve(self._handle_connection, self.host, self.port):
+            self.running = True
+            self._started.set()
             print(f"✓ WebSocket server listening on ws://{self.host}:{self.port}")
             # Keep server running
             while self.running:
                 await asyncio.sleep(0.1)
     
-    async def _handle_connection(self, websocket, path):
-        """Handle new WebSocket connection"""
-        self.clients.add(websocket)
+    async def _handle_connection(self, websocket, path=None):
+        """Handle new WebSocket connection (websockets 13+ no longer passes path)"""
+        channel = ClientChannel(websocket)
+        self.clients.add(channel)
         print(f"✓ Client connected. Total: {len(self.clients)}")
         
         try:
@@ -92,7 +150,8 @@ class WebSocketServer:
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            self.clients.discard(websocket)
+            channel.close()
+            self.clients.discard(channel)
             print(f"✓ Client disconnected. Total: {len(self.clients)}")
     
     def broadcast(self, data: Dict[str, Any]):
@@ -112,38 +171,66 @@ class WebSocketServer:
             'timestamp': datetime.now().isoformat()
         })
         
-        # Send to all connected clients
+        self._publish(message)
+    
+    def broadcast_batch(self, packets: List[Dict[str, Any]]):
+        """
+        Broadcast several packets to all connected clients as one message
+        
+        Args:
+            packets: Packet data to broadcast, oldest first
+        """
+        if not self.running or not self.clients:
+            return
+        
+        # Prepare message
+        message = json.dumps({
+            'type': 'victim_batch',
+            'data': packets,
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        self._publish(message)
+    
+    def _publish(self, message: str):
+        """
+        Hand a message to every client's queue (callable from any thread)
+        
+        Only schedules the fan-out on the event loop, so the calling thread
+        never waits on a client's send.
+        """
         if self.loop and self.loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self._broadcast_to_clients(message),
-                self.loop
-            )
+            self.loop.call_soon_threadsafe(self._fan_out, message)
     
-    async def _broadcast_to_clients(self, message: str):
-        """Broadcast message to all connected clients"""
-        if self.clients:
-            await asyncio.gather(
-                *[client.send(message) for client in self.clients],
-                return_exceptions=True
-            )
+    def _fan_out(self, message: str):
+        """Queue a message for each connected client (event loop thread)"""
+        for channel in self.clients:
+            channel.offer(message)
 
 
 # Global WebSocket server instance
 ws_server = None
 
+# Guards creating and starting ws_server; every browser session calls in
+_ws_lock = threading.Lock()
+
 
 def get_websocket_server() -> WebSocketServer:
     """Get or create global WebSocket server"""
     global ws_server
-    if ws_server is None:
-        ws_server = WebSocketServer()
-    return ws_server
+    with _ws_lock:
+        if ws_server is None:
+            ws_server = WebSocketServer()
+        return ws_server
 
 
 def start_websocket_server() -> bool:
-    """Start the global WebSocket server"""
+    """Start the global WebSocket server (only the first call per process starts it)"""
     server = get_websocket_server()
-    return server.start()
+    with _ws_lock:
+        if server.running:
+            return True
+        return server.start()
 
 
 def stop_websocket_server():
@@ -153,6 +240,13 @@ def stop_websocket_server():
         ws_server.stop()
 
 
+def broadcast_packets(packets: List[Dict[str, Any]]):
+    """Broadcast a batch of packets to all WebSocket clients in one message"""
+    server = get_websocket_server()
+    if server.running:
+        server.broadcast_batch(packets)
+
+
 def broadcast_packet(packet: Dict[str, Any]):
     """Broadcast packet to all WebSocket clients"""
     server = get_websocket_server()
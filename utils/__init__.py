@@ -4,13 +4,21 @@ Utilities Package for Disaster Management System
 This package contains helper functions and validators:
 - helpers: Formatting, time conversion, color utilities
 - validators: Data validation functions
+- log: Rate-limited logging for background threads
 """
 
 from .helpers import (
     format_time_ago,
+    format_time_ago_batch,
     get_signal_color,
+    get_signal_color_batch,
     get_signal_indicator,
     calculate_priority,
+    calculate_priority_batch,
+    minutes_since_batch,
+    parse_timestamps_batch,
+    seconds_since_batch,
+    PRIORITY_LEVELS,
     format_coordinates,
     get_status_color
 )
@@ -25,9 +33,16 @@ from .validators import (
 __all__ = [
     # Helper functions
     'format_time_ago',
+    'format_time_ago_batch',
     'get_signal_color',
+    'get_signal_color_batch',
     'get_signal_indicator',
     'calculate_priority',
+    'calculate_priority_batch',
+    'minutes_since_batch',
+    'parse_timestamps_batch',
+    'seconds_since_batch',
+    'PRIORITY_LEVELS',
     'format_coordinates',
     'get_status_color',
     
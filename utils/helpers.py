@@ -5,9 +5,15 @@ Formatting, calculations, and conversions
 """
 
 from datetime import datetime
-from typing import Tuple, Dict, Any, Optional
+from math import radians, sin, cos, sqrt, atan2
+from typing import Tuple, Dict, Any, Optional, Sequence, List
+import numpy as np
+import pandas as pd
 import config
 
+# Priority levels in code order used by calculate_priority_batch()
+PRIORITY_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
 
 def format_time_ago(timestamp_str: str) -> str:
     """
@@ -96,6 +102,128 @@ def calculate_priority(victim_data: Dict[str, Any],
         return "LOW", "Stable"
 
 
+def parse_timestamps_batch(timestamps: Sequence[Optional[str]]) -> pd.Series:
+    """
+    Parse "YYYY-MM-DD HH:MM:SS" timestamps in one vectorized pass
+    
+    Args:
+        timestamps: Sequence of timestamp strings (None/invalid allowed); a
+                    datetime64 array is passed through without re-parsing
+        
+    Returns:
+        datetime64 Series, NaT where the timestamp could not be parsed
+    """
+    
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == 'M':
+        return pd.Series(timestamps, copy=False)
+    
+    return pd.to_datetime(pd.Series(timestamps, dtype=object), format="%Y-%m-%d %H:%M:%S", errors='coerce')
+
+
+def seconds_since_batch(timestamps: Sequence[Optional[str]], now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Seconds elapsed since each "YYYY-MM-DD HH:MM:SS" timestamp, in one vectorized pass
+    
+    Args:
+        timestamps: Sequence of timestamp strings (None/invalid allowed), or an
+                    already parsed datetime64 array (NaT for invalid)
+        now: Reference time (defaults to datetime.now())
+        
+    Returns:
+        float64 array of seconds, NaN where the timestamp could not be parsed
+    """
+    
+    parsed = parse_timestamps_batch(timestamps)
+    elapsed = pd.Timestamp(now or datetime.now()) - parsed
+    return elapsed.dt.total_seconds().to_numpy(dtype=np.float64)
+
+
+def minutes_since_batch(timestamps: Sequence[Optional[str]], now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Minutes elapsed since each "YYYY-MM-DD HH:MM:SS" timestamp, in one vectorized pass
+    
+    Args:
+        timestamps: Sequence of timestamp strings (None/invalid allowed)
+        now: Reference time (defaults to datetime.now())
+        
+    Returns:
+        float64 array of minutes, NaN where the timestamp could not be parsed
+    """
+    
+    return seconds_since_batch(timestamps, now) / 60
+
+
+def format_time_ago_batch(timestamps: Sequence[Optional[str]], now: Optional[datetime] = None) -> List[str]:
+    """
+    Vectorized format_time_ago() over many timestamps at once
+    
+    Args:
+        timestamps: Sequence of timestamp strings (None/invalid allowed)
+        now: Reference time (defaults to datetime.now())
+        
+    Returns:
+        List of human-readable time strings, same wording as format_time_ago()
+    """
+    
+    timestamps = pd.Series(timestamps, dtype=object)
+    seconds = seconds_since_batch(timestamps, now)
+    valid = ~np.isnan(seconds)
+    
+    # Truncate toward zero like int(); invalid entries get a placeholder 0
+    whole = np.where(valid, np.trunc(np.where(valid, seconds, 0)), 0).astype(np.int64)
+    
+    unit = np.searchsorted([60, 3600, 86400], whole, side='right')
+    count = whole // np.array([1, 60, 3600, 86400])[unit]
+    
+    text = (
+        pd.Series(count).astype(str)
+        + pd.Series(np.array([' second', ' minute', ' hour', ' day'])[unit])
+        + pd.Series(np.where(count != 1, 's ago', ' ago'))
+    ).to_numpy(dtype=object)
+    
+    text[whole < 0] = "Just now"
+    text[~valid] = "Invalid timestamp"
+    text[~timestamps.astype(bool).to_numpy()] = "Unknown"
+    
+    return text.tolist()
+
+
+def calculate_priority_batch(rssi: np.ndarray,
+                             last_update: Sequence[Optional[str]],
+                             rssi_strong_threshold: int = None,
+                             rssi_weak_threshold: int = None,
+                             time_critical_threshold: int = None,
+                             now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Vectorized calculate_priority() over many victims at once
+    
+    Args:
+        rssi: RSSI per victim
+        last_update: LAST_UPDATE timestamp string per victim, or the parsed datetime64 array
+        rssi_strong_threshold: Signal strong threshold (uses config default if None)
+        rssi_weak_threshold: Signal weak threshold (uses config default if None)
+        time_critical_threshold: Critical time threshold in minutes (uses config default if None)
+        now: Reference time (defaults to datetime.now())
+        
+    Returns:
+        uint8 array of indexes into PRIORITY_LEVELS (0 LOW, 1 MEDIUM, 2 HIGH)
+    """
+    
+    rssi_strong = rssi_strong_threshold if rssi_strong_threshold is not None else config.RSSI_STRONG_THRESHOLD
+    rssi_weak = rssi_weak_threshold if rssi_weak_threshold is not None else config.RSSI_WEAK_THRESHOLD
+    time_critical = time_critical_threshold if time_critical_threshold is not None else config.TIME_CRITICAL_THRESHOLD
+    
+    rssi = np.asarray(rssi)
+    
+    # Unparseable timestamps count as just updated, as in calculate_priority()
+    age = np.nan_to_num(minutes_since_batch(last_update, now), nan=0.0)
+    
+    high = (rssi < rssi_weak) | (age > time_critical)
+    medium = ~high & (rssi < rssi_strong)
+    
+    return (high.astype(np.uint8) * 2) | medium.astype(np.uint8)
+
+
 def get_signal_color(rssi: int, rssi_strong_threshold: int = None, rssi_weak_threshold: int = None) -> Tuple[str, str]:
     """
     Get color representation for signal strength
@@ -121,6 +249,33 @@ def get_signal_color(rssi: int, rssi_strong_threshold: int = None, rssi_weak_thr
         return "Weak", config.SIGNAL_COLORS['weak']
 
 
+def get_signal_color_batch(rssi: np.ndarray, rssi_strong_threshold: int = None, rssi_weak_threshold: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized get_signal_color() over many RSSI readings at once
+    
+    Args:
+        rssi: Signal strength per victim in dBm
+        rssi_strong_threshold: Strong signal threshold (uses config default if None)
+        rssi_weak_threshold: Weak signal threshold (uses config default if None)
+        
+    Returns:
+        Tuple of (label array, hex_color array)
+    """
+    
+    rssi_strong = rssi_strong_threshold if rssi_strong_threshold is not None else config.RSSI_STRONG_THRESHOLD
+    rssi_weak = rssi_weak_threshold if rssi_weak_threshold is not None else config.RSSI_WEAK_THRESHOLD
+    
+    rssi = np.asarray(rssi)
+    
+    # 0 Strong, 1 Medium, 2 Weak
+    level = np.where(rssi > rssi_strong, 0, np.where(rssi >= rssi_weak, 1, 2))
+    
+    labels = np.array(["Strong", "Medium", "Weak"], dtype=object)
+    colors = np.array([config.SIGNAL_COLORS['strong'], config.SIGNAL_COLORS['medium'], config.SIGNAL_COLORS['weak']], dtype=object)
+    
+    return labels[level], colors[level]
+
+
 def get_signal_indicator(rssi: int, rssi_strong_threshold: int = None, rssi_weak_threshold: int = None) -> str:
     """
     Get text indicator for signal strength (for non-UI contexts)
@@ -217,6 +372,22 @@ def format_duration(seconds: float) -> str:
         return f"{days}d {hours}h"
 
 
+def format_operation_time(start_time: datetime, now: Optional[datetime] = None) -> str:
+    """
+    Format time elapsed since the operation started as "Xh Ym"
+    
+    Args:
+        start_time: When the operation started
+        now: Reference time (defaults to the current time)
+        
+    Returns:
+        Formatted elapsed time string
+    """
+    
+    elapsed_min = int(((now or datetime.now()) - start_time).total_seconds() // 60)
+    return f"{elapsed_min // 60}h {elapsed_min % 60}m"
+
+
 def format_rssi_display(rssi: int) -> str:
     """
     Format RSSI value for display with label
@@ -247,8 +418,6 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         Distance in kilometers
     """
     
-    from math import radians, sin, cos, sqrt, atan2
-    
     # Earth's radius in kilometers
     R = 6371.0
     
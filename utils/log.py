@@ -0,0 +1,79 @@
+"""
+Logging Utilities
+Rate-limited logging for messages raised on background threads
+"""
+
+import logging
+import threading
+import time
+
+import config
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Pass at most max_per_second records, dropping the rest
+    
+    The first record let through after a dropped burst reports how many
+    were suppressed, so an error storm still leaves a trace.
+    """
+    
+    def __init__(self, max_per_second: int = config.LOG_RATE_LIMIT):
+        """
+        Initialize the filter
+        
+        Args:
+            max_per_second: Most records passed in any one-second window
+        """
+        super().__init__()
+        self.max_per_second = max_per_second
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._count = 0
+        self._suppressed = 0
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._count = 0
+            
+            self._count += 1
+            if self._count > self.max_per_second:
+                self._suppressed += 1
+                return False
+            
+            suppressed, self._suppressed = self._suppressed, 0
+        
+        if suppressed:
+            record.msg = f"({suppressed} similar messages suppressed) {record.msg}"
+        return True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a child of the application logger
+    
+    All children share one rate-limited stderr handler, so a burst from
+    any thread costs at most config.LOG_RATE_LIMIT writes per second.
+    
+    Args:
+        name: Logger name, usually the module's __name__
+        
+    Returns:
+        Logger writing through the shared handler
+    """
+    
+    root = logging.getLogger("falconresq")
+    
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        handler.addFilter(RateLimitFilter())
+        root.addHandler(handler)
+        root.setLevel(config.LOG_LEVEL.upper())
+        root.propagate = False
+    
+    return root.getChild(name)
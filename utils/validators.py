@@ -6,6 +6,7 @@ Validates packets, coordinates, and system inputs
 
 from typing import Dict, Any, Tuple, Optional, List
 import re
+from datetime import datetime
 import config
 
 
@@ -245,8 +246,6 @@ def validate_timestamp(timestamp_str: Any) -> Tuple[bool, Optional[str]]:
     if not isinstance(timestamp_str, str):
         return False, "Timestamp must be a string"
     
-    from datetime import datetime
-    
     try:
         datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
         return True, None